@@ -0,0 +1,78 @@
+# hismedi-app/bench/bench_dates.py
+# -*- coding: utf-8 -*-
+"""피드 날짜 정규화 벤치마크: dateutil(이전 방식) vs news.dates 빠른 경로.
+
+    python -m bench.bench_dates [--dates 50000] [--repeat 3]
+
+무작위 RFC 822 / ISO 8601 문자열(지역 약어, 2자리 연도, 잘못된 값 포함)에서 결과가 글자 단위로
+같은지 먼저 확인한 뒤, 메모 없이 / 메모 포함 처리 속도와 경로별 적중 수를 출력합니다.
+"""
+import argparse, random, warnings
+from datetime import timezone
+
+from dateutil import parser as dateparser
+
+from bench.timing import rate
+from news.dates import DateNormalizer
+
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+ZONES = ["GMT", "UTC", "UT", "Z", "+0000", "-0000", "+0900", "-0530", "EST", "KST"]
+OFFSETS = ["", "Z", "+09:00", "-05:30", "+00:00", "+0900"]
+
+
+def parse_dateutil(s: str) -> str:
+    """이전 구현(dateutil.parser.parse → tz 없으면 UTC → isoformat)."""
+    try:
+        dt = dateparser.parse(s)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.isoformat()
+    except Exception:
+        return ""
+
+
+def make_dates(n: int, seed: int = 7):
+    rnd = random.Random(seed)
+    out = []
+    for _ in range(n):
+        if rnd.random() < 0.5:
+            wd = rnd.choice(WEEKDAYS) + ", " if rnd.random() < 0.8 else ""
+            sec = ":%02d" % rnd.randint(0, 60) if rnd.random() < 0.8 else ""
+            out.append(f"{wd}{rnd.randint(1, 32):02d} {rnd.choice(MONTHS)} {rnd.choice([2024, 2025, 99])} "
+                       f"{rnd.randint(0, 24):02d}:{rnd.randint(0, 59):02d}{sec} {rnd.choice(ZONES)}")
+        else:
+            s = f"{rnd.choice([2024, 2025])}-{rnd.randint(1, 13):02d}-{rnd.randint(1, 31):02d}"
+            if rnd.random() < 0.8:
+                s += rnd.choice("T ") + f"{rnd.randint(0, 24):02d}:{rnd.randint(0, 59):02d}:{rnd.randint(0, 59):02d}"
+                if rnd.random() < 0.3:
+                    s += "." + str(rnd.randint(0, 999999))[:rnd.randint(1, 6)]
+                s += rnd.choice(OFFSETS)
+            out.append(s)
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--dates", type=int, default=50000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    warnings.simplefilter("ignore")  # dateutil의 알 수 없는 지역 약어 경고
+
+    dates = make_dates(args.dates)
+    norm = DateNormalizer()
+    mismatch = [d for d in dates if norm.normalize(d) != parse_dateutil(d)]
+    if mismatch:
+        raise SystemExit(f"날짜 결과 불일치 {len(mismatch)}건, 예: {mismatch[0]!r}")
+    print(f"identical output: {len(dates)} strings  {norm.stats()}")
+
+    before = rate(parse_dateutil, dates, args.repeat)
+    cold = rate(lambda d: DateNormalizer()._parse(d.strip()), dates, args.repeat)
+    warm = rate(norm.normalize, dates, args.repeat)
+    print(f"dateutil        : {before:,.0f} dates/s")
+    print(f"fast path       : {cold:,.0f} dates/s  (x{cold / before:.2f})")
+    print(f"fast path + memo: {warm:,.0f} dates/s  (x{warm / before:.2f})")
+
+
+if __name__ == "__main__":
+    main()
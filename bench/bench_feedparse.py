@@ -0,0 +1,73 @@
+# hismedi-app/bench/bench_feedparse.py
+# -*- coding: utf-8 -*-
+"""피드 파싱 벤치마크: feedparser(이전 방식) vs lxml 스트리밍 파서(news.feedparse).
+
+    python -m bench.bench_feedparse [--entries 200] [--limit 50] [--repeat 5]
+
+bench/fixtures/ 에 받아 둔 *.xml 피드와 합성 RSS 2.0 / Atom 피드를 대상으로,
+먼저 두 파서가 앞쪽 limit개 항목에서 같은 (제목, 링크, 날짜)를 내는지 확인한 뒤
+피드별 파싱 시간(최솟값)과 tracemalloc 최대 메모리를 출력합니다.
+tracemalloc은 파이썬 힙만 세므로 libxml2 내부 버퍼는 빠져 있습니다.
+"""
+import argparse, tracemalloc
+
+import feedparser
+
+from bench.fixtures import atom_feed, recorded_fixtures, rss_feed
+from bench.timing import best_ms
+from news.feedparse import FeedFallback, parse_entries
+from news.scraper import normalize_ws
+
+
+def _key(e) -> tuple:
+    return (normalize_ws(e.get("title", "")), e.get("link", ""), e.get("published") or e.get("updated") or "")
+
+
+def parse_feedparser(content: bytes, limit: int):
+    return feedparser.parse(content).get("entries", [])[:limit]
+
+
+def _peak_kb(fn, content: bytes, limit: int) -> float:
+    tracemalloc.start()
+    try:
+        fn(content, limit)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def corpus(entries: int) -> dict:
+    out = {name: body for name, body in recorded_fixtures().items() if name.endswith(".xml")}
+    out[f"synthetic_rss_{entries}"] = rss_feed(1, entries)
+    out[f"synthetic_atom_{entries}"] = atom_feed(2, entries)
+    out["synthetic_rss_30"] = rss_feed(3, 30)
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--entries", type=int, default=200)
+    ap.add_argument("--limit", type=int, default=50)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    print(f"{'feed':<24} {'KB':>7} {'feedparser ms':>14} {'stream ms':>10} {'x':>6} {'fp peak KB':>11} {'stream peak KB':>15}")
+    for name, body in corpus(args.entries).items():
+        try:
+            stream = parse_entries(body, args.limit)
+        except FeedFallback as e:
+            print(f"{name:<24} fallback to feedparser: {e}")
+            continue
+        expect = [_key(e) for e in parse_feedparser(body, args.limit)]
+        if [_key(e) for e in stream] != expect:
+            raise SystemExit(f"{name}: 항목 불일치")
+        before, _ = best_ms(lambda: parse_feedparser(body, args.limit), args.repeat)
+        after, _ = best_ms(lambda: parse_entries(body, args.limit), args.repeat)
+        print(
+            f"{name:<24} {len(body) / 1024:>7.1f} {before:>14.2f} {after:>10.2f} {before / after:>6.1f}"
+            f" {_peak_kb(parse_feedparser, body, args.limit):>11.0f} {_peak_kb(parse_entries, body, args.limit):>15.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# hismedi-app/bench/bench_news_load.py
+# -*- coding: utf-8 -*-
+"""news_app 시트 로딩 벤치마크: 전체 다시 읽기(get_all_records + 파싱) vs 증분 로더(news.sheetcache).
+
+    python -m bench.bench_news_load [--history 20000] [--new 20] [--rounds 5] [--latency 0.2]
+
+메모리 시트(bench.fake_sheets)에 history행을 채운 뒤, 라운드마다 new행을 덧붙이고 두 방식으로 새로 고칩니다.
+매 라운드 증분 로더의 프레임이 처음부터 다시 읽은 프레임과 같은지 확인하고,
+마지막에 행 삭제(보관 이동과 같은 모양) 뒤 전체 다시 읽기로 넘어가는지도 확인합니다.
+--latency는 API 호출 한 번의 왕복 시간을 흉내내며, 전송량 차이는 셀 수(fetched)로 따로 보여 줍니다.
+"""
+import argparse, time
+
+import pandas as pd
+
+from bench.fake_sheets import FakeSpreadsheet
+from bench.run_pipeline import history_rows
+from news.gsheet import NEWS_HEADERS
+from news.sheetcache import DeltaSheetLoader
+
+
+def to_kst(series: pd.Series) -> pd.Series:
+    # news_app._to_kst와 같음(news_app은 import하면 streamlit 페이지가 실행됨)
+    dt = pd.to_datetime(series, errors="coerce", utc=True)
+    return dt.dt.tz_convert("Asia/Seoul").dt.tz_localize(None)
+
+
+def with_kst(df: pd.DataFrame) -> pd.DataFrame:
+    df["발행"] = to_kst(df["published_at"])
+    return df
+
+
+def full_reload(ws) -> pd.DataFrame:
+    """이전 방식."""
+    return with_kst(pd.DataFrame(ws.get_all_records()))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--history", type=int, default=20000)
+    ap.add_argument("--new", type=int, default=20)
+    ap.add_argument("--rounds", type=int, default=5)
+    ap.add_argument("--latency", type=float, default=0.0)
+    args = ap.parse_args()
+
+    sh = FakeSpreadsheet()
+    ws = sh.add_worksheet("NEWS", rows=args.history + 10, cols=len(NEWS_HEADERS))
+    ws.append_rows([NEWS_HEADERS] + history_rows(args.history))
+    sh.latency_sec = args.latency
+    loader = DeltaSheetLoader(lambda: ws, parse=with_kst)
+    loader.refresh()
+
+    print(f"history={args.history} new/round={args.new} latency={args.latency}s")
+    print(f"{'round':>5} {'rows':>7} {'full ms':>9} {'delta ms':>9} {'x':>7} {'delta rows fetched':>19}")
+    for rnd in range(1, args.rounds + 1):
+        ws.append_rows(history_rows(args.new, seed=rnd))
+        t0 = time.perf_counter()
+        full = full_reload(ws)
+        t1 = time.perf_counter()
+        before = loader.stats["rows_fetched"]
+        delta = loader.refresh()
+        t2 = time.perf_counter()
+        fresh = DeltaSheetLoader(lambda: ws, parse=with_kst).refresh()
+        pd.testing.assert_frame_equal(delta, fresh)
+        if len(full) != len(delta) or list(full["title"].astype(str)) != list(delta["title"]):
+            raise SystemExit(f"round {rnd}: 행이 다릅니다")
+        print(f"{rnd:>5} {len(delta):>7} {(t1 - t0) * 1000:>9.1f} {(t2 - t1) * 1000:>9.1f}"
+              f" {(t1 - t0) / (t2 - t1):>7.1f} {loader.stats['rows_fetched'] - before:>19}")
+
+    ws.delete_rows(2, 11)
+    loads = loader.stats["full_loads"]
+    pd.testing.assert_frame_equal(loader.refresh(), DeltaSheetLoader(lambda: ws, parse=with_kst).refresh())
+    if loader.stats["full_loads"] != loads + 1:
+        raise SystemExit("행 삭제 뒤 전체 다시 읽기가 일어나지 않았습니다")
+    print(f"shrink → full reload ok, stats={loader.stats}")
+
+
+if __name__ == "__main__":
+    main()
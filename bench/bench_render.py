@@ -0,0 +1,72 @@
+# hismedi-app/bench/bench_render.py
+# -*- coding: utf-8 -*-
+"""news_app 표 렌더링 벤치마크: iterrows 전체 표(이전 방식) vs 열 단위 연산 + 페이지 / 간단히 보기(news.render).
+
+    python -m bench.bench_render [--rows 10000] [--repeat 5]
+
+먼저 전체 행을 새 방식으로 만든 HTML이 이전 방식과 글자 하나까지 같은지 확인한 뒤,
+방식별 서버 쪽 생성 시간(최솟값)과 브라우저로 보내는 페이로드 크기를 출력합니다.
+브라우저 렌더링 시간은 여기서 잴 수 없으므로 행 수(<tr>)로 대신 보여 줍니다.
+"""
+import argparse
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from bench.bench_search import make_frame
+from bench.timing import best_ms
+from news.render import COMPACT_ROWS, page_slice, table_html
+
+
+def legacy_html(df: pd.DataFrame, title_col: str, url_col: str) -> str:
+    """이전 news_app 코드 그대로."""
+    rows = []
+    for _, r in df.iterrows():
+        pub_str = r["발행"].strftime("%Y-%m-%d %H:%M")
+        src = str(r.get("source", "")).strip()
+        title = str(r.get(title_col, "")).strip()
+        url = str(r.get(url_col, "")).strip()
+        rows.append(
+            "<tr>"
+            f"<td>{pub_str}</td>"
+            f"<td>{src}</td>"
+            f"<td><a class='newslink' href='{url}' target='_blank' rel='noopener noreferrer'>{title}</a></td>"
+            "</tr>"
+        )
+    return (
+        "<div style='max-height:760px; overflow:auto; border:1px solid rgba(49,51,63,.14); border-radius:14px;'>"
+        "<table class='news'>"
+        "<thead><tr><th>발행</th><th>출처</th><th>제목</th></tr></thead>"
+        "<tbody>"
+        + "".join(rows)
+        + "</tbody></table></div>"
+    )
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=10000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    df = make_frame(args.rows)
+    df["발행"] = [datetime(2025, 6, 1) - timedelta(minutes=7 * i) for i in range(args.rows)]
+
+    cases = [
+        ("iterrows, all rows", lambda: legacy_html(df, "title", "url_canonical")),
+        ("vectorized, all rows", lambda: table_html(df, "title", "url_canonical")),
+        ("page 100", lambda: table_html(page_slice(df, 1, 100)[0], "title", "url_canonical")),
+        (f"compact {COMPACT_ROWS}", lambda: table_html(page_slice(df, 1, COMPACT_ROWS)[0], "title", "url_canonical",
+                                                      compact=True)),
+    ]
+    results = [(name, *best_ms(fn, args.repeat)) for name, fn in cases]
+    if results[0][2] != results[1][2]:
+        raise SystemExit("열 단위 HTML이 이전 방식과 다릅니다")
+    print(f"rows={args.rows}")
+    print(f"{'mode':<22} {'build ms':>9} {'payload KB':>11} {'<tr>':>6}")
+    for name, ms, html in results:
+        print(f"{name:<22} {ms:>9.2f} {len(html.encode('utf-8')) / 1024:>11.1f} {html.count('<tr>') - 1:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# hismedi-app/bench/bench_search.py
+# -*- coding: utf-8 -*-
+"""news_app 키워드 검색 벤치마크: str.contains 전체 스캔(이전 방식) vs 역색인(news.search).
+
+    python -m bench.bench_search [--rows 50000] [--repeat 3]
+
+합성 NEWS 행(한글/영문 제목, 출처, 태그)에 대해 여러 질의(한글 단어 일부, 영문, 공백 포함, 한 글자, 기호)를
+두 방식으로 찾아 결과 행이 같은지 확인하고, 질의당 시간(최솟값)을 출력합니다.
+색인 구축 시간과, 행을 덧붙인 뒤 sync()가 새 행만 색인하는 시간도 함께 봅니다.
+"""
+import argparse, random, time
+
+import pandas as pd
+
+from bench.timing import best_ms
+from news.search import SearchIndex
+
+WORDS = ["전공의", "간호사", "수가", "고용유지지원금", "의료개혁", "보건복지부", "고용노동부", "건강보험", "필수의료",
+         "AI", "Hospital", "nurse", "단체협약", "최저임금", "의대정원", "응급실", "비대면진료", "산업안전"]
+SOURCES = ["메디게이트", "청년의사", "데일리메디", "보건복지부-보도자료", "고용노동부-보도자료", "Google News"]
+TAGS = ["의료/의료정책", "노동/노사", "의료/병원경영", "노동/임금", ""]
+QUERIES = ["전공", "간호", "고용유지", "지원금", "ai", "hosp", "의료 개혁", "수가 ", "약", "-", "보도자료", "없는단어", "ur",
+           "의의의", "보건복지부-보도자료"]
+
+
+def make_frame(n: int, seed: int = 7) -> pd.DataFrame:
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(n):
+        title = " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(3, 7))) + f" {i}호"
+        rows.append({"title": title, "source": rnd.choice(SOURCES), "tags": rnd.choice(TAGS),
+                     "url_canonical": f"https://example.com/{seed}/{i}"})
+    return pd.DataFrame(rows)
+
+
+def scan(df: pd.DataFrame, kw: str) -> list:
+    """이전 news_app 필터(정규식 대신 글자 그대로 비교)."""
+    mask = pd.Series(False, index=df.index)
+    for c in ("title", "source", "tags"):
+        mask = mask | df[c].fillna("").astype(str).str.lower().str.contains(kw, regex=False)
+    return [i for i, m in enumerate(mask.tolist()) if m]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=50000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    df = make_frame(args.rows)
+    t0 = time.perf_counter()
+    index = SearchIndex().sync(df)
+    build = time.perf_counter() - t0
+    print(f"rows={args.rows} build={build * 1000:.0f}ms bigrams={len(index.grams)}")
+    print(f"{'query':<14} {'hits':>6} {'scan ms':>8} {'index ms':>9} {'x':>7}")
+    for q in QUERIES:
+        scan_ms, expect = best_ms(lambda: scan(df, q.strip().lower()), args.repeat)
+        index._memo.clear()
+        idx_ms, got = best_ms(lambda: (index._memo.clear(), index.search(q))[1], args.repeat)
+        if got != expect:
+            raise SystemExit(f"{q!r}: 결과가 다릅니다({len(got)} vs {len(expect)})")
+        print(f"{q!r:<14} {len(got):>6} {scan_ms:>8.2f} {idx_ms:>9.3f} {scan_ms / max(idx_ms, 1e-6):>7.0f}")
+
+    more = pd.concat([df, make_frame(200, seed=8)], ignore_index=True)
+    t0 = time.perf_counter()
+    index.sync(more)
+    print(f"sync +200 rows: {(time.perf_counter() - t0) * 1000:.1f}ms (rows={len(index)})")
+    if index.search("전공") != scan(more, "전공"):
+        raise SystemExit("증분 색인 결과가 다릅니다")
+    index.sync(more.iloc[100:].reset_index(drop=True))
+    if len(index) != len(more) - 100 or index.search("간호") != scan(more.iloc[100:].reset_index(drop=True), "간호"):
+        raise SystemExit("앞부분이 바뀐 프레임에서 재구성이 되지 않았습니다")
+    print("incremental sync / rebuild ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# hismedi-app/bench/bench_shards.py
+# -*- coding: utf-8 -*-
+"""프로세스 샤드 수집 벤치마크: collect_rss(workers=1) vs workers=N.
+
+    python -m bench.bench_shards [--feeds 64] [--entries 200] [--hosts 8] [--workers 1,2,4] [--parser feedparser]
+
+로컬 픽스처 서버 하나를 127.0.0.1 ~ 127.0.0.{hosts} 로 나눠 여러 호스트처럼 보이게 하고
+(샤드는 호스트 단위), RSS / Atom / 게시판 소스를 섞어 수집합니다.
+모든 workers 값에서 결과 항목이 순서까지 같은지 확인한 뒤 수집 시간과 workers=1 대비 배수를 출력합니다.
+파싱/태그가 CPU를 쓰는 부분이므로 --parser feedparser면 코어 수에 따른 차이가 더 잘 보입니다.
+"""
+import argparse, os, tempfile, time
+
+os.environ.setdefault("NEWS_STATE_DIR", tempfile.mkdtemp(prefix="bench_state_"))
+
+from bench.fixtures import atom_feed, board_html, rss_feed
+from bench.server import FixtureServer
+from news import scraper
+from news.sources import Source
+from news.telemetry import RunReport
+
+
+def register(srv: FixtureServer, feeds: int, entries: int, hosts: int):
+    port = srv.httpd.server_address[1]
+    sources = []
+    for i in range(feeds):
+        base = f"http://127.0.0.{1 + i % hosts}:{port}"
+        if i % 8 == 7:
+            for p in (1, 2):
+                srv.add(f"/board{i}/list?page={p}", board_html(p, 20, seed=i), "text/html; charset=utf-8")
+            sources.append(Source(f"board{i}", "board", f"{base}/board{i}/list", {
+                "page_url": f"{base}/board{i}/list?page={{page}}", "link_selector": "a[href]", "base": base + "/",
+                "pages": 2,
+            }))
+        elif i % 4 == 3:
+            sources.append(Source(f"atom{i}", "rss", srv.add(f"/atom{i}", atom_feed(i, entries)).replace(srv.base_url, base)))
+        else:
+            sources.append(Source(f"rss{i}", "rss", srv.add(f"/rss{i}", rss_feed(i, entries)).replace(srv.base_url, base)))
+    return sources
+
+
+def run(sources, workers: int):
+    report = RunReport()
+    t0 = time.perf_counter()
+    items = scraper.collect_rss(ua="bench", timeout_sec=10, retries=0, backoff_sec=0.1, gov_pages=1,
+                                sources=sources, report=report, workers=workers)
+    return items, time.perf_counter() - t0, report
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--feeds", type=int, default=64)
+    ap.add_argument("--entries", type=int, default=200)
+    ap.add_argument("--hosts", type=int, default=8)
+    ap.add_argument("--workers", default="1,2,4")
+    ap.add_argument("--parser", default="feedparser", choices=["stream", "feedparser"])
+    args = ap.parse_args()
+    scraper.DEFAULTS["feed_parser"] = args.parser
+    scraper.DEFAULTS["feed_max_entries"] = args.entries
+
+    with FixtureServer(host="0.0.0.0") as srv:
+        sources = register(srv, args.feeds, args.entries, args.hosts)
+        print(f"cpus={os.cpu_count()} feeds={args.feeds} entries={args.entries} hosts={args.hosts} parser={args.parser}")
+        base_items, base_sec = None, None
+        for w in [int(x) for x in args.workers.split(",")]:
+            items, sec, report = run(sources, w)
+            failed = [k for k, v in report.sources.items() if v["error"]]
+            if failed:
+                raise SystemExit(f"workers={w}: 실패한 소스 {failed[:3]}")
+            if base_items is None:
+                base_items, base_sec = items, sec
+            elif items != base_items:
+                raise SystemExit(f"workers={w}: 결과가 workers=1과 다릅니다")
+            parse = sum(v["parse_sec"] + v["tag_sec"] for v in report.sources.values())
+            print(f"workers={w:<3} items={len(items):<6} {sec:7.2f}s  x{base_sec / sec:5.2f}  (parse+tag cpu {parse:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
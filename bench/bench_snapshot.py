@@ -0,0 +1,80 @@
+# hismedi-app/bench/bench_snapshot.py
+# -*- coding: utf-8 -*-
+"""news_app 첫 로딩 벤치마크: 시트(get_all_records → DataFrame → KST 변환) vs Parquet 스냅샷(news.snapshot).
+
+    python -m bench.bench_snapshot [--rows 50000] [--days 7] [--repeat 5]
+
+메모리 시트에 rows행(10분 간격 발행시각, 출처 40개)을 채우고 같은 행으로 스냅샷을 만든 뒤,
+news_app이 하는 일(최근 days일 행을 '발행' 열과 함께 얻기)을 두 방식으로 재서 최솟값을 출력합니다.
+시트 쪽은 API 왕복 시간이 빠진 값이라 실제로는 더 느립니다.
+"""
+import argparse, os, tempfile
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+from bench.fake_sheets import FakeSpreadsheet
+from bench.run_pipeline import history_rows
+from bench.timing import best_ms
+from news import snapshot
+from news.gsheet import NEWS_HEADERS
+
+COLUMNS = ["published_at", "source", "title", "url", "url_canonical", "tags"]
+
+
+def to_kst(series: pd.Series) -> pd.Series:
+    # news_app._to_kst와 같음
+    dt = pd.to_datetime(series, errors="coerce", utc=True)
+    return dt.dt.tz_convert("Asia/Seoul").dt.tz_localize(None)
+
+
+def make_rows(n: int, end: datetime):
+    rows = history_rows(n)
+    for i, r in enumerate(rows):
+        r[0] = (end - timedelta(minutes=10 * (n - i))).isoformat()
+        r[1] = f"source{i % 40}"
+    return rows
+
+
+def from_sheet(ws, start: datetime):
+    df = pd.DataFrame(ws.get_all_records())
+    df["발행"] = to_kst(df["published_at"])
+    return df[df["발행"] >= start.astimezone(timezone(timedelta(hours=9))).replace(tzinfo=None)]
+
+
+def from_snapshot(loc: str, start: datetime, end: datetime):
+    df = snapshot.read(loc, COLUMNS, start, end)
+    df["source"] = df["source"].astype(object)
+    df["발행"] = to_kst(df["published_at"])
+    return df
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=50000)
+    ap.add_argument("--days", type=int, default=7)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    end = datetime(2025, 6, 1, tzinfo=timezone.utc)
+    start = end - timedelta(days=args.days)
+    rows = make_rows(args.rows, end)
+    sh = FakeSpreadsheet()
+    ws = sh.add_worksheet("NEWS", rows=args.rows + 10, cols=len(NEWS_HEADERS))
+    ws.append_rows([NEWS_HEADERS] + rows)
+    loc = os.path.join(tempfile.mkdtemp(prefix="bench_snapshot_"), snapshot.SNAPSHOT_FILE)
+    snapshot.publish(loc, (0, ""), [], (len(rows), rows[-1][4]), lambda: rows)
+
+    sheet_ms, a = best_ms(lambda: from_sheet(ws, start), args.repeat)
+    snap_ms, b = best_ms(lambda: from_snapshot(loc, start, end + timedelta(seconds=1)), args.repeat)
+    full_ms, _ = best_ms(lambda: from_snapshot(loc, None, None), args.repeat)
+    if sorted(a["url_canonical"]) != sorted(b["url_canonical"]):
+        raise SystemExit("시트와 스냅샷의 기간 결과가 다릅니다")
+    print(f"rows={args.rows} file={os.path.getsize(loc) / 1024:.0f}KB window={args.days}d ({len(b)} rows)")
+    print(f"sheet frame + parse     {sheet_ms:8.1f} ms")
+    print(f"snapshot, date filter   {snap_ms:8.1f} ms  x{sheet_ms / snap_ms:.1f}")
+    print(f"snapshot, all rows      {full_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
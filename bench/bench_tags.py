@@ -0,0 +1,65 @@
+# hismedi-app/bench/bench_tags.py
+# -*- coding: utf-8 -*-
+"""pick_tags 마이크로 벤치마크: 키워드별 부분문자열 스캔(이전 방식) vs Aho-Corasick.
+
+    python -m bench.bench_tags [--titles 20000] [--repeat 5]
+
+두 방식의 태그 결과가 모든 제목에서 같은지 먼저 확인한 뒤 초당 처리 제목 수를 출력합니다.
+"""
+import argparse, random
+
+from bench.timing import rate
+from news.config import KEYWORDS, NEGATIVE_HINTS
+from news.scraper import pick_tags
+
+
+def pick_tags_scan(text: str):
+    """이전 구현(태그별 any(k in t) + 제외 힌트 별도 스캔)."""
+    t = text or ""
+    if any(h in t for h in NEGATIVE_HINTS):
+        return []
+    tags = []
+    for tag, kws in KEYWORDS.items():
+        if any(k in t for k in kws):
+            tags.append(tag)
+    return tags
+
+
+FILLER = ["정부", "발표", "내년", "예산", "확대", "지역", "개편", "논의", "추진", "검토", "결과", "2025년", "AI", "시범사업"]
+
+
+def make_titles(n: int, seed: int = 7):
+    rnd = random.Random(seed)
+    vocab = [k for kws in KEYWORDS.values() for k in kws]
+    titles = []
+    for _ in range(n):
+        words = [rnd.choice(FILLER) for _ in range(rnd.randint(3, 9))]
+        for _ in range(rnd.randint(0, 3)):
+            words.insert(rnd.randrange(len(words) + 1), rnd.choice(vocab))
+        if rnd.random() < 0.05:
+            words.append(rnd.choice(NEGATIVE_HINTS))
+        # 단어 경계 없이 붙은 키워드도 섞습니다(부분문자열 의미 확인용)
+        titles.append(("" if rnd.random() < 0.2 else " ").join(words))
+    return titles
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--titles", type=int, default=20000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    titles = make_titles(args.titles)
+    mismatch = [t for t in titles if pick_tags(t) != pick_tags_scan(t)]
+    if mismatch:
+        raise SystemExit(f"태그 결과 불일치 {len(mismatch)}건, 예: {mismatch[0]!r}")
+    print(f"identical tags: {len(titles)} titles")
+
+    before = rate(pick_tags_scan, titles, args.repeat)
+    after = rate(pick_tags, titles, args.repeat)
+    print(f"substring scan : {before:,.0f} titles/s")
+    print(f"aho-corasick   : {after:,.0f} titles/s  (x{after / before:.2f})")
+
+
+if __name__ == "__main__":
+    main()
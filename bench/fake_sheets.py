@@ -0,0 +1,199 @@
+# hismedi-app/bench/fake_sheets.py
+# -*- coding: utf-8 -*-
+"""gspread 스프레드시트/워크시트의 메모리 스탠드인.
+
+news.gsheet / news.scraper / news_app이 쓰는 메서드만 구현합니다.
+calls 카운터로 Sheets API 호출 수를 셀 수 있고, latency_sec으로 호출당 지연을 흉내냅니다.
+"""
+import re, time
+from collections import Counter
+
+from gspread.utils import a1_to_rowcol
+
+_A1 = re.compile(r"^([A-Z]+)(\d*)(?::([A-Z]+)(\d*))?$")
+
+
+def _col_no(letters: str) -> int:
+    n = 0
+    for ch in letters:
+        n = n * 26 + ord(ch) - 64
+    return n
+
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet, title: str, rows: int = 1000, cols: int = 26):
+        self.spreadsheet = spreadsheet
+        self.id = id(self)
+        self.title = title
+        self.row_count = rows
+        self.col_count = cols
+        self._rows = []
+
+    # ---------- 내부 ----------
+    def _call(self, name: str):
+        self.spreadsheet.calls[name] += 1
+        if self.spreadsheet.latency_sec:
+            time.sleep(self.spreadsheet.latency_sec)
+
+    def _set(self, r: int, c: int, v):
+        while len(self._rows) < r:
+            self._rows.append([])
+        row = self._rows[r - 1]
+        while len(row) < c:
+            row.append("")
+        row[c - 1] = "" if v is None else str(v)
+
+    def _trimmed(self):
+        rows = [list(r) for r in self._rows]
+        while rows and not any(rows[-1]):
+            rows.pop()
+        return rows
+
+    def _range(self, a1: str):
+        m = _A1.match(a1.replace("$", ""))
+        if not m:
+            raise ValueError(f"unsupported range: {a1}")
+        c0, r0 = _col_no(m.group(1)), int(m.group(2) or 1)
+        c1 = _col_no(m.group(3)) if m.group(3) else c0
+        r1 = int(m.group(4)) if m.group(4) else (r0 if m.group(3) is None else max(len(self._rows), r0))
+        return r0, c0, r1, c1
+
+    # ---------- gspread API ----------
+    def get_all_values(self):
+        self._call("get_all_values")
+        width = max((len(r) for r in self._rows), default=0)
+        return [r + [""] * (width - len(r)) for r in self._trimmed()]
+
+    def get_all_records(self):
+        self._call("get_all_records")
+        rows = self._trimmed()
+        if not rows:
+            return []
+        head = rows[0]
+        return [{h: (r[i] if i < len(r) else "") for i, h in enumerate(head)} for r in rows[1:]]
+
+    def get(self, range_name: str):
+        self._call("get")
+        return self._values(range_name)
+
+    def _values(self, range_name: str):
+        r0, c0, r1, c1 = self._range(range_name)
+        out = []
+        for r in range(r0, min(r1, len(self._rows)) + 1):
+            row = self._rows[r - 1]
+            vals = [row[c - 1] if c - 1 < len(row) else "" for c in range(c0, c1 + 1)]
+            while vals and vals[-1] == "":
+                vals.pop()
+            out.append(vals)
+        while out and not out[-1]:
+            out.pop()
+        return out
+
+    def batch_get(self, ranges):
+        self._call("batch_get")
+        return [self._values(r) for r in ranges]
+
+    def row_values(self, row: int):
+        self._call("row_values")
+        r = self._rows[row - 1] if row <= len(self._rows) else []
+        r = list(r)
+        while r and r[-1] == "":
+            r.pop()
+        return r
+
+    def col_values(self, col: int):
+        self._call("col_values")
+        out = [r[col - 1] if col - 1 < len(r) else "" for r in self._rows]
+        while out and out[-1] == "":
+            out.pop()
+        return out
+
+    def append_row(self, values, value_input_option=None):
+        self.append_rows([values], value_input_option=value_input_option)
+
+    def append_rows(self, values, value_input_option=None):
+        self._call("append_rows")
+        start = len(self._trimmed()) + 1
+        for i, row in enumerate(values):
+            for j, v in enumerate(row):
+                self._set(start + i, j + 1, v)
+        self.row_count = max(self.row_count, start + len(values) - 1)
+
+    def update(self, values=None, range_name=None, value_input_option=None, **kw):
+        self._call("update")
+        if isinstance(values, str):  # 옛 호출 순서 update("B2", [[v]])
+            values, range_name = range_name, values
+        r0, c0 = a1_to_rowcol(range_name.split(":")[0])
+        if r0 + len(values) - 1 > self.row_count:
+            raise ValueError("range exceeds grid limits")
+        for i, row in enumerate(values):
+            for j, v in enumerate(row):
+                self._set(r0 + i, c0 + j, v)
+
+    def batch_update(self, data, value_input_option=None, **kw):
+        self._call("batch_update")
+        for d in data:
+            r0, c0 = a1_to_rowcol(d["range"].split(":")[0])
+            for i, row in enumerate(d["values"]):
+                for j, v in enumerate(row):
+                    self._set(r0 + i, c0 + j, v)
+
+    def add_rows(self, rows: int):
+        self._call("add_rows")
+        self.row_count += int(rows)
+
+    def delete_rows(self, start_index: int, end_index: int = None):
+        self._call("delete_rows")
+        end_index = end_index or start_index
+        del self._rows[start_index - 1:end_index]
+        self.row_count -= end_index - start_index + 1
+
+
+class FakeSpreadsheet:
+    def __init__(self, latency_sec: float = 0.0):
+        self.latency_sec = latency_sec
+        self.calls = Counter()
+        self._sheets = []
+
+    def worksheets(self):
+        self.calls["worksheets"] += 1
+        return list(self._sheets)
+
+    def worksheet(self, title: str):
+        self.calls["worksheet"] += 1
+        for ws in self._sheets:
+            if ws.title == title:
+                return ws
+        raise LookupError(title)  # gspread.WorksheetNotFound 대신(ensure_tabs는 Exception으로 잡음)
+
+    def get_worksheet(self, index: int):
+        self.calls["get_worksheet"] += 1
+        return self._sheets[index] if index < len(self._sheets) else None
+
+    def add_worksheet(self, title: str, rows: int = 1000, cols: int = 26, index: int = None):
+        self.calls["add_worksheet"] += 1
+        ws = FakeWorksheet(self, title, rows=rows, cols=cols)
+        if index is None:
+            self._sheets.append(ws)
+        else:
+            self._sheets.insert(index, ws)
+        return ws
+
+    def del_worksheet(self, ws):
+        self.calls["del_worksheet"] += 1
+        self._sheets.remove(ws)
+
+    def batch_update(self, body):
+        """deleteDimension(ROWS) 요청만 지원합니다."""
+        self.calls["spreadsheet_batch_update"] += 1
+        by_id = {ws.id: ws for ws in self._sheets}
+        for req in body.get("requests", []):
+            rng = req["deleteDimension"]["range"]
+            ws = by_id[rng["sheetId"]]
+            del ws._rows[rng["startIndex"]:rng["endIndex"]]
+            ws.row_count -= rng["endIndex"] - rng["startIndex"]
+        return {}
+
+    @property
+    def api_calls(self) -> int:
+        return sum(self.calls.values())
@@ -0,0 +1,94 @@
+# hismedi-app/bench/fixtures.py
+# -*- coding: utf-8 -*-
+"""벤치마크용 피드/게시판 픽스처.
+
+- bench/fixtures/ 아래에 실제로 받아 둔 파일(*.xml, *.html)이 있으면 그대로 재생합니다.
+- 없거나 규모를 키울 때는 실제 피드 모양(RSS 2.0 / Google News / Atom / 정부 게시판 표)을
+  본뜬 합성 문서를 만듭니다. 제목에는 KEYWORDS 키워드가 섞여 태그 필터를 통과합니다.
+"""
+import os, random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+from news.config import KEYWORDS, NEGATIVE_HINTS
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+FILLER = ["정부", "발표", "내년", "예산", "확대", "지역", "개편", "논의", "추진", "검토", "결과", "시범사업", "대책", "현장"]
+_VOCAB = [k for kws in KEYWORDS.values() for k in kws]
+
+
+def recorded_fixtures() -> dict:
+    """bench/fixtures/ 의 {파일 이름: bytes}."""
+    out = {}
+    if os.path.isdir(FIXTURE_DIR):
+        for name in sorted(os.listdir(FIXTURE_DIR)):
+            if name.endswith((".xml", ".html")):
+                with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+                    out[name] = f.read()
+    return out
+
+
+def make_title(rnd: random.Random, uid: str) -> str:
+    words = [rnd.choice(FILLER) for _ in range(rnd.randint(3, 7))]
+    for _ in range(rnd.randint(1, 3)):
+        words.insert(rnd.randrange(len(words) + 1), rnd.choice(_VOCAB))
+    if rnd.random() < 0.05:
+        words.append(rnd.choice(NEGATIVE_HINTS))
+    return " ".join(words) + f" {uid}"
+
+
+def _entries(feed_no: int, n: int, seed: int, now: datetime):
+    rnd = random.Random(seed * 1_000_003 + feed_no)
+    for i in range(n):
+        uid = f"f{feed_no}n{i}s{seed}"
+        yield (
+            make_title(rnd, uid),
+            f"https://news{feed_no % 7}.example.com/article/{uid}?utm_source=rss",
+            now - timedelta(minutes=17 * i + feed_no),
+        )
+
+
+def rss_feed(feed_no: int, n: int, seed: int = 0, now: datetime = None) -> bytes:
+    now = now or datetime(2025, 10, 6, 9, 0, tzinfo=timezone(timedelta(hours=9)))
+    items = "".join(
+        f"<item><title><![CDATA[{t}]]></title><link>{escape(u)}</link>"
+        f"<description><![CDATA[<p>{t}</p>]]></description>"
+        f"<pubDate>{format_datetime(d)}</pubDate><guid>{escape(u)}</guid></item>"
+        for t, u, d in _entries(feed_no, n, seed, now)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>bench feed {feed_no}</title><link>https://example.com/</link>{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+def atom_feed(feed_no: int, n: int, seed: int = 0, now: datetime = None) -> bytes:
+    now = now or datetime(2025, 10, 6, 0, 0, tzinfo=timezone.utc)
+    items = "".join(
+        f"<entry><title>{escape(t)}</title><link href=\"{escape(u)}\"/><id>{escape(u)}</id>"
+        f"<updated>{d.isoformat()}</updated></entry>"
+        for t, u, d in _entries(feed_no, n, seed, now)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        f"<title>bench atom {feed_no}</title>{items}</feed>"
+    ).encode("utf-8")
+
+
+def board_html(page: int, n: int = 10, seed: int = 0, view: str = "board.es?mid=a10503010100&bid=0027&act=view") -> bytes:
+    """정부 보도자료 목록 표(번호/제목/작성일)."""
+    rnd = random.Random(seed * 7919 + page)
+    rows = []
+    for i in range(n):
+        uid = f"p{page}n{i}s{seed}"
+        d = datetime(2025, 10, 6) - timedelta(days=(page - 1) * n + i)
+        rows.append(
+            f"<tr><td>{page * 100 - i}</td><td class='title'><a href='/{view}&list_no={uid}'>"
+            f"{escape(make_title(rnd, uid))}</a></td><td>{d:%Y.%m.%d}</td></tr>"
+        )
+    return (
+        "<html><body><table><thead><tr><th>번호</th><th>제목</th><th>등록일</th></tr></thead>"
+        f"<tbody>{''.join(rows)}</tbody></table></body></html>"
+    ).encode("utf-8")
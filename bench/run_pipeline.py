@@ -0,0 +1,144 @@
+# hismedi-app/bench/run_pipeline.py
+# -*- coding: utf-8 -*-
+"""news.scraper 오프라인 종단 벤치마크.
+
+로컬 HTTP 스탠드인(bench.server) + 메모리 시트(bench.fake_sheets)로 main()을 그대로 돌리고,
+피드 수 / 피드당 항목 수 / NEWS 이력 행 수를 바꿔 가며 단계별 시간을 비교합니다.
+
+    python -m bench.run_pipeline
+    python -m bench.run_pipeline --feeds 4 16 64 --entries 50 --history 0 20000 --slow 2 --failing 1
+    python -m bench.run_pipeline --json bench_output.json
+
+각 시나리오는 cold(인덱스 없음 → reconcile) 한 번, warm(같은 상태로 새 항목) 한 번 실행합니다.
+"""
+import argparse, json, os, tempfile, time
+
+import news.scraper as scraper
+from news.gsheet import NEWS_HEADERS
+
+from bench.fake_sheets import FakeSpreadsheet
+from bench.fixtures import recorded_fixtures, rss_feed, atom_feed, board_html
+from bench.server import FixtureServer
+from news.sources import Source
+
+STAGES = ("reconcile", "fetch", "parse", "tag", "simhash", "dedupe", "write")
+
+
+def history_rows(n: int, seed: int = 99):
+    """NEWS 이력 행(실제 해시 함수로 채움)."""
+    feed_no = 10_000 + seed
+    titles, urls = [], []
+    for i in range(n):
+        titles.append(f"과거 기사 {i} 전공의 수가 병원 {seed}")
+        urls.append(f"https://old.example.com/a/{seed}/{i}")
+    sims = scraper.simhash64_batch(titles)
+    return [
+        ["2025-01-01T00:00:00+00:00", f"hist{feed_no}", t, u, u, "의료/의료정책",
+         scraper.sha256_hex(scraper.normalize_ws(t).lower()), s, ""]
+        for t, u, s in zip(titles, urls, sims)
+    ]
+
+
+def make_sheet(history: int, latency_sec: float) -> FakeSpreadsheet:
+    sh = FakeSpreadsheet(latency_sec=latency_sec)
+    news = sh.add_worksheet("NEWS", rows=max(2000, history + 10), cols=20)
+    news.append_rows([NEWS_HEADERS] + history_rows(history))
+    meta = sh.add_worksheet("META", rows=200, cols=5)
+    # 고정 날짜의 히스토리가 보관 단계로 빠지지 않도록 보관은 끕니다(기본값도 0이지만 명시).
+    meta.append_rows([["key", "value"], ["gov_pages", "2"], ["fetch_timeout_sec", "5"], ["archive_keep_days", "0"]])
+    sh.calls.clear()
+    return sh
+
+
+def register_feeds(srv: FixtureServer, feeds: int, entries: int, seed: int, slow: int, failing: int, slow_sec: float):
+    """[(source_name, url) 또는 Source]. 일부는 느린/실패 응답, 하나는 Atom, 합성 게시판 1개,
+    녹화 픽스처가 있으면 함께 재생(*.html은 게시판 소스로)."""
+    sources = []
+    for i in range(feeds):
+        body = atom_feed(i, entries, seed) if i % 5 == 4 else rss_feed(i, entries, seed)
+        url = srv.add(f"/feed/{i}", body)
+        if i < slow:
+            url += f"?delay={slow_sec}"
+        elif i < slow + failing:
+            url += "?status=503"
+        sources.append((f"bench{i}", url))
+    # 정부 보도자료 게시판 경로(crawl_board): 목록 페이지 2장
+    for page in (1, 2):
+        srv.add(f"/board/list/{page}", board_html(page, entries, seed), "text/html; charset=utf-8")
+    sources.append(_board_source("bench-board", srv.base_url + "/board/list/{page}", srv.base_url, pages=2))
+    for name, body in recorded_fixtures().items():
+        if name.endswith(".html"):
+            url = srv.add(f"/recorded/{name}", body, "text/html; charset=utf-8")
+            sources.append(_board_source(f"rec:{name}", url, srv.base_url, pages=1))
+        else:
+            sources.append((f"rec:{name}", srv.add(f"/recorded/{name}", body)))
+    return sources
+
+
+def _board_source(name: str, page_url: str, base: str, pages: int) -> Source:
+    return Source(name, "board", page_url, {
+        "page_url": page_url, "link_selector": "a[href]", "base": base + "/", "pages": pages,
+    })
+
+
+def run_scenario(feeds: int, entries: int, history: int, slow: int = 0, failing: int = 0,
+                 slow_sec: float = 1.0, latency_sec: float = 0.0):
+    out = {"feeds": feeds, "entries": entries, "history": history, "runs": []}
+    sh = make_sheet(history, latency_sec)
+    with tempfile.TemporaryDirectory() as state, FixtureServer() as srv:
+        os.environ["NEWS_STATE_DIR"] = state
+        for phase, seed in (("cold", 1), ("warm", 2)):
+            # warm 실행은 새 항목이 생긴 피드를 흉내냅니다(같은 경로, 다른 본문).
+            srv.routes.clear()
+            sources = register_feeds(srv, feeds, entries, seed, slow, failing, slow_sec)
+            sh.calls.clear()
+            t0 = time.perf_counter()
+            report = scraper.main(sh=sh, sources=sources)
+            total = time.perf_counter() - t0
+            d = report.to_dict()
+            out["runs"].append({
+                "phase": phase,
+                "total_sec": round(total, 3),
+                "stages": {k: d["stages"].get(k, 0.0) for k in STAGES},
+                "inserted": d["totals"]["inserted"],
+                "entries": d["totals"]["entries"],
+                "sheet_calls": sh.api_calls,
+            })
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(prog="python -m bench.run_pipeline")
+    ap.add_argument("--feeds", type=int, nargs="+", default=[4, 16, 64])
+    ap.add_argument("--entries", type=int, nargs="+", default=[20, 50])
+    ap.add_argument("--history", type=int, nargs="+", default=[0, 10000, 50000])
+    ap.add_argument("--slow", type=int, default=1, help="느린 피드 수")
+    ap.add_argument("--slow-sec", type=float, default=1.0)
+    ap.add_argument("--failing", type=int, default=1, help="항상 503인 피드 수")
+    ap.add_argument("--sheet-latency", type=float, default=0.0, help="Sheets API 호출당 지연(초)")
+    ap.add_argument("--json", help="결과를 JSON 파일로 저장")
+    args = ap.parse_args()
+
+    # 벤치마크에서는 재시도 대기 없이 실패를 바로 확인합니다.
+    scraper.DEFAULTS["http_retries"] = 0
+
+    head = f"{'feeds':>5} {'entries':>7} {'history':>7} {'phase':>5} {'total':>7} " + \
+        " ".join(f"{s:>9}" for s in STAGES) + f" {'inserted':>8} {'calls':>5}"
+    print(head)
+    results = []
+    for history in args.history:
+        for feeds in args.feeds:
+            for entries in args.entries:
+                r = run_scenario(feeds, entries, history, args.slow, args.failing, args.slow_sec, args.sheet_latency)
+                results.append(r)
+                for run in r["runs"]:
+                    print(f"{feeds:>5} {entries:>7} {history:>7} {run['phase']:>5} {run['total_sec']:>7.3f} "
+                          + " ".join(f"{run['stages'][s]:>9.3f}" for s in STAGES)
+                          + f" {run['inserted']:>8} {run['sheet_calls']:>5}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# hismedi-app/bench/server.py
+# -*- coding: utf-8 -*-
+"""로컬 HTTP 스탠드인(실제 정부/Google News 서버 대신).
+
+등록한 경로의 본문을 그대로 돌려주며, 쿼리로 느린/실패 응답을 흉내냅니다.
+    ?delay=1.5   응답 전 1.5초 대기
+    ?status=503  항상 503(Retry-After: 0)
+    ?fail=2      처음 2번은 503, 그 뒤 정상
+ETag를 붙여 주므로 조건부 GET(304)도 확인할 수 있습니다.
+"""
+import hashlib, threading, time
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+
+class FixtureServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.routes = {}   # path -> (bytes, content_type)
+        self.hits = Counter()
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add(self, path: str, body: bytes, content_type: str = "application/rss+xml; charset=utf-8") -> str:
+        self.routes[path] = (body, content_type)
+        return self.base_url + path
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _reply(self, h, status: int, body: bytes = b"", headers=None):
+        h.send_response(status)
+        for k, v in (headers or {}).items():
+            h.send_header(k, v)
+        h.send_header("Content-Length", str(len(body)))
+        h.end_headers()
+        if body:
+            h.wfile.write(body)
+
+    def _handle(self, h):
+        u = urlsplit(h.path)
+        q = {k: v[-1] for k, v in parse_qs(u.query).items()}
+        key = u.path if u.path in self.routes else h.path
+        with self._lock:
+            self.hits[key] += 1
+            n = self.hits[key]
+        if "delay" in q:
+            time.sleep(float(q["delay"]))
+        if "status" in q:
+            return self._reply(h, int(q["status"]), headers={"Retry-After": "0"})
+        if n <= int(q.get("fail", 0)):
+            return self._reply(h, 503, headers={"Retry-After": "0"})
+        route = self.routes.get(u.path) or self.routes.get(h.path)
+        if route is None:
+            return self._reply(h, 404)
+        body, ctype = route
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if h.headers.get("If-None-Match") == etag:
+            return self._reply(h, 304, headers={"ETag": etag})
+        self._reply(h, 200, body, {"Content-Type": ctype, "ETag": etag})
@@ -0,0 +1,20 @@
+# hismedi-app/bench/timing.py
+# -*- coding: utf-8 -*-
+"""bench 스크립트 공용 시간 측정(repeat번 중 가장 빠른 값)."""
+import time
+
+
+def best_ms(fn, repeat: int):
+    """fn()을 repeat번 실행한 최소 시간(ms)과 마지막 반환값."""
+    best, out = float("inf"), None
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000, out
+
+
+def rate(fn, items, repeat: int) -> float:
+    """items 하나씩 fn을 부를 때 초당 처리 수(가장 빠른 회차 기준)."""
+    ms, _ = best_ms(lambda: [fn(x) for x in items], repeat)
+    return len(items) / (ms / 1000)
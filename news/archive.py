@@ -0,0 +1,165 @@
+# hismedi-app/news/archive.py
+# -*- coding: utf-8 -*-
+"""NEWS 탭 월별 보관(archive).
+
+- published_at이 보관 기준(archive_keep_days)보다 오래된 행을 월별 탭 NEWS_YYYY-MM으로 옮기고
+  NEWS에서는 지웁니다. NEWS는 항상 최근 기간만 남아 읽는 쪽(스크래퍼/앱)이 느려지지 않습니다.
+- 보관 탭은 같은 스프레드시트 끝에 만들고(NEWS는 계속 0번 탭),
+  GSHEET_ARCHIVE_ID가 있으면 그 스프레드시트에 만듭니다.
+- 보관 목록(탭별 행 수/기간)은 META news_archive에 JSON으로 남깁니다.
+  기간(from/to)은 published_at을 시각으로 비교해 UTC ISO 문자열로 적습니다(행마다 오프셋이 달라도 순서가 맞도록).
+- 순서: 보관 탭 기록 → NEWS 행 삭제(batch_update 1회) → 로컬 인덱스 갱신.
+  중간에 실패해도 보관 탭에 이미 있는 url_canonical은 다시 붙이지 않으므로 재실행하면 이어서 끝납니다.
+- published_at이 비어 있거나 읽을 수 없는 행은 옮기지 않습니다.
+- 기본은 꺼져 있습니다(DEFAULTS archive_keep_days 0, META에서 켬). news_app은 보관 탭을 읽지 않으므로
+  켜면 보관 기준보다 오래된 기사는 앱에서 보이지 않습니다.
+"""
+import json, os
+from datetime import datetime, timedelta, timezone
+
+from news.config import DEFAULTS
+from news.gsheet import NEWS_HEADERS, SheetWriter, _client
+from news.indexstore import COL_URL_CANONICAL
+
+ARCHIVE_PREFIX = "NEWS_"
+CATALOG_KEY = "news_archive"
+
+
+def _utc(published_at: str):
+    """ISO 문자열 → UTC datetime(tz 없으면 UTC로 봄). 읽을 수 없으면 None."""
+    try:
+        dt = datetime.fromisoformat(published_at)
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _month(published_at: str, cutoff: datetime) -> str:
+    """보관 대상이면 'YYYY-MM'(UTC), 아니면 ''."""
+    dt = _utc(published_at)
+    return dt.strftime("%Y-%m") if dt is not None and dt < cutoff else ""
+
+
+def archive_book(sh):
+    """보관 탭을 둘 스프레드시트(GSHEET_ARCHIVE_ID가 없으면 같은 스프레드시트)."""
+    archive_id = os.getenv("GSHEET_ARCHIVE_ID", "").strip()
+    return _client().open_by_key(archive_id) if archive_id else sh
+
+
+def load_catalog(meta) -> dict:
+    try:
+        return json.loads(meta.get(CATALOG_KEY) or "{}")
+    except ValueError:
+        return {}
+
+
+def archive_tabs(book, catalog: dict):
+    """보관 목록에 있는 탭들 [(title, worksheet)] (없어진 탭은 건너뜀)."""
+    out = []
+    for title in sorted(catalog):
+        try:
+            out.append((title, book.worksheet(title)))
+        except Exception:
+            continue
+    return out
+
+
+def _archive_ws(book, title: str, n_rows: int):
+    try:
+        return book.worksheet(title)
+    except Exception:
+        ws = book.add_worksheet(title=title, rows=n_rows + 1, cols=max(20, len(NEWS_HEADERS) + 5))
+        ws.append_row(NEWS_HEADERS, value_input_option="RAW")
+        return ws
+
+
+def _row_ranges(row_nos):
+    """1-based 행 번호들 → 연속 구간 [(start0, end0_exclusive)], 아래쪽부터(삭제해도 위 번호가 안 밀리게)."""
+    ranges = []
+    for r in sorted(row_nos):
+        if ranges and ranges[-1][1] == r - 1:
+            ranges[-1][1] = r
+        else:
+            ranges.append([r, r])
+    return [(a - 1, b) for a, b in reversed(ranges)]
+
+
+def archive_news(sh, ws_news, meta, index, keep_days: int, now: datetime = None, book=None) -> int:
+    """오래된 행을 월별 탭으로 옮기고 옮긴 행 수를 돌려줍니다(0 = 할 일 없음)."""
+    now = now or datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=int(keep_days))
+
+    # 날짜 열만 먼저 읽어 옮길 행이 있을 때만 전체를 읽습니다.
+    dates = ws_news.col_values(1)[1:]
+    if not any(_month(d, cutoff) for d in dates):
+        return 0
+    values = ws_news.get_all_values()
+    body = values[1:]
+
+    by_month, moved_rows, keep = {}, [], []
+    width = len(NEWS_HEADERS)
+    for i, row in enumerate(body, start=2):
+        month = _month(row[0] if row else "", cutoff)
+        if month:
+            by_month.setdefault(month, []).append((list(row) + [""] * width)[:width])
+            moved_rows.append(i)
+        else:
+            keep.append(row)
+
+    # 1) 보관 탭 기록(이미 옮겨진 url_canonical은 건너뜀)
+    book = book or archive_book(sh)
+    catalog = load_catalog(meta)
+    for month, rows in sorted(by_month.items()):
+        title = ARCHIVE_PREFIX + month
+        ws = _archive_ws(book, title, len(rows))
+        existing = ws.col_values(COL_URL_CANONICAL + 1)
+        seen = set(existing[1:])
+        writer = SheetWriter(
+            ws, start_row=max(1, len(existing)) + 1,
+            chunk_rows=int(DEFAULTS.get("write_chunk_rows", 500)),
+            max_retries=int(DEFAULTS.get("write_retries", 5)),
+        )
+        for row in rows:
+            if row[COL_URL_CANONICAL] and row[COL_URL_CANONICAL] in seen:
+                continue
+            seen.add(row[COL_URL_CANONICAL])
+            writer.add(row)
+        writer.close()
+        prev = catalog.get(title, {})
+        # 예전 목록의 from/to(원래 오프셋 그대로일 수 있음)도 함께 시각으로 비교합니다.
+        dts = [dt for dt in map(_utc, [r[0] for r in rows] + [prev.get("from"), prev.get("to")]) if dt is not None]
+        catalog[title] = {
+            "rows": max(1, len(existing)) - 1 + writer.rows_written,
+            "from": min(dts).isoformat(),
+            "to": max(dts).isoformat(),
+            "book": "" if book is sh else getattr(book, "id", ""),
+        }
+
+    # 2) NEWS에서 삭제(구간별 deleteDimension을 한 번에)
+    sh.batch_update({"requests": [
+        {"deleteDimension": {"range": {"sheetId": ws_news.id, "dimension": "ROWS", "startIndex": a, "endIndex": b}}}
+        for a, b in _row_ranges(moved_rows)
+    ]})
+
+    # 3) 로컬 인덱스: 옮긴 행은 보관 키로, NEWS 부분은 남은 행으로 다시 만듦
+    index.add_archived([r for rows in by_month.values() for r in rows])
+    index.set_archived_rows(sum(v.get("rows", 0) for v in catalog.values()))
+    index.rebuild(keep)
+
+    meta.set(CATALOG_KEY, json.dumps(catalog, ensure_ascii=False, sort_keys=True))
+    meta.set("last_archive_at", now.isoformat())
+    meta.set("last_archive_rows", str(len(moved_rows)))
+    return len(moved_rows)
+
+
+def archive_due(meta, every_hours: float, now: datetime = None) -> bool:
+    now = now or datetime.now(timezone.utc)
+    last = meta.get("last_archive_at")
+    if not last:
+        return True
+    try:
+        return now - datetime.fromisoformat(last) >= timedelta(hours=float(every_hours))
+    except ValueError:
+        return True
@@ -59,14 +59,46 @@ RSS_SOURCES = [
     ("라포르시안(G)", "https://news.google.com/rss/search?q=source:라포르시안+when:7d&hl=ko&gl=KR&ceid=KR:ko"), 
 ]
 
+# ----------------------------
+# HTML 게시판 소스(news.sources "board" 파서)
+# - 키는 소스 url로 쓰는 토큰입니다. RSS_SOURCES나 SOURCES 탭에 ("이름", "HTML:mohw")처럼 넣으면 수집합니다.
+# - page_url의 {page}에 1..gov_pages가 들어가고, item_name은 항목의 source 이름입니다.
+# ----------------------------
+BOARD_SOURCES = {
+    "HTML:mohw": {
+        "item_name": "보건복지부-보도자료",
+        "page_url": "https://www.mohw.go.kr/board.es?mid=a10503010100&bid=0027&nPage={page}",
+        "link_selector": "a[href]",
+        "base": "https://www.mohw.go.kr/",
+    },
+    "HTML:moel": {
+        "item_name": "고용노동부-보도자료",
+        "page_url": "https://www.moel.go.kr/news/enews/report/enewsList.do?pageIndex={page}",
+        "link_selector": 'a[href*="enewsView.do"]',
+        "base": "https://www.moel.go.kr/",
+    },
+}
+
+# 같은 피드 URL이 여러 이름으로 등록된 경우 한 번만 받고, 항목의 source 이름은 이 규칙으로 정합니다.
+# - "first": RSS_SOURCES에서 먼저 나온 이름 / "last": 나중 이름 / "shortest": 가장 짧은 이름(예: "(G)" 없는 쪽)
+FEED_LABEL_RULE = "first"
+
+# ----------------------------
+# 호스트별 커넥션 풀 크기(없으면 DEFAULTS["fetch_per_host"])
+# - 같은 호스트에 피드가 몰려 있으면 keep-alive 연결을 더 둡니다.
+# ----------------------------
+HTTP_POOL_SIZES = {
+    "news.google.com": 4,
+}
+
 # ----------------------------
 # 기본 설정
 # ----------------------------
 DEFAULTS = {
     "max_hamming": 6,
-    "recent_sim_n": 800,
     "fetch_timeout_sec": 10,
-    # HTML 크롤링 페이지 수(1페이지=최신 약 10~20건)
+    # HTML 크롤링 최대 페이지 수(1페이지=최신 약 10~20건)
+    # 지난 실행에서 본 글이 나오면 그 페이지에서 멈추므로, 밀린 글을 따라잡을 만큼 크게 둬도 됩니다.
     "gov_pages": 1,
     "rss_enabled": True,
     # 일부 환경에서 RSS가 403/리다이렉트 나는 것을 줄이기 위해 UA는 꼭 씁니다.
@@ -74,4 +106,51 @@ DEFAULTS = {
     # requests 재시도/백오프(스크래퍼에서 사용)
     "http_retries": 2,
     "http_backoff_sec": 1.2,
+    # 동시 수집: 전체 동시 요청 상한 / 호스트별 동시 요청 상한
+    "fetch_concurrency": 8,
+    "fetch_per_host": 2,
+    # 커넥션 풀을 유지할 호스트 수(초과분은 오래된 풀부터 정리)
+    "http_pool_hosts": 32,
+    # NEWS 기록: 청크당 최대 행 수 / 429·5xx 재시도 횟수
+    "write_chunk_rows": 500,
+    "write_retries": 5,
+    # 고수위: 지난 실행의 최신 발행시각보다 이 시간 이상 오래된 글은 건너뜀(늦게 색인된 글 여유)
+    "watermark_grace_hours": 6,
+    # 보관: published_at이 이 일수보다 오래된 행은 월별 탭(NEWS_YYYY-MM)으로 옮김(0 = 끔, 기본), 확인 주기(시간)
+    # 켜면 옮긴 행은 NEWS와 스냅샷에서 빠지므로 news_app에서도 그 기간이 보이지 않습니다. META에서만 켜세요.
+    "archive_keep_days": 0,
+    "archive_every_hours": 24,
+    # NEWS 저장소: "sheets" / "postgres" / "postgres+sheets"(NEWS 탭 미러), 환경변수 NEWS_STORAGE가 우선
+    "news_storage": "sheets",
+    "pg_copy_rows": 5000,
+    # Parquet 스냅샷(news_app용): 위치(""= 상태 폴더의 news.parquet, "off"= 끔, gs:// 등 URI 가능), 행 그룹 크기
+    # 환경변수 NEWS_SNAPSHOT이 우선
+    "news_snapshot": "",
+    "snapshot_row_group_rows": 5000,
+    # 수집 프로세스 수(1 = 한 프로세스 안에서 스레드로만). 2 이상이면 호스트 단위로 나눠 프로세스별로 수집
+    "shard_workers": 1,
+    # SOURCES 탭이 없을 때 다시 확인하기까지(초). 그 사이에는 탭을 찾지 않습니다(Sheets 호출 절약)
+    "sources_tab_recheck_sec": 3600,
+    # 피드 파서: "stream"(lxml iterparse, 처리 못 하는 문서는 feedparser로) / "feedparser"
+    "feed_parser": "stream",
+    "feed_max_entries": 50,
+    # Google News 리다이렉트 해석: 동시 요청 수, 실패한 URL 재시도 간격(시간), 요청 timeout(초, 재시도 없음)
+    "gnews_resolve_concurrency": 4,
+    "gnews_retry_hours": 24,
+    "gnews_fetch_timeout_sec": 5,
+    # 서킷 브레이커: 연속 실패 N회면 냉각(기본 30분, 실패마다 2배, 최대 1일), 냉각 후 1회 시험 요청
+    "breaker_threshold": 3,
+    "breaker_base_cooldown_sec": 1800,
+    "breaker_max_cooldown_sec": 86400,
+    "probe_timeout_sec": 5,
+    "health_latency_alpha": 0.3,
+    # 상주 모드(--serve) 소스별 폴링: 처음 간격 / 최소 / 최대(초), 폴링당 목표 새 글 수, EWMA 가중치, 흔들림 비율
+    "poll_initial_sec": 3600,
+    "poll_min_sec": 600,
+    "poll_max_sec": 6 * 3600,
+    "poll_target_items": 3,
+    "poll_ewma_alpha": 0.3,
+    "poll_jitter": 0.1,
+    # 상주 모드에서 META(설정)를 다시 읽는 주기(초)
+    "serve_meta_reload_sec": 900,
 }
@@ -0,0 +1,108 @@
+# hismedi-app/news/dates.py
+# -*- coding: utf-8 -*-
+"""피드 날짜 문자열 → ISO 문자열 정규화(빠른 경로 + 메모 + dateutil 폴백).
+
+- 결과는 기존 방식(dateutil.parser.parse → tz 없으면 UTC 부여 → isoformat())과 글자 단위로 같습니다.
+  원래 오프셋은 그대로 둡니다(UTC로 변환하지 않음).
+- 빠른 경로는 결과가 dateutil과 같다고 확신할 수 있는 형태만 정규식으로 골라 받습니다.
+  · RFC 822(RSS): 4자리 연도 + 숫자 오프셋 또는 GMT/UT/UTC/Z → email.utils.parsedate_to_datetime
+    (EST 같은 지역 약어는 dateutil이 무시하므로 폴백으로 보냄)
+  · ISO 8601(Atom): YYYY-MM-DD[THH:MM[:SS[.ffffff]]][Z|±HH:MM] → datetime.fromisoformat
+- 같은 문자열은 메모에서 바로 돌려주고, 경로별 적중 수를 stats()로 알려 줍니다.
+"""
+import re, threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from dateutil import parser as dateparser
+
+MEMO_MAX = 20000  # 메모 항목 수 상한(넘으면 비움)
+
+_RFC822 = re.compile(
+    r"^(?:[A-Za-z]{3},\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{4}\s+\d{1,2}:\d{2}(?::\d{2})?\s+"
+    r"(?:[+-]\d{4}|GMT|UTC|UT|Z)$"
+)
+_ISO = re.compile(
+    r"^\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}:\d{2})?)?$"
+)
+
+PATHS = ("memo", "rfc822", "iso", "dateutil", "failed")
+
+
+def _iso_out(dt: datetime) -> str:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.isoformat()
+
+
+def _slow(s: str) -> str:
+    return _iso_out(dateparser.parse(s))
+
+
+class DateNormalizer:
+    def __init__(self, memo_max: int = MEMO_MAX):
+        self.memo_max = memo_max
+        self._memo = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.counts = {k: 0 for k in PATHS}
+
+    def add_counts(self, counts: dict):
+        """다른 프로세스의 경로별 적중 수를 더합니다."""
+        with self._lock:
+            for k in PATHS:
+                self.counts[k] += int(counts.get(k, 0))
+
+    def _hit(self, path: str):
+        with self._lock:
+            self.counts[path] += 1
+
+    def _parse(self, s: str):
+        """(경로, 결과). 빠른 경로가 예외를 내면 dateutil로 넘깁니다."""
+        if _RFC822.match(s):
+            try:
+                return "rfc822", _iso_out(parsedate_to_datetime(s))
+            except (TypeError, ValueError, IndexError):
+                pass
+        elif _ISO.match(s):
+            try:
+                return "iso", _iso_out(datetime.fromisoformat(s))
+            except ValueError:
+                pass
+        try:
+            return "dateutil", _slow(s)
+        except Exception:
+            return "failed", ""
+
+    def normalize(self, raw: str) -> str:
+        """날짜 문자열 → ISO 문자열(실패 시 '')."""
+        if not raw:
+            return ""
+        s = raw.strip()
+        out = self._memo.get(s)
+        if out is not None:
+            self._hit("memo")
+            return out
+        path, out = self._parse(s)
+        self._hit(path)
+        if len(self._memo) >= self.memo_max:
+            self._memo.clear()
+        self._memo[s] = out
+        return out
+
+    def stats(self) -> dict:
+        """경로별 적중 수와 비율."""
+        counts = dict(self.counts)
+        total = sum(counts.values())
+        return {**counts, "total": total,
+                "fast_rate": round((total - counts["dateutil"] - counts["failed"]) / total, 4) if total else 0.0}
+
+
+# 프로세스 공용 인스턴스
+DATES = DateNormalizer()
+
+
+def normalize_date(raw: str) -> str:
+    return DATES.normalize(raw)
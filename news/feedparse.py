@@ -0,0 +1,104 @@
+# hismedi-app/news/feedparse.py
+# -*- coding: utf-8 -*-
+"""RSS 2.0 / Atom 스트리밍 파서(lxml.etree.iterparse).
+
+- 문서 전체 트리를 만들지 않고 항목(item/entry)이 끝날 때마다 title / link / 날짜만 꺼낸 뒤 버립니다.
+- limit개를 읽으면 나머지 문서는 읽지 않습니다.
+- feedparser와 결과가 달라질 수 있는 경우는 FeedFallback을 던져 feedparser로 넘깁니다:
+  XML 오류, RSS 2.0/Atom이 아닌 문서(RDF 등), 제목에 마크업(<)이 들어 있는 항목,
+  절대 URL이 아닌 링크(xml:base 해석 필요).
+- 돌려주는 항목은 feedparser entry와 같은 키(title, link, published, updated)를 가진 dict입니다.
+"""
+from io import BytesIO
+
+from lxml import etree
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+
+_RSS_ITEM = "item"
+_ATOM_ENTRY = ATOM + "entry"
+
+
+class FeedFallback(Exception):
+    """스트리밍 파서로 확실히 처리할 수 없는 문서(feedparser로 다시 파싱)."""
+
+
+def _text(el) -> str:
+    return (el.text or "").strip() if el is not None else ""
+
+
+def _rss_entry(item) -> dict:
+    link = _text(item.find("link"))
+    if not link:
+        # feedparser처럼 permalink guid를 링크로 씁니다.
+        guid = item.find("guid")
+        if guid is not None and guid.get("isPermaLink", "true").lower() != "false":
+            link = _text(guid)
+    return {
+        "title": _text(item.find("title")),
+        "link": link,
+        "published": _text(item.find("pubDate")),
+        "updated": _text(item.find(DC_DATE)),
+    }
+
+
+def _atom_entry(entry) -> dict:
+    link = ""
+    for el in entry.iterfind(ATOM + "link"):
+        if el.get("rel", "alternate") == "alternate" and el.get("href"):
+            link = el.get("href").strip()
+            break
+    title = entry.find(ATOM + "title")
+    if title is not None and title.get("type") in ("html", "xhtml"):
+        raise FeedFallback("atom html title")
+    return {
+        "title": _text(title),
+        "link": link,
+        "published": _text(entry.find(ATOM + "published")),
+        "updated": _text(entry.find(ATOM + "updated")),
+    }
+
+
+def _check(e: dict) -> dict:
+    if "<" in e["title"]:
+        raise FeedFallback("markup in title")
+    if e["link"] and not e["link"].startswith(("http://", "https://")):
+        raise FeedFallback("relative link")
+    return e
+
+
+def parse_entries(content: bytes, limit: int = 50) -> list:
+    """앞에서부터 limit개 항목. 처리할 수 없는 문서는 FeedFallback."""
+    out = []
+    root_tag = None
+    try:
+        events = etree.iterparse(
+            BytesIO(content), events=("start", "end"), resolve_entities=False, no_network=True,
+        )
+        for event, el in events:
+            if root_tag is None:
+                root_tag = el.tag
+                if root_tag not in ("rss", ATOM + "feed"):
+                    raise FeedFallback(f"unsupported root {root_tag!r}")
+                continue
+            if event != "end":
+                continue
+            if el.tag == _RSS_ITEM and root_tag == "rss":
+                out.append(_check(_rss_entry(el)))
+            elif el.tag == _ATOM_ENTRY:
+                out.append(_check(_atom_entry(el)))
+            else:
+                continue
+            # 처리한 항목과 앞선 형제 노드를 버려 메모리를 일정하게 유지
+            el.clear()
+            parent = el.getparent()
+            while parent is not None and el.getprevious() is not None:
+                del parent[0]
+            if len(out) >= limit:
+                break
+    except etree.XMLSyntaxError as e:
+        raise FeedFallback(repr(e))
+    if root_tag is None:
+        raise FeedFallback("empty document")
+    return out
@@ -1,5 +1,7 @@
-import os, json
+import os, json, time
 import gspread
+import requests
+from gspread.utils import rowcol_to_a1
 from google.oauth2.service_account import Credentials
 
 # summary 제거(요약 생성/저장 안 함)
@@ -60,3 +62,145 @@ def meta_set(ws_meta, key: str, value: str):
             ws_meta.update(f"B{i}", [[value]])
             return
     ws_meta.append_row([key, value], value_input_option="RAW")
+
+class MetaSession:
+    """META 탭 스냅샷: 한 번 읽고, get은 메모리에서, set은 모았다가 commit()에서 한 번에 기록.
+
+    - 키가 여러 행에 있으면 meta_get/meta_set과 같이 첫 행을 씁니다.
+    - 없는 키는 마지막 행 뒤에 새 행으로 붙입니다.
+    - commit()은 batch_update 1회(필요 시 행 추가 1회)이며, 기록 후 스냅샷에 반영됩니다.
+    """
+
+    def __init__(self, ws_meta):
+        self.ws = ws_meta
+        self._values, self._rows = {}, {}
+        self._pending = {}
+        self.reload()
+
+    def reload(self):
+        rows = self.ws.get_all_values()
+        self._values.clear()
+        self._rows.clear()
+        for i, r in enumerate(rows[1:], start=2):
+            if len(r) >= 1 and r[0] and r[0] not in self._rows:
+                self._rows[r[0]] = i
+                self._values[r[0]] = r[1] if len(r) >= 2 else ""
+        self._last_row = max(1, len(rows))
+
+    def get(self, key: str) -> str:
+        if key in self._pending:
+            return self._pending[key]
+        return self._values.get(key, "")
+
+    def set(self, key: str, value):
+        self._pending[key] = str(value)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._pending)
+
+    def commit(self):
+        if not self._pending:
+            return
+        data = []
+        next_row = self._last_row + 1
+        for key, value in self._pending.items():
+            row = self._rows.get(key)
+            if row is None:
+                row = self._rows[key] = next_row
+                next_row += 1
+            data.append({"range": f"A{row}:B{row}", "values": [[key, value]]})
+        if self.ws.row_count < next_row - 1:
+            self.ws.add_rows(next_row - 1 - self.ws.row_count)
+        self.ws.batch_update(data, value_input_option="RAW")
+        self._values.update(self._pending)
+        self._last_row = next_row - 1
+        self._pending = {}
+
+
+# ----------------------------
+# NEWS 기록기(버퍼 → 청크 → 고정 범위 기록)
+# ----------------------------
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+def _retry_after_sec(err) -> float:
+    try:
+        v = err.response.headers.get("Retry-After")
+        return max(0.0, float(v)) if v else None
+    except Exception:
+        return None
+
+class SheetWriter:
+    """행을 모아 크기 제한 청크로 기록합니다.
+
+    - 각 청크는 append가 아니라 정해진 범위(A{r}:I{r+n-1})에 update 합니다.
+      재시도해도 같은 칸을 덮어쓰므로 행이 두 번 붙지 않습니다(멱등).
+    - 429/5xx는 Retry-After(없으면 지수 백오프)만큼 기다렸다가 다시 보냅니다.
+    - start_row: 첫 빈 행 번호(1-based, 헤더 포함 기준)
+    """
+
+    def __init__(self, ws, start_row: int, chunk_rows: int = 500, chunk_bytes: int = 1_000_000,
+                 max_retries: int = 5, backoff_sec: float = 2.0, sleep=time.sleep):
+        self.ws = ws
+        self.next_row = int(start_row)
+        self.chunk_rows = max(1, int(chunk_rows))
+        self.chunk_bytes = max(1, int(chunk_bytes))
+        self.max_retries = int(max_retries)
+        self.backoff_sec = float(backoff_sec)
+        self._sleep = sleep
+        self._buf, self._buf_bytes = [], 0
+        self.rows_written = 0
+        self.chunks = 0
+        self.retries = 0
+        self.write_sec = 0.0
+
+    def add(self, row):
+        size = sum(len(str(c)) for c in row) + len(row)
+        if self._buf and (len(self._buf) >= self.chunk_rows or self._buf_bytes + size > self.chunk_bytes):
+            self.flush()
+        self._buf.append(row)
+        self._buf_bytes += size
+
+    def flush(self):
+        if not self._buf:
+            return
+        rows, self._buf, self._buf_bytes = self._buf, [], 0
+        t0 = time.monotonic()
+        self._write_chunk(rows)
+        self.write_sec += time.monotonic() - t0
+        self.next_row += len(rows)
+        self.rows_written += len(rows)
+        self.chunks += 1
+
+    def close(self):
+        self.flush()
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows_written / self.write_sec if self.write_sec > 0 else 0.0
+
+    def _ensure_grid(self, last_row: int):
+        if self.ws.row_count < last_row:
+            self.ws.add_rows(last_row - self.ws.row_count)
+
+    def _write_chunk(self, rows):
+        first, last = self.next_row, self.next_row + len(rows) - 1
+        ncols = max(len(r) for r in rows)
+        rng = f"{rowcol_to_a1(first, 1)}:{rowcol_to_a1(last, ncols)}"
+        for attempt in range(self.max_retries + 1):
+            try:
+                self._ensure_grid(last)
+                self.ws.update(values=rows, range_name=rng, value_input_option="RAW")
+                return
+            except gspread.exceptions.APIError as e:
+                status = getattr(e.response, "status_code", None)
+                if status not in RETRY_STATUS or attempt >= self.max_retries:
+                    raise
+                wait = _retry_after_sec(e)
+            except (requests.ConnectionError, requests.Timeout):
+                # 응답을 못 받았어도 같은 범위에 다시 쓰면 되므로 그대로 재시도
+                if attempt >= self.max_retries:
+                    raise
+                wait = None
+            self.retries += 1
+            self._sleep(wait if wait is not None else self.backoff_sec * (2 ** attempt))
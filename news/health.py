@@ -0,0 +1,92 @@
+# hismedi-app/news/health.py
+# -*- coding: utf-8 -*-
+"""소스별 상태 추적 + 서킷 브레이커.
+
+- 소스마다 연속 실패 수, 마지막 성공/실패 시각, 최근 오류, 지연(EWMA)을 실행 간에 유지합니다.
+- 연속 실패가 breaker_threshold에 닿으면 브레이커를 열고(open) 냉각 시간 동안 요청하지 않습니다.
+  냉각 시간은 breaker_base_cooldown_sec × 2^(초과 실패 수), 최대 breaker_max_cooldown_sec.
+- 냉각이 끝나면 재시도 없는 짧은 요청 한 번(probe)으로 확인하고, 성공하면 닫고 실패하면 더 길게 엽니다.
+- meta_summary()는 닫혀 있지 않거나 실패 중인 소스만 요약해 META에 보여 줍니다.
+"""
+import threading, time
+from datetime import datetime, timezone
+
+from news.config import DEFAULTS
+from news.state import load_json, save_json
+
+HEALTH_FILE = "source_health.json"
+
+CLOSED, OPEN, PROBE = "closed", "open", "probe"
+
+
+def _iso(ts):
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat(timespec="seconds") if ts else ""
+
+
+class HealthTracker:
+    def __init__(self, state: dict = None):
+        self.threshold = int(DEFAULTS.get("breaker_threshold", 3))
+        self.base_cooldown = float(DEFAULTS.get("breaker_base_cooldown_sec", 1800))
+        self.max_cooldown = float(DEFAULTS.get("breaker_max_cooldown_sec", 86400))
+        self.alpha = float(DEFAULTS.get("health_latency_alpha", 0.3))
+        self.sources = {k: dict(v) for k, v in (state or {}).items()}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls):
+        return cls(load_json(HEALTH_FILE))
+
+    def save(self):
+        save_json(HEALTH_FILE, self.sources)
+
+    def _get(self, label: str) -> dict:
+        return self.sources.setdefault(label, {
+            "state": CLOSED, "failures": 0, "open_until": 0.0, "last_success": 0.0, "last_failure": 0.0,
+            "last_error": "", "latency_sec": None,
+        })
+
+    def decide(self, label: str, now: float = None) -> str:
+        """이번 실행에서 이 소스를 어떻게 다룰지: closed(정상) / probe(한 번만 시험) / open(건너뜀)."""
+        now = time.time() if now is None else now
+        with self._lock:
+            h = self._get(label)
+            if h["state"] == CLOSED:
+                return CLOSED
+            return PROBE if now >= h["open_until"] else OPEN
+
+    def _latency(self, h: dict, sec: float):
+        if sec is not None:
+            h["latency_sec"] = sec if h["latency_sec"] is None else \
+                round(self.alpha * sec + (1 - self.alpha) * h["latency_sec"], 3)
+
+    def record_success(self, label: str, latency_sec: float = None, now: float = None):
+        now = time.time() if now is None else now
+        with self._lock:
+            h = self._get(label)
+            h.update(state=CLOSED, failures=0, open_until=0.0, last_success=now)
+            self._latency(h, latency_sec)
+
+    def record_failure(self, label: str, error: str, latency_sec: float = None, now: float = None):
+        now = time.time() if now is None else now
+        with self._lock:
+            h = self._get(label)
+            h["failures"] += 1
+            h["last_failure"] = now
+            h["last_error"] = (error or "")[:300]
+            self._latency(h, latency_sec)
+            if h["failures"] >= self.threshold:
+                cooldown = min(self.max_cooldown, self.base_cooldown * 2 ** (h["failures"] - self.threshold))
+                h["state"] = OPEN
+                h["open_until"] = now + cooldown
+
+    def meta_summary(self) -> dict:
+        """닫혀 있지 않거나 실패 중인 소스만(운영자가 어떤 피드가 멈춰 있는지 보도록)."""
+        out = {}
+        for label, h in sorted(self.sources.items()):
+            if h["state"] == CLOSED and not h["failures"]:
+                continue
+            out[label] = {
+                "state": h["state"], "failures": h["failures"], "until": _iso(h["open_until"]),
+                "last_success": _iso(h["last_success"]), "error": h["last_error"][:120],
+            }
+        return out
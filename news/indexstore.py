@@ -0,0 +1,233 @@
+# hismedi-app/news/indexstore.py
+# -*- coding: utf-8 -*-
+"""중복 판정용 로컬 인덱스(SQLite).
+
+NEWS 탭 전체의 url_canonical / title_hash / simhash 를 보관해서,
+매 실행마다 NEWS를 통째로 읽지 않고도 중복을 판정합니다.
+
+- 시작 시 시트 끝부분(2칸)만 읽어 인덱스가 알고 있는 행 수와 맞는지 확인합니다.
+  어긋나면(수동 편집/삭제, 캐시 유실 등) 시트 전체를 읽어 다시 만듭니다(reconcile).
+- 근접중복은 SimHashIndex와 같은 밴드 마스크로 버킷 테이블(sim_keys)을 만들어 조회합니다.
+- 새 행은 add()로 넣고, 시트 기록이 끝난 뒤 commit() 합니다(실패 시 rollback()).
+- 보관 탭(news.archive)으로 옮긴 행은 url_canonical / title_hash만 archived_* 테이블에 남습니다.
+  rebuild()는 NEWS 부분만 다시 만들고, 보관 부분은 rebuild_archived()로 따로 맞춥니다.
+"""
+import sqlite3
+
+from news.simindex import SimHashIndex
+from news.state import state_path
+
+INDEX_FILE = "news_index.sqlite3"
+
+# NEWS 열 위치(gsheet.NEWS_HEADERS 기준, 0-based)
+COL_URL, COL_URL_CANONICAL, COL_TITLE_HASH, COL_SIMHASH = 3, 4, 6, 7
+
+
+def _i64(x: int) -> int:
+    # SQLite 정수는 부호 있는 64비트
+    return x - (1 << 64) if x >= (1 << 63) else x
+
+
+def _u64(x: int) -> int:
+    return x + (1 << 64) if x < 0 else x
+
+
+def _cell(row, i):
+    return row[i] if len(row) > i else ""
+
+
+class DedupeIndex:
+    def __init__(self, path: str = None, max_hamming: int = 6):
+        self.path = path or state_path(INDEX_FILE)
+        self.max_hamming = int(max_hamming)
+        self._layout = SimHashIndex(self.max_hamming)
+        self.db = sqlite3.connect(self.path)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS urls (url TEXT PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS titles (hash TEXT PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS sims (id INTEGER PRIMARY KEY, sim INTEGER NOT NULL, url TEXT);
+            CREATE TABLE IF NOT EXISTS sim_keys (tbl INTEGER NOT NULL, key INTEGER NOT NULL, id INTEGER NOT NULL);
+            CREATE INDEX IF NOT EXISTS sim_keys_lookup ON sim_keys (tbl, key, id);
+            CREATE TABLE IF NOT EXISTS archived_urls (url TEXT PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS archived_titles (hash TEXT PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+        """)
+        if self._info("layout") not in (None, self._layout_sig()):
+            self._rebuild_sim_keys()
+
+    # ---------- info ----------
+    def _info(self, key: str):
+        r = self.db.execute("SELECT value FROM info WHERE key = ?", (key,)).fetchone()
+        return r[0] if r else None
+
+    def _set_info(self, key: str, value):
+        self.db.execute("INSERT OR REPLACE INTO info (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def _layout_sig(self) -> str:
+        return f"{self._layout.max_hamming}/{self._layout.bands}"
+
+    @property
+    def row_count(self):
+        """인덱스가 반영한 NEWS 데이터 행 수(None = 아직 동기화 전)."""
+        v = self._info("row_count")
+        return None if v is None else int(v)
+
+    @property
+    def last_url(self) -> str:
+        return self._info("last_url_canonical") or ""
+
+    @property
+    def archived_rows(self) -> int:
+        """보관 탭 행 수(보관 목록 기준, 인덱스가 반영한 값)."""
+        return int(self._info("archived_rows") or 0)
+
+    # ---------- 조회 ----------
+    def has_url(self, url_canonical: str) -> bool:
+        return self.db.execute(
+            "SELECT 1 FROM urls WHERE url = ? UNION ALL SELECT 1 FROM archived_urls WHERE url = ? LIMIT 1",
+            (url_canonical, url_canonical),
+        ).fetchone() is not None
+
+    def has_title(self, title_hash: str) -> bool:
+        return self.db.execute(
+            "SELECT 1 FROM titles WHERE hash = ? UNION ALL SELECT 1 FROM archived_titles WHERE hash = ? LIMIT 1",
+            (title_hash, title_hash),
+        ).fetchone() is not None
+
+    def near_duplicate(self, sim_int: int, max_hamming: int = None) -> str:
+        """해밍거리 ≤ max_hamming인 가장 오래된 항목의 url('' = 없음)."""
+        k = self.max_hamming if max_hamming is None else int(max_hamming)
+        if k > self.max_hamming:
+            raise ValueError(f"max_hamming {k} exceeds index guarantee {self.max_hamming}")
+        keys = self._layout.keys(sim_int)
+        where = " OR ".join(["(k.tbl = ? AND k.key = ?)"] * len(keys))
+        params = [v for t, key in keys for v in (t, _i64(key))]
+        cur = self.db.execute(
+            f"SELECT DISTINCT s.id, s.sim, s.url FROM sim_keys k JOIN sims s ON s.id = k.id WHERE {where} ORDER BY s.id",
+            params,
+        )
+        for _, sim, url in cur:
+            if (_u64(sim) ^ sim_int).bit_count() <= k:
+                return url or ""
+        return ""
+
+    # ---------- 갱신 ----------
+    def _insert_sim(self, sim_int: int, url: str):
+        cur = self.db.execute("INSERT INTO sims (sim, url) VALUES (?, ?)", (_i64(sim_int), url))
+        self.db.executemany(
+            "INSERT INTO sim_keys (tbl, key, id) VALUES (?, ?, ?)",
+            [(t, _i64(key), cur.lastrowid) for t, key in self._layout.keys(sim_int)],
+        )
+
+    def add(self, url_canonical: str, title_hash: str, simhash: str, url: str):
+        """NEWS에 새로 붙일 행 하나를 반영합니다(commit 전까지는 이 연결에서만 보임)."""
+        if url_canonical:
+            self.db.execute("INSERT OR IGNORE INTO urls (url) VALUES (?)", (url_canonical,))
+        if title_hash:
+            self.db.execute("INSERT OR IGNORE INTO titles (hash) VALUES (?)", (title_hash,))
+        if simhash and simhash.isdigit():
+            self._insert_sim(int(simhash), url)
+        self._set_info("row_count", (self.row_count or 0) + 1)
+        self._set_info("last_url_canonical", url_canonical)
+
+    def rebuild(self, body):
+        """NEWS 데이터 행(헤더 제외) 전체로 인덱스를 다시 만듭니다."""
+        self.db.execute("DELETE FROM urls")
+        self.db.execute("DELETE FROM titles")
+        self.db.execute("DELETE FROM sims")
+        self.db.execute("DELETE FROM sim_keys")
+        self.db.executemany(
+            "INSERT OR IGNORE INTO urls (url) VALUES (?)",
+            [(_cell(r, COL_URL_CANONICAL),) for r in body if _cell(r, COL_URL_CANONICAL)],
+        )
+        self.db.executemany(
+            "INSERT OR IGNORE INTO titles (hash) VALUES (?)",
+            [(_cell(r, COL_TITLE_HASH),) for r in body if _cell(r, COL_TITLE_HASH)],
+        )
+        for r in body:
+            sh = _cell(r, COL_SIMHASH)
+            if sh.isdigit():
+                self._insert_sim(int(sh), _cell(r, COL_URL))
+        self._set_info("row_count", len(body))
+        self._set_info("last_url_canonical", _cell(body[-1], COL_URL_CANONICAL) if body else "")
+        self._set_info("layout", self._layout_sig())
+        self.db.commit()
+
+    def add_archived(self, rows):
+        """보관 탭으로 옮긴 행들의 url_canonical / title_hash를 남깁니다(commit은 호출 쪽)."""
+        self.db.executemany(
+            "INSERT OR IGNORE INTO archived_urls (url) VALUES (?)",
+            [(_cell(r, COL_URL_CANONICAL),) for r in rows if _cell(r, COL_URL_CANONICAL)],
+        )
+        self.db.executemany(
+            "INSERT OR IGNORE INTO archived_titles (hash) VALUES (?)",
+            [(_cell(r, COL_TITLE_HASH),) for r in rows if _cell(r, COL_TITLE_HASH)],
+        )
+
+    def set_archived_rows(self, n: int):
+        self._set_info("archived_rows", int(n))
+
+    def rebuild_archived(self, tabs, total_rows: int):
+        """보관 탭들 [(title, worksheet)]의 url_canonical~title_hash 열만 읽어 보관 키를 다시 만듭니다."""
+        self.db.execute("DELETE FROM archived_urls")
+        self.db.execute("DELETE FROM archived_titles")
+        for _, ws in tabs:
+            cols = ws.get("E2:G")  # url_canonical, tags, title_hash
+            self.add_archived([[""] * COL_URL_CANONICAL + r for r in cols])
+        self.set_archived_rows(total_rows)
+        self.db.commit()
+
+    def _rebuild_sim_keys(self):
+        # max_hamming 변경 시 밴드 배치가 달라지므로 버킷만 다시 계산
+        self.db.execute("DELETE FROM sim_keys")
+        rows = self.db.execute("SELECT id, sim FROM sims").fetchall()
+        self.db.executemany(
+            "INSERT INTO sim_keys (tbl, key, id) VALUES (?, ?, ?)",
+            [(t, _i64(key), i) for i, sim in rows for t, key in self._layout.keys(_u64(sim))],
+        )
+        self._set_info("layout", self._layout_sig())
+        self.db.commit()
+
+    def commit(self):
+        self.db.commit()
+
+    def rollback(self):
+        self.db.rollback()
+
+    def close(self):
+        self.db.close()
+
+    # ---------- 시트와 동기화 ----------
+    def in_sync_with(self, ws_news) -> bool:
+        """시트 끝 2칸(url_canonical 열)만 읽어 행 수/마지막 행이 인덱스와 같은지 확인."""
+        n = self.row_count
+        if n is None:
+            return False
+        vals = ws_news.get(f"E{n + 1}:E{n + 2}")
+        expect = self.last_url if n > 0 else "url_canonical"
+        if not vals or not vals[0] or vals[0][0] != expect:
+            return False
+        return len(vals) < 2 or not vals[1] or not vals[1][0]
+
+    def in_sync_with_store(self, store) -> bool:
+        """저장소(news.storage.PostgresStore)의 행 수/마지막 행이 인덱스와 같은지 확인."""
+        n = self.row_count
+        if n is None:
+            return False
+        count, last = store.tail()
+        return count == n and (n == 0 or last == self.last_url)
+
+    def reconcile_store(self, store, force: bool = False) -> bool:
+        """reconcile()의 저장소 버전: 어긋났을 때(또는 force)만 저장소 전체로 재구성."""
+        if not force and self.in_sync_with_store(store):
+            return False
+        self.rebuild(store.rows())
+        return True
+
+    def reconcile(self, ws_news, force: bool = False) -> bool:
+        """어긋났을 때(또는 force)만 시트 전체로 재구성. 재구성했으면 True."""
+        if not force and self.in_sync_with(ws_news):
+            return False
+        values = ws_news.get_all_values()
+        self.rebuild(values[1:] if values else [])
+        return True
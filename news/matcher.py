@@ -0,0 +1,74 @@
+# hismedi-app/news/matcher.py
+# -*- coding: utf-8 -*-
+"""Aho-Corasick 다중 키워드 매처.
+
+KEYWORDS(태그별 키워드) + NEGATIVE_HINTS 전체를 하나의 오토마톤으로 만들어,
+제목을 한 번만 훑어서 매칭된 태그 집합과 제외 힌트 여부를 얻습니다.
+"""
+from collections import deque
+
+NEGATIVE = None  # 출력 라벨: 제외 힌트
+
+
+class KeywordMatcher:
+    def __init__(self, keywords: dict, negative_hints=()):
+        self.tag_order = list(keywords)
+        self._goto = [{}]   # 상태별 전이
+        self._fail = [0]
+        self._out = [set()]  # 상태별 출력 라벨(태그 이름 또는 NEGATIVE)
+        for tag, kws in keywords.items():
+            for k in kws:
+                self._add(k, tag)
+        for h in negative_hints:
+            self._add(h, NEGATIVE)
+        self._build()
+
+    def _add(self, word: str, label):
+        if not word:
+            return
+        s = 0
+        for ch in word:
+            nxt = self._goto[s].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[s][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(set())
+            s = nxt
+        self._out[s].add(label)
+
+    def _build(self):
+        q = deque(self._goto[0].values())
+        while q:
+            s = q.popleft()
+            for ch, nxt in self._goto[s].items():
+                q.append(nxt)
+                f = self._fail[s]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                # 실패 링크 쪽 출력까지 미리 합쳐 두면 매칭 중 링크를 따라갈 필요가 없습니다.
+                self._out[nxt] |= self._out[self._fail[nxt]]
+
+    def scan(self, text: str):
+        """(매칭된 태그 집합, 제외 힌트 포함 여부). 제외 힌트를 만나면 즉시 멈춥니다."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        s = 0
+        for ch in text or "":
+            while s and ch not in goto[s]:
+                s = fail[s]
+            s = goto[s].get(ch, 0)
+            if out[s]:
+                if NEGATIVE in out[s]:
+                    return found, True
+                found |= out[s]
+        return found, False
+
+    def tags(self, text: str):
+        """pick_tags와 같은 결과: 제외 힌트가 있으면 [], 아니면 KEYWORDS 순서의 태그 목록."""
+        found, negative = self.scan(text)
+        if negative:
+            return []
+        return [t for t in self.tag_order if t in found]
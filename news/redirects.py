@@ -0,0 +1,171 @@
+# hismedi-app/news/redirects.py
+# -*- coding: utf-8 -*-
+"""Google News 리다이렉트 URL → 언론사 원문 URL 해석(영구 캐시).
+
+- news.google.com/rss/articles/... 링크는 같은 기사라도 언론사 자체 피드의 URL과 달라
+  URL 단계 중복 판정을 빠져나갑니다. 수집 뒤 한 번에 모아 원문 URL로 바꿉니다.
+- 해석 순서: ① 기사 ID(base64)에 원문 URL이 그대로 들어 있으면 요청 없이 꺼냄
+  ② GET이 실제로 리다이렉트된 경우의 최종 URL ③ 응답 HTML의 data-n-au 속성.
+  안내/동의 화면의 다른 링크(푸터, 정책, 언론사 첫 화면)는 여러 기사에 똑같이 나오므로 쓰지 않습니다.
+- ②③으로 얻은 원문 URL이 이미 다른 리다이렉트 URL의 해석 결과(이번 실행 또는 캐시)면 받아들이지 않고
+  Google URL을 그대로 둡니다(서로 다른 기사가 같은 url_canonical로 묶여 중복으로 버려지지 않도록).
+- 요청은 ①로 풀리지 않는 새 형식 ID에만 보내며, 재시도 없이 짧은 timeout(gnews_fetch_timeout_sec)으로 보냅니다.
+- 해석된 URL은 gnews_redirects.json에 남겨 다시 요청하지 않습니다.
+  실패한 URL은 gnews_retry_hours 동안 다시 시도하지 않습니다.
+- 요청은 크기가 제한된 스레드 풀(gnews_resolve_concurrency)로 보내며, 호스트별 상한은 호출 쪽 fetch가 지킵니다.
+"""
+import base64, re, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from news.config import DEFAULTS
+from news.state import load_json, save_json
+
+REDIRECTS_FILE = "gnews_redirects.json"
+CACHE_MAX = 50000  # 해석 캐시 항목 수 상한(오래된 것부터 버림)
+
+GNEWS_HOST = "news.google.com"
+_ARTICLE_PATH = re.compile(r"^/(?:rss/)?articles/([A-Za-z0-9_-]+)")
+_DATA_N_AU = re.compile(r'data-n-au="(https?://[^"]+)"')
+
+
+def is_gnews_redirect(url: str) -> bool:
+    parts = urlsplit(url or "")
+    return parts.netloc.lower() == GNEWS_HOST and bool(_ARTICLE_PATH.match(parts.path))
+
+
+def _external(url: str) -> bool:
+    host = urlsplit(url).netloc.lower()
+    return bool(host) and not (host == "google.com" or host.endswith(".google.com"))
+
+
+def _varint(data: bytes, pos: int):
+    n = shift = 0
+    while pos < len(data):
+        b = data[pos]
+        n |= (b & 0x7F) << shift
+        pos += 1
+        if not b & 0x80:
+            return n, pos
+        shift += 7
+    return None, pos
+
+
+def decode_article_id(url: str) -> str:
+    """예전 형식 기사 ID(base64 protobuf)에 들어 있는 원문 URL('' = 없음/새 형식)."""
+    m = _ARTICLE_PATH.match(urlsplit(url).path)
+    if not m:
+        return ""
+    token = m.group(1)
+    try:
+        data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (ValueError, TypeError):
+        return ""
+    i = data.find(b"http")
+    # URL 필드 앞의 길이(varint, 1~2바이트)가 정확히 URL 시작에서 끝나야 합니다.
+    for width in (1, 2):
+        if i - width < 0:
+            continue
+        n, end = _varint(data, i - width)
+        if n is not None and end == i and i + n <= len(data):
+            try:
+                out = data[i:i + n].decode("ascii")
+            except UnicodeDecodeError:
+                return ""
+            return out if _external(out) else ""
+    return ""
+
+
+def _from_response(r) -> str:
+    if r.history and _external(r.url):
+        return r.url
+    m = _DATA_N_AU.search(r.text or "")
+    if m and _external(m.group(1)):
+        return m.group(1)
+    return ""
+
+
+def _unique_targets(resolved: dict) -> dict:
+    """둘 이상의 리다이렉트 URL이 같은 원문 URL을 가리키는 캐시 항목은 버립니다
+    (예전 해석이 안내 화면의 공통 링크를 집었던 경우). 기사 ID로 풀리는 항목은 다시 공짜로 풀립니다."""
+    owners = {}
+    for url, target in resolved.items():
+        owners.setdefault(target, []).append(url)
+    return {url: target for url, target in resolved.items() if len(owners[target]) == 1}
+
+
+class RedirectResolver:
+    """fetch(url) -> requests.Response 를 받아 리다이렉트 URL을 원문 URL로 바꿉니다."""
+
+    def __init__(self, fetch, cache: dict = None, concurrency: int = None, retry_hours: float = None):
+        cache = cache or {}
+        self.fetch = fetch
+        self.resolved = _unique_targets(cache.get("resolved", {}))
+        self.owner = {target: url for url, target in self.resolved.items()}  # 원문 URL -> 리다이렉트 URL
+        self.failed = dict(cache.get("failed", {}))  # url -> 마지막 실패 시각(epoch)
+        self.concurrency = int(concurrency or DEFAULTS.get("gnews_resolve_concurrency", 4))
+        self.retry_sec = 3600 * float(DEFAULTS.get("gnews_retry_hours", 24) if retry_hours is None else retry_hours)
+        self.stats = {"cached": 0, "decoded": 0, "fetched": 0, "failed": 0, "skipped": 0, "rejected": 0}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, fetch, **kw):
+        return cls(fetch, load_json(REDIRECTS_FILE), **kw)
+
+    def save(self):
+        resolved = self.resolved
+        if len(resolved) > CACHE_MAX:
+            resolved = dict(list(resolved.items())[-CACHE_MAX:])
+        save_json(REDIRECTS_FILE, {"resolved": resolved, "failed": self.failed})
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _resolve_one(self, url: str) -> str:
+        try:
+            out = _from_response(self.fetch(url))
+        except Exception:
+            out = ""
+        if out:
+            self._count("fetched")
+        else:
+            self._count("failed")
+        return out
+
+    def resolve_all(self, urls, now: float = None) -> dict:
+        """리다이렉트 URL들 → {url: 원문 URL}(해석 못 한 URL은 빠짐)."""
+        now = time.time() if now is None else now
+        out, todo = {}, []
+        for url in dict.fromkeys(u for u in urls if is_gnews_redirect(u)):
+            if url in self.resolved:
+                out[url] = self.resolved[url]
+                self._count("cached")
+                continue
+            decoded = decode_article_id(url)
+            if decoded:
+                out[url] = self.resolved[url] = decoded
+                self.owner.setdefault(decoded, url)
+                self._count("decoded")
+            elif now - self.failed.get(url, 0) < self.retry_sec:
+                self._count("skipped")
+            else:
+                todo.append(url)
+
+        if todo:
+            with ThreadPoolExecutor(max_workers=max(1, self.concurrency)) as ex:
+                results = list(ex.map(self._resolve_one, todo))
+            for url, target in zip(todo, results):
+                if target and self.owner.get(target, url) != url:
+                    # 다른 기사에 이미 쓰인 원문 URL: 공통 링크일 수 있으므로 Google URL을 그대로 둡니다.
+                    self._count("rejected")
+                    self.failed[url] = now
+                elif target:
+                    out[url] = self.resolved[url] = target
+                    self.owner[target] = url
+                    self.failed.pop(url, None)
+                else:
+                    self.failed[url] = now
+        # 오래된 실패 기록은 정리(다시 시도 대상이 되면 의미 없음)
+        self.failed = {u: t for u, t in self.failed.items() if now - t < self.retry_sec}
+        return out
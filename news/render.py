@@ -0,0 +1,58 @@
+# hismedi-app/news/render.py
+# -*- coding: utf-8 -*-
+"""news_app 기사 표 HTML(페이지 단위).
+
+- 행 HTML은 iterrows 대신 열 단위 문자열 연산(pandas)으로 한 번에 만듭니다(출력은 이전과 같은 모양).
+- 서버는 현재 페이지의 행만 잘라 보내므로, 페이로드와 브라우저 렌더링 비용이 전체 결과 수와 무관합니다.
+- 간단히 보기(compact)는 스크롤 상자 없이 화면에 보이는 만큼의 행(compact_rows)만 보냅니다.
+"""
+import math
+
+import pandas as pd
+
+PAGE_SIZES = (50, 100, 200)
+COMPACT_ROWS = 20
+
+_HEAD = "<thead><tr><th>발행</th><th>출처</th><th>제목</th></tr></thead>"
+_BOX = "<div style='max-height:760px; overflow:auto; border:1px solid rgba(49,51,63,.14); border-radius:14px;'>"
+_COMPACT_BOX = "<div style='border:1px solid rgba(49,51,63,.14); border-radius:14px;'>"
+
+
+def page_count(n_rows: int, page_size: int) -> int:
+    return max(1, math.ceil(n_rows / max(1, page_size)))
+
+
+def page_slice(df: pd.DataFrame, page: int, page_size: int):
+    """1부터 세는 page의 행(범위를 벗어나면 가장 가까운 페이지)과 실제 page."""
+    page = min(max(1, int(page)), page_count(len(df), page_size))
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size], page
+
+
+def _text(df: pd.DataFrame, col: str) -> pd.Series:
+    if col and col in df.columns:
+        return df[col].astype(str).str.strip()
+    return pd.Series("", index=df.index, dtype=object)
+
+
+def rows_html(df: pd.DataFrame, title_col: str, url_col: str, pub_col: str = "발행") -> str:
+    """<tr> 행들. df[pub_col]은 datetime."""
+    if df.empty:
+        return ""
+    rows = (
+        "<tr><td>" + df[pub_col].dt.strftime("%Y-%m-%d %H:%M")
+        + "</td><td>" + _text(df, "source")
+        + "</td><td><a class='newslink' href='" + _text(df, url_col)
+        + "' target='_blank' rel='noopener noreferrer'>" + _text(df, title_col)
+        + "</a></td></tr>"
+    )
+    return "".join(rows.tolist())
+
+
+def table_html(df: pd.DataFrame, title_col: str, url_col: str, compact: bool = False) -> str:
+    box, cls = (_COMPACT_BOX, "news compact") if compact else (_BOX, "news")
+    return (
+        box + f"<table class='{cls}'>" + _HEAD + "<tbody>"
+        + rows_html(df, title_col, url_col)
+        + "</tbody></table></div>"
+    )
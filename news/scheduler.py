@@ -0,0 +1,99 @@
+# hismedi-app/news/scheduler.py
+# -*- coding: utf-8 -*-
+"""소스별 적응형 폴링 일정(상주 모드: python -m news.scraper --serve).
+
+- 소스마다 관측한 새 글 수로 시간당 발행 속도를 지수이동평균(EWMA)으로 추정합니다.
+- 다음 간격 = 목표 새 글 수(poll_target_items) / 발행 속도, [poll_min_sec, poll_max_sec]로 제한.
+  새 글이 없던 소스는 간격을 1.5배씩 늘립니다.
+- 여러 소스가 한꺼번에 몰리지 않도록 간격에 ±poll_jitter 비율의 흔들림을 줍니다.
+- 학습한 속도/간격은 상태 파일(schedule.json)에 남겨 재시작해도 이어 갑니다.
+"""
+import heapq, random, time
+
+from news.config import DEFAULTS
+from news.state import load_json, save_json
+
+SCHEDULE_FILE = "schedule.json"
+
+
+class SourceSchedule:
+    def __init__(self, label: str, interval_sec: float, rate_per_hour: float = None, last_poll: float = None):
+        self.label = label
+        self.interval_sec = float(interval_sec)
+        self.rate_per_hour = rate_per_hour
+        self.last_poll = last_poll
+
+    def to_dict(self) -> dict:
+        return {"interval_sec": round(self.interval_sec, 1), "rate_per_hour": self.rate_per_hour,
+                "last_poll": self.last_poll}
+
+
+class PollScheduler:
+    def __init__(self, labels, state: dict = None, now: float = None, rnd: random.Random = None):
+        self.min_sec = float(DEFAULTS.get("poll_min_sec", 600))
+        self.max_sec = float(DEFAULTS.get("poll_max_sec", 6 * 3600))
+        self.target = float(DEFAULTS.get("poll_target_items", 3))
+        self.alpha = float(DEFAULTS.get("poll_ewma_alpha", 0.3))
+        self.jitter = float(DEFAULTS.get("poll_jitter", 0.1))
+        self._rnd = rnd or random.Random()
+        now = time.time() if now is None else now
+        state = state or {}
+
+        self.sources = {}
+        self._heap = []
+        initial = float(DEFAULTS.get("poll_initial_sec", 3600))
+        for label in labels:
+            st = state.get(label) or {}
+            sch = SourceSchedule(label, self._clamp(st.get("interval_sec") or initial),
+                                 st.get("rate_per_hour"), st.get("last_poll"))
+            self.sources[label] = sch
+            # 재시작 시: 마지막 폴링 + 간격이 지났으면 바로, 아니면 그때까지 대기(처음 보는 소스는 바로)
+            due = now if sch.last_poll is None else min(now + sch.interval_sec, sch.last_poll + sch.interval_sec)
+            heapq.heappush(self._heap, (due, label))
+
+    @classmethod
+    def load(cls, labels, now: float = None):
+        return cls(labels, state=load_json(SCHEDULE_FILE), now=now)
+
+    def save(self):
+        save_json(SCHEDULE_FILE, {k: v.to_dict() for k, v in self.sources.items()})
+
+    def _clamp(self, sec: float) -> float:
+        return max(self.min_sec, min(self.max_sec, float(sec)))
+
+    # ---------- 일정 ----------
+    def next_due(self) -> float:
+        return self._heap[0][0] if self._heap else float("inf")
+
+    def pop_due(self, now: float = None):
+        """지금 차례인 소스 label 목록(일정표에서 빠짐 → observe()/skip()으로 다시 넣어야 함)."""
+        now = time.time() if now is None else now
+        out = []
+        while self._heap and self._heap[0][0] <= now:
+            out.append(heapq.heappop(self._heap)[1])
+        return out
+
+    def _push(self, sch: SourceSchedule, now: float):
+        j = self._rnd.uniform(1 - self.jitter, 1 + self.jitter) if self.jitter else 1.0
+        heapq.heappush(self._heap, (now + max(self.min_sec, sch.interval_sec * j), sch.label))
+
+    def observe(self, label: str, new_items: int, now: float = None):
+        """이번 폴링에서 본 새 글 수로 발행 속도와 다음 간격을 갱신하고 다시 일정에 넣습니다."""
+        now = time.time() if now is None else now
+        sch = self.sources[label]
+        if sch.last_poll is not None and now > sch.last_poll:
+            hours = (now - sch.last_poll) / 3600.0
+            rate = max(0, new_items) / hours
+            sch.rate_per_hour = rate if sch.rate_per_hour is None else \
+                self.alpha * rate + (1 - self.alpha) * sch.rate_per_hour
+            if new_items <= 0:
+                sch.interval_sec = self._clamp(sch.interval_sec * 1.5)
+            elif sch.rate_per_hour > 0:
+                sch.interval_sec = self._clamp(3600.0 * self.target / sch.rate_per_hour)
+        sch.last_poll = now
+        self._push(sch, now)
+
+    def skip(self, label: str, now: float = None):
+        """실패 등으로 속도를 알 수 없을 때: 간격은 그대로 두고 다시 일정에 넣습니다."""
+        now = time.time() if now is None else now
+        self._push(self.sources[label], now)
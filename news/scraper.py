@@ -1,13 +1,34 @@
-import os, re, time, hashlib
-from datetime import datetime, timezone
-from dateutil import parser as dateparser
+import os, re, json, time, hashlib, threading, argparse, signal, multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urljoin, urlsplit, parse_qsl
 
 import feedparser
-import requests
+import numpy as np
 from bs4 import BeautifulSoup
 
-from news.config import KEYWORDS, NEGATIVE_HINTS, RSS_SOURCES, DEFAULTS
-from news.gsheet import open_sheet, ensure_tabs, meta_get, meta_set
+from news.config import KEYWORDS, NEGATIVE_HINTS, RSS_SOURCES, BOARD_SOURCES, DEFAULTS, HTTP_POOL_SIZES, FEED_LABEL_RULE
+from news.gsheet import open_sheet, ensure_tabs, MetaSession, SheetWriter
+from news.session import backoff_hook, close_all, get_session, pool_sizes, pool_stats
+from news.state import load_json, save_json
+from news.indexstore import COL_URL_CANONICAL, DedupeIndex
+from news.matcher import KeywordMatcher
+from news.telemetry import RunReport
+from news.scheduler import PollScheduler
+from news.health import HealthTracker, OPEN, PROBE
+from news.dates import DATES, normalize_date
+from news.redirects import RedirectResolver
+from news.feedparse import FeedFallback, parse_entries
+from news.storage import MirrorWriter, PostgresStore, storage_mode
+from news.archive import archive_book, archive_due, archive_news, archive_tabs, load_catalog
+from news.snapshot import publish as publish_snapshot, snapshot_location
+from news.sources import SheetSources, Source, as_source, get_parser, load_registry, register_parser
+
+# 피드 URL별 조건부 GET 검증값(ETag / Last-Modified) 저장 파일
+VALIDATORS_FILE = "feed_validators.json"
+# 소스별 고수위(지난 실행까지 본 최신 글) 저장 파일
+WATERMARKS_FILE = "watermarks.json"
 
 # ----------------------------
 # 유틸
@@ -42,16 +63,79 @@ def _parse_date_any(s: str) -> str:
         return ""
 
 
+# ----------------------------
+# 소스별 고수위(high-water mark)
+# ----------------------------
+WATERMARK_KEEP_URLS = 30
+
+def _iso_dt(s: str):
+    try:
+        dt = datetime.fromisoformat((s or "").strip())
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+class Watermark:
+    """지난 실행까지 본 최신 글(최근 canonical URL 몇 개 + 가장 최신 발행시각).
+
+    - is_known(): 이미 본 URL이거나, 발행시각이 (최신 발행시각 - grace_hours)보다 이전이면(is_old) True
+    - see(): 이번 실행에서 본 글을 기록 → to_dict()가 다음 실행용 고수위
+    한 소스의 수집 스레드에서만 씁니다.
+    """
+
+    def __init__(self, data: dict = None, grace_hours: float = 0):
+        data = data or {}
+        self.urls = set(data.get("urls") or [])
+        self.published = _iso_dt(data.get("published_at", ""))
+        self.cutoff = self.published - timedelta(hours=grace_hours) if self.published else None
+        self._seen = []
+        self._newest = self.published
+
+    @property
+    def empty(self) -> bool:
+        return not self.urls and self.cutoff is None
+
+    def is_old(self, published_at: str) -> bool:
+        if self.cutoff is None:
+            return False
+        dt = _iso_dt(published_at)
+        return dt is not None and dt < self.cutoff
+
+    def is_known(self, link: str, published_at: str) -> bool:
+        return link in self.urls or self.is_old(published_at)
+
+    def see(self, link: str, published_at: str):
+        if link and len(self._seen) < WATERMARK_KEEP_URLS:
+            self._seen.append(link)
+        dt = _iso_dt(published_at)
+        if dt is not None and (self._newest is None or dt > self._newest):
+            self._newest = dt
+
+    def to_dict(self) -> dict:
+        urls = list(self._seen)
+        for u in self.urls:
+            if len(urls) >= WATERMARK_KEEP_URLS:
+                break
+            if u not in urls:
+                urls.append(u)
+        return {"urls": urls, "published_at": self._newest.isoformat() if self._newest else ""}
+
 # ----------------------------
 # 정부/기관/협회: HTML 목록 크롤러
 # ----------------------------
-def _emit_item(source: str, title: str, link: str, published_at: str):
+def _emit_item(source: str, title: str, link: str, published_at: str, counts: dict = None):
+    """counts가 있으면 버린 이유(dropped_invalid / dropped_tag)와 태그 시간(tag_sec)을 셉니다."""
+    counts = counts if counts is not None else _board_counts()
     title = normalize_ws(title).replace("새글", "").strip()
     link = canonicalize_url(link)
     if not title or not link:
+        counts["dropped_invalid"] += 1
         return None
+    t0 = time.monotonic()
     tags = pick_tags(title)
+    counts["tag_sec"] += time.monotonic() - t0
     if not tags:
+        counts["dropped_tag"] += 1
         return None
     return {
         "published_at": published_at,
@@ -62,75 +146,96 @@ def _emit_item(source: str, title: str, link: str, published_at: str):
         "tags": ",".join(tags),
     }
 
-def crawl_mohw_press(ua: str, timeout_sec: int, retries: int, backoff_sec: float, pages: int = 1):
-    base = "https://www.mohw.go.kr/board.es?mid=a10503010100&bid=0027"
-    out = []
-    for p in range(1, max(1, pages) + 1):
-        url = f"{base}&nPage={p}"
-        r = http_get(url, ua=ua, timeout_sec=timeout_sec, retries=retries, backoff_sec=backoff_sec)
-        soup = BeautifulSoup(r.text, "html.parser")
-        for tr in soup.select("table tbody tr"):
-            a = tr.select_one("a[href]")
-            if not a:
-                continue
-            href = (a.get("href") or "").strip()
-            link = urljoin("https://www.mohw.go.kr/", href)
-            title = a.get_text(" ", strip=True)
-            published_at = ""
-            for td in tr.select("td"):
-                published_at = _parse_date_any(td.get_text(" ", strip=True))
-                if published_at:
-                    break
-            it = _emit_item("보건복지부-보도자료", title, link, published_at)
-            if it:
-                out.append(it)
-    return out
-
-def crawl_moel_press(ua: str, timeout_sec: int, retries: int, backoff_sec: float, pages: int = 1):
-    base = "https://www.moel.go.kr/news/enews/report/enewsList.do"
-    out = []
-    for p in range(1, max(1, pages) + 1):
-        url = f"{base}?pageIndex={p}"
-        r = http_get(url, ua=ua, timeout_sec=timeout_sec, retries=retries, backoff_sec=backoff_sec)
-        soup = BeautifulSoup(r.text, "html.parser")
-        for tr in soup.select("table tbody tr"):
-            a = tr.select_one('a[href*="enewsView.do"]')
-            if not a:
-                continue
-            href = (a.get("href") or "").strip()
-            link = urljoin("https://www.moel.go.kr/", href)
-            title = a.get_text(" ", strip=True)
-            published_at = ""
-            for td in tr.select("td"):
-                published_at = _parse_date_any(td.get_text(" ", strip=True))
-                if published_at:
-                    break
-            it = _emit_item("고용노동부-보도자료", title, link, published_at)
-            if it:
-                out.append(it)
-    return out
-
-
+def _board_counts() -> dict:
+    return {"entries": 0, "dropped_invalid": 0, "dropped_watermark": 0, "dropped_tag": 0, "tag_sec": 0.0}
 
+def _fetch_pages(urls, ua: str, timeout_sec: int, retries: int, backoff_sec: float, on_response=None):
+    """여러 목록 페이지를 병렬로 받아 urls 순서대로 반환합니다(하나라도 실패하면 예외).
+    on_response(r)가 있으면 받은 응답마다 호출합니다(계측용).
+    """
+    def get(u):
+        r = http_get(u, ua=ua, timeout_sec=timeout_sec, retries=retries, backoff_sec=backoff_sec)
+        if on_response:
+            on_response(r)
+        return r
 
+    if len(urls) <= 1:
+        return [get(u) for u in urls]
+    with ThreadPoolExecutor(max_workers=len(urls)) as ex:
+        return list(ex.map(get, urls))
 
+def _crawl_board(source: str, page_urls, link_selector: str, base: str, ua: str, timeout_sec: int, retries: int,
+                 backoff_sec: float, on_response=None, watermark: Watermark = None, counts: dict = None):
+    """게시판 목록 페이지들을 읽어 태그가 붙은 항목만 돌려줍니다.
 
+    watermark가 있으면 호스트 동시 상한만큼씩 페이지를 받다가, 이미 본 URL이 나온 묶음에서 멈춥니다
+    (평소에는 1페이지만 받고, 놓친 글이 많을 때만 gov_pages까지 더 내려갑니다).
+    발행시각이 고수위보다 오래된 행(1페이지 위에 고정된 예전 공지 등)은 건너뛰고 세기만 할 뿐 멈추는 근거로 쓰지 않습니다.
+    counts(_board_counts 모양)가 있으면 읽은 행 수와 버린 이유별 수를 더합니다.
+    페이지는 병렬로 받지만 파싱은 이 스레드에서 하므로 counts는 잠그지 않습니다.
+    """
+    counts = counts if counts is not None else _board_counts()
+    window = len(page_urls) if watermark is None or watermark.empty else max(1, _LIMITER.per_host)
+    out = []
+    for i in range(0, len(page_urls), window):
+        hit_known = False
+        for r in _fetch_pages(page_urls[i:i + window], ua, timeout_sec, retries, backoff_sec, on_response=on_response):
+            soup = BeautifulSoup(r.text, "html.parser")
+            for tr in soup.select("table tbody tr"):
+                a = tr.select_one(link_selector)
+                if not a:
+                    continue
+                counts["entries"] += 1
+                href = (a.get("href") or "").strip()
+                link = urljoin(base, href)
+                title = a.get_text(" ", strip=True)
+                published_at = ""
+                for td in tr.select("td"):
+                    published_at = _parse_date_any(td.get_text(" ", strip=True))
+                    if published_at:
+                        break
+                if watermark is not None:
+                    key = canonicalize_url(link)
+                    old = watermark.is_old(published_at)
+                    if old or key in watermark.urls:
+                        hit_known = hit_known or not old
+                        counts["dropped_watermark"] += 1
+                        continue
+                    watermark.see(key, published_at)
+                it = _emit_item(source, title, link, published_at, counts)
+                if it:
+                    out.append(it)
+        if hit_known:
+            break
+    return out
 
+def crawl_board(spec: dict, ua: str, timeout_sec: int, retries: int, backoff_sec: float, pages: int = 1,
+                on_response=None, watermark: Watermark = None, name: str = "", counts: dict = None):
+    """BOARD_SOURCES 모양의 spec(page_url / link_selector / base / item_name)으로 게시판을 읽습니다."""
+    urls = [spec["page_url"].format(page=p) for p in range(1, max(1, pages) + 1)]
+    return _crawl_board(spec.get("item_name") or name, urls, spec["link_selector"], spec["base"],
+                        ua, timeout_sec, retries, backoff_sec, on_response=on_response, watermark=watermark,
+                        counts=counts)
 
+def crawl_mohw_press(ua: str, timeout_sec: int, retries: int, backoff_sec: float, pages: int = 1, on_response=None,
+                     watermark: Watermark = None):
+    return crawl_board(BOARD_SOURCES["HTML:mohw"], ua, timeout_sec, retries, backoff_sec, pages=pages,
+                       on_response=on_response, watermark=watermark)
 
+def crawl_moel_press(ua: str, timeout_sec: int, retries: int, backoff_sec: float, pages: int = 1, on_response=None,
+                     watermark: Watermark = None):
+    return crawl_board(BOARD_SOURCES["HTML:moel"], ua, timeout_sec, retries, backoff_sec, pages=pages,
+                       on_response=on_response, watermark=watermark)
 
 # ----------------------------
 # 태그 분류
 # ----------------------------
+# KEYWORDS / NEGATIVE_HINTS 전체를 한 번에 찾는 오토마톤(임포트 시 1회 생성)
+_TAG_MATCHER = KeywordMatcher(KEYWORDS, NEGATIVE_HINTS)
+
 def pick_tags(text: str):
-    t = text or ""
-    if any(h in t for h in NEGATIVE_HINTS):
-        return []
-    tags = []
-    for tag, kws in KEYWORDS.items():
-        if any(k in t for k in kws):
-            tags.append(tag)
-    return tags
+    """제외 힌트가 있으면 [], 아니면 매칭된 태그(KEYWORDS 순서). 제목을 한 번만 훑습니다."""
+    return _TAG_MATCHER.tags(text)
 
 # ----------------------------
 # SimHash (제목 기반)
@@ -156,203 +261,821 @@ def simhash64(text: str):
             out |= (1 << i)
     return str(out)
 
-def hamming(a: int, b: int) -> int:
-    return (a ^ b).bit_count()
+def _token_hash64(tok: str) -> int:
+    # simhash64와 같은 비트: md5 128비트 정수의 하위 64비트 = digest 뒤 8바이트(big-endian)
+    return int.from_bytes(hashlib.md5(tok.encode("utf-8")).digest()[8:], "big")
+
+def simhash64_batch(texts):
+    """여러 제목의 SimHash를 한 번에 계산합니다(simhash64와 비트 단위로 동일, 토큰 없으면 '').
+
+    토큰 해시 → uint64 배열 → unpackbits(비트 행렬) → ±1 열 합계 → 부호로 비트 결정.
+    같은 토큰은 한 번만 md5를 계산합니다.
+    """
+    texts = list(texts)
+    out = [""] * len(texts)
+    tok_ids, offsets, rows = [], [], []
+    vocab = {}
+    for i, text in enumerate(texts):
+        toks = tokenize(text)
+        if not toks:
+            continue
+        offsets.append(len(tok_ids))
+        rows.append(i)
+        for tok in toks:
+            j = vocab.get(tok)
+            if j is None:
+                j = vocab[tok] = len(vocab)
+            tok_ids.append(j)
+    if not rows:
+        return out
+
+    hashes = np.fromiter((_token_hash64(t) for t in vocab), dtype="<u8", count=len(vocab))
+    # (토큰 수, 64) 비트 행렬: 열 i = 해시의 i번째 비트
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    signed = bits.astype(np.int16) * 2 - 1
+    sums = np.add.reduceat(signed[np.asarray(tok_ids)], np.asarray(offsets), axis=0)
+    packed = np.packbits(sums >= 0, axis=1, bitorder="little")
+    for i, v in zip(rows, packed.view("<u8").ravel()):
+        out[i] = str(int(v))
+    return out
 
 # ----------------------------
-# HTTP GET helper (retry / timeout / UA)
+# 동시 요청 제한(전체 / 호스트별)
 # ----------------------------
-def http_get(url: str, ua: str, timeout_sec: int, retries: int, backoff_sec: float):
-    last_err = None
-    for attempt in range(retries + 1):
+class FetchLimiter:
+    """동시에 나가는 HTTP 요청 수를 전체 상한과 호스트별 상한으로 묶습니다.
+
+    호스트별 상한은 HTTP_POOL_SIZES에 재정의가 있으면 그 값을 따릅니다(풀 크기와 일치).
+    slot()이 돌려주는 pause()를 쓰면 재시도 대기 동안 두 슬롯을 내놓았다가 다시 잡습니다
+    (http_get이 news.session.backoff_hook으로 연결). 느린/503 호스트가 대기 중에 슬롯을 쥐고 있지 않습니다.
+    """
+
+    def __init__(self, max_total: int, per_host: int):
+        self.max_total = max(1, int(max_total))
+        self.per_host = max(1, int(per_host))
+        self._total = threading.BoundedSemaphore(self.max_total)
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host_sem(self, host: str):
+        with self._lock:
+            sem = self._hosts.get(host)
+            if sem is None:
+                sem = self._hosts[host] = threading.BoundedSemaphore(int(HTTP_POOL_SIZES.get(host, self.per_host)))
+            return sem
+
+    @contextmanager
+    def slot(self, url: str):
+        # 호스트 슬롯을 먼저 잡아야 전체 슬롯을 쥔 채로 같은 호스트를 기다리지 않습니다.
+        host = self._host_sem(urlsplit(url).netloc.lower())
+        host.acquire()
+        self._total.acquire()
         try:
-            r = requests.get(url, headers={"User-Agent": ua}, timeout=timeout_sec, allow_redirects=True)
-            r.raise_for_status()
-            return r
-        except Exception as e:
-            last_err = e
-            if attempt < retries:
-                time.sleep(backoff_sec * (attempt + 1))
-            else:
-                break
-    raise last_err
+            yield lambda: self._paused(host)
+        finally:
+            self._total.release()
+            host.release()
+
+    @contextmanager
+    def _paused(self, host):
+        self._total.release()
+        host.release()
+        try:
+            yield
+        finally:
+            host.acquire()
+            self._total.acquire()
+
+_LIMITER = FetchLimiter(DEFAULTS["fetch_concurrency"], DEFAULTS["fetch_per_host"])
+
+def configure_fetch_limits(max_total: int, per_host: int):
+    global _LIMITER
+    _LIMITER = FetchLimiter(max_total, per_host)
+    return _LIMITER
 
 # ----------------------------
-# 기존 인덱스 로드
+# HTTP GET helper (공유 세션 / timeout / UA)
+# - 재시도/백오프는 세션 어댑터가 처리(news.session), 대기 동안에는 슬롯을 반납
 # ----------------------------
-def load_indexes(ws_news, recent_sim_n: int):
-    values = ws_news.get_all_values()
-    if len(values) <= 1:
-        return set(), set(), []
-
-    body = values[1:]
-    url_set = set()
-    titlehash_set = set()
-
-    recent = body[-recent_sim_n:] if len(body) > recent_sim_n else body
-    recent_sim = []  # (sim_int, url)
-    for row in recent:
-        url_c = row[4] if len(row) > 4 else ""
-        th = row[6] if len(row) > 6 else ""
-        sh = row[7] if len(row) > 7 else ""
-        url = row[3] if len(row) > 3 else ""
-        if url_c:
-            url_set.add(url_c)
-        if th:
-            titlehash_set.add(th)
-        if sh.isdigit():
-            recent_sim.append((int(sh), url))
-    return url_set, titlehash_set, recent_sim
-
-def find_near_duplicate(sim_int: int, recent_sim, max_hamming: int):
-    for s, url in recent_sim:
-        if hamming(sim_int, s) <= max_hamming:
-            return url
-    return ""
+def http_get(url: str, ua: str, timeout_sec: int, retries: int, backoff_sec: float, validators: dict = None):
+    """validators({"etag","last_modified"})가 있으면 조건부 GET을 보냅니다.
+    변경이 없으면 서버가 304를 돌려주며, 이 경우 본문은 비어 있습니다.
+    """
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    sess = get_session(ua, retries, backoff_sec)
+    with _LIMITER.slot(url) as pause, backoff_hook(pause):
+        r = sess.get(url, headers=headers or None, timeout=timeout_sec, allow_redirects=True)
+    r.raise_for_status()
+    return r
+
+def response_validators(r) -> dict:
+    """응답 헤더에서 다음 조건부 GET에 쓸 검증값을 뽑습니다(없으면 {})."""
+    out = {}
+    if r.headers.get("ETag"):
+        out["etag"] = r.headers["ETag"]
+    if r.headers.get("Last-Modified"):
+        out["last_modified"] = r.headers["Last-Modified"]
+    return out
 
 # ----------------------------
-# RSS 수집(UA + requests → feedparser)
+# 수집 계획: 같은 피드 URL은 한 번만 받기
 # ----------------------------
-def collect_rss(ua: str, timeout_sec: int, retries: int, backoff_sec: float, gov_pages: int):
-    out = []
-    for source_name, feed_url in RSS_SOURCES:
-        # HTML 토큰 소스 처리
-        if (feed_url or '').startswith('HTML:'):
-            try:
-                if feed_url == 'HTML:mohw':
-                    out.extend(crawl_mohw_press(ua, timeout_sec, retries, backoff_sec, pages=gov_pages))
-                elif feed_url == 'HTML:moel':
-                    out.extend(crawl_moel_press(ua, timeout_sec, retries, backoff_sec, pages=gov_pages))
-            except Exception:
-                pass
-            continue
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+def normalize_feed_url(url: str):
+    """피드 URL 비교용 키(스킴/호스트 소문자, 기본 포트 제거, 쿼리 디코딩 후 정렬, fragment 무시)."""
+    url = (url or "").strip()
+    if url.startswith("HTML:"):
+        return url
+    p = urlsplit(url)
+    scheme = p.scheme.lower()
+    host = (p.hostname or "").lower()
+    if p.port and str(p.port) != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{p.port}"
+    query = tuple(sorted(parse_qsl(p.query, keep_blank_values=True)))
+    return (scheme, host, p.path or "/", query)
 
+def _pick_label(labels, rule: str):
+    if rule == "last":
+        return labels[-1]
+    if rule == "shortest":
+        return min(labels, key=len)  # 길이가 같으면 먼저 나온 이름
+    return labels[0]
+
+def plan_sources(sources, rule: str = None):
+    """[Source 또는 (source_name, feed_url)] → [(Source, label, labels)].
+
+    같은 피드(normalize_feed_url 기준)는 처음 나온 위치에 하나로 묶고,
+    항목의 source 이름(label)은 rule(FEED_LABEL_RULE)로 고릅니다.
+    """
+    rule = rule or FEED_LABEL_RULE
+    groups = {}
+    for entry in sources:
+        src = as_source(entry)
+        g = groups.setdefault((src.kind, normalize_feed_url(src.url)), [src, []])
+        if src.name not in g[1]:
+            g[1].append(src.name)
+    return [(src, _pick_label(labels, rule), labels) for src, labels in groups.values()]
+
+# ----------------------------
+# 피드 파싱(스트리밍 우선, feedparser 폴백)
+# ----------------------------
+def parse_feed_entries(content: bytes, rec: dict = None, limit: int = None, mode: str = None) -> list:
+    """앞쪽 limit개 항목(title/link/published/updated). rec가 있으면 쓴 파서를 남깁니다."""
+    limit = int(limit or DEFAULTS.get("feed_max_entries", 50))
+    mode = mode or DEFAULTS.get("feed_parser", "stream")
+    parser = "feedparser"
+    entries = None
+    if mode == "stream":
         try:
-            r = http_get(feed_url, ua=ua, timeout_sec=timeout_sec, retries=retries, backoff_sec=backoff_sec)
-            fp = feedparser.parse(r.content)
-        except Exception:
+            entries, parser = parse_entries(content, limit), "stream"
+        except FeedFallback:
+            entries = None
+    if entries is None:
+        entries = feedparser.parse(content).get("entries", [])[:limit]
+    if rec is not None:
+        rec["parser"] = parser
+    return entries
+
+# ----------------------------
+# 소스 수집(파서 플러그인: rss / board)
+# ----------------------------
+def _collect_source(source_name: str, source: Source, ua: str, timeout_sec: int, retries: int, backoff_sec: float,
+                    gov_pages: int, validators: dict = None, report: RunReport = None, watermark: Watermark = None):
+    """소스 하나를 그 종류(source.kind)의 파서 플러그인으로 수집합니다.
+    실패하면 빈 리스트(다른 소스에 영향 없음, 오류는 report에 기록).
+
+    반환: (items, status)
+    - status["not_modified"]: 304로 본문/파싱/항목 처리를 건너뛰었는지
+    - status["validators"]: 다음 실행에 보낼 검증값(None이면 기존 값 유지)
+    - status["watermark"]: 다음 실행용 고수위(None이면 기존 값 유지)
+    watermark가 있으면 이미 본 글/그보다 오래된 글은 태그·해시 전에 건너뜁니다.
+    """
+    report = report or RunReport()
+    source = as_source((source_name, source) if isinstance(source, str) else source)
+    rec = report.source(source_name)
+    rec["url"] = source.url
+    try:
+        parser = get_parser(source.kind)
+    except ValueError as e:
+        rec["error"] = repr(e)
+        return [], {"not_modified": False, "validators": None, "watermark": None}
+    t0 = time.monotonic()
+    try:
+        return parser(source, source_name, ua, timeout_sec, retries, backoff_sec, gov_pages, validators, report, rec,
+                      watermark)
+    finally:
+        rec["wall_sec"] += time.monotonic() - t0
+
+@register_parser("board")
+def _collect_board(source, source_name, ua, timeout_sec, retries, backoff_sec, gov_pages, validators, report, rec,
+                   watermark):
+    """HTML 게시판 목록(options: page_url / link_selector / base / item_name)."""
+    status = {"not_modified": False, "validators": None, "watermark": None}
+    on_response = lambda r: report.record_response(source_name, r)
+    spec = {"page_url": source.url, **(source.options or {})}
+    counts = _board_counts()
+    try:
+        items = crawl_board(spec, ua, timeout_sec, retries, backoff_sec, pages=int(source.opt("pages", gov_pages)),
+                            on_response=on_response, watermark=watermark, name=source_name, counts=counts)
+    except Exception as e:
+        rec["error"] = repr(e)
+        return [], status
+    # 피드와 같은 기준: entries = 목록에서 읽은 행, dropped_* = 고수위 / 제목·링크 없음 / 태그 없음
+    for k, v in counts.items():
+        rec[k] += v
+    for it in items:
+        report.alias(it["source"], source_name)
+    if watermark is not None:
+        status["watermark"] = watermark.to_dict()
+    return items, status
+
+@register_parser("rss")
+def _collect_feed(source, source_name, ua, timeout_sec, retries, backoff_sec, gov_pages, validators, report, rec,
+                  watermark):
+    """RSS 2.0 / Atom 피드(조건부 GET → 파싱 → 고수위 → 태그)."""
+    status = {"not_modified": False, "validators": None, "watermark": None}
+    feed_url = source.url
+    try:
+        r = http_get(feed_url, ua=ua, timeout_sec=timeout_sec, retries=retries, backoff_sec=backoff_sec,
+                     validators=validators)
+        report.record_response(source_name, r)
+        if r.status_code == 304:
+            status["not_modified"] = rec["not_modified"] = True
+            return [], status
+        t0 = time.monotonic()
+        entries = parse_feed_entries(r.content, rec)
+        rec["parse_sec"] += time.monotonic() - t0
+    except Exception as e:
+        rec["error"] = repr(e)
+        status_code = getattr(getattr(e, "response", None), "status_code", None)
+        if status_code is not None:
+            rec["http_status"] = status_code
+        return [], status
+    status["validators"] = response_validators(r)
+
+    out = []
+    rec["entries"] += len(entries)
+    for e in entries:
+        title = normalize_ws(e.get("title", ""))
+        link = canonicalize_url(e.get("link", ""))
+        if not title or not link:
+            rec["dropped_invalid"] += 1
             continue
 
-        for e in getattr(fp, "entries", [])[:50]:
-            title = normalize_ws(getattr(e, "title", ""))
-            link = canonicalize_url(getattr(e, "link", ""))
-            if not title or not link:
-                continue
+        dt_raw = e.get("published") or e.get("updated")
+        published_at = normalize_date(dt_raw)
 
-            dt_raw = getattr(e, "published", None) or getattr(e, "updated", None) or getattr(e, "pubDate", None)
-            published_at = ""
-            if dt_raw:
-                try:
-                    dt = dateparser.parse(dt_raw)
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    published_at = dt.isoformat()
-                except Exception:
-                    published_at = ""
-
-            tags = pick_tags(title)
-            if not tags:
+        if watermark is not None:
+            if watermark.is_known(link, published_at):
+                rec["dropped_watermark"] += 1
                 continue
+            watermark.see(link, published_at)
+
+        t0 = time.monotonic()
+        tags = pick_tags(title)
+        rec["tag_sec"] += time.monotonic() - t0
+        if not tags:
+            rec["dropped_tag"] += 1
+            continue
+
+        out.append({
+            "published_at": published_at,
+            "source": source_name,
+            "title": title,
+            "url": link,
+            "url_canonical": link,
+            "tags": ",".join(tags),
+        })
+    if watermark is not None:
+        status["watermark"] = watermark.to_dict()
+    return out, status
 
-            out.append({
-                "published_at": published_at,
-                "source": source_name,
-                "title": title,
-                "url": link,
-                "url_canonical": link,
-                "tags": ",".join(tags),
-            })
+def collect_rss(ua: str, timeout_sec: int, retries: int, backoff_sec: float, gov_pages: int,
+                concurrency: int = None, per_host: int = None, validators: dict = None, stats: dict = None,
+                sources=None, report: RunReport = None, watermarks: dict = None, health: HealthTracker = None,
+                workers: int = None):
+    """sources(기본 RSS_SOURCES, Source 또는 (이름, url))를 병렬로 수집합니다.
+
+    - 같은 피드 URL은 한 번만 받습니다(plan_sources, 이름은 FEED_LABEL_RULE).
+    - 동시 요청 수는 전체(concurrency) / 호스트별(per_host) 상한을 넘지 않습니다.
+    - workers가 2 이상이면 호스트 단위로 소스를 나눠 프로세스별로 수집합니다(파싱/태그가 코어 수만큼 병렬).
+      같은 호스트는 한 프로세스에 모이므로 호스트별 상한은 그대로이고, 전체 상한은 프로세스 수로 나눕니다.
+    - 결과는 sources 순서대로 이어 붙이므로 중복 제거 결과가 실행마다 같습니다(프로세스 수와 무관).
+    - validators({feed_url: {"etag","last_modified"}})가 있으면 조건부 GET을 보냅니다.
+      stats를 넘기면 stats["not_modified"](304 소스 수)와 stats["validators"](갱신된 검증값)를 채웁니다.
+    - watermarks({source_label: 고수위})가 있으면 지난 실행에서 본 글부터는 건너뛰고,
+      stats["watermarks"]에 갱신된 고수위를 채웁니다(None이면 고수위를 쓰지 않음).
+    - health(HealthTracker)가 있으면 브레이커가 열린 소스는 건너뛰고, 냉각이 끝난 소스는
+      재시도 없는 짧은 요청 한 번으로 시험한 뒤 결과를 기록합니다.
+    - report(RunReport)를 넘기면 소스별 시간/바이트/상태/항목/오류를 기록합니다.
+    """
+    validators = validators or {}
+    report = report or RunReport()
+    plan = plan_sources(RSS_SOURCES if sources is None else sources)
+    concurrency = int(concurrency or DEFAULTS.get("fetch_concurrency", 8))
+    per_host = int(per_host or DEFAULTS.get("fetch_per_host", 2))
+    workers = int(workers or DEFAULTS.get("shard_workers", 1))
+    opts = dict(ua=ua, timeout_sec=timeout_sec, retries=retries, backoff_sec=backoff_sec, gov_pages=gov_pages,
+                concurrency=concurrency, per_host=per_host)
+
+    if workers > 1 and len(plan) > 1:
+        results = _collect_sharded(plan, workers, opts, validators, report, watermarks, health)
+    else:
+        results = _collect_plan(plan, validators=validators, report=report, watermarks=watermarks, health=health,
+                                **opts)
+
+    out = []
+    new_validators = dict(validators)
+    new_watermarks = dict(watermarks or {})
+    not_modified = 0
+    for (src, label, labels), (items, status) in zip(plan, results):
+        report.source(label)["labels"] = list(labels)
+        out.extend(items)
+        if status["watermark"] is not None:
+            new_watermarks[label] = status["watermark"]
+        if status["not_modified"]:
+            not_modified += 1
+        elif status["validators"] is not None:
+            if status["validators"]:
+                new_validators[src.url] = status["validators"]
+            else:
+                new_validators.pop(src.url, None)
+    if stats is not None:
+        stats["not_modified"] = not_modified
+        stats["validators"] = new_validators
+        stats["watermarks"] = new_watermarks
     return out
 
+def _collect_plan(plan, ua: str, timeout_sec: int, retries: int, backoff_sec: float, gov_pages: int, concurrency: int,
+                  per_host: int, validators: dict, report: RunReport, watermarks: dict = None,
+                  health: HealthTracker = None):
+    """한 프로세스 안에서 plan을 스레드로 수집합니다. 반환: plan 순서의 [(items, status)]."""
+    if (_LIMITER.max_total, _LIMITER.per_host) != (concurrency, per_host):
+        configure_fetch_limits(concurrency, per_host)
+    grace_hours = float(DEFAULTS.get("watermark_grace_hours", 6))
+    probe_timeout = min(timeout_sec, int(DEFAULTS.get("probe_timeout_sec", 5)))
+    skipped = {"not_modified": False, "validators": None, "watermark": None}
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as ex:
+        futures = []
+        for src, label, _ in plan:
+            wm = None if watermarks is None else Watermark(watermarks.get(label), grace_hours=grace_hours)
+            decision = health.decide(label) if health is not None else None
+            report.source(label)["breaker"] = decision or ""
+            if decision == OPEN:
+                report.source(label)["url"] = src.url
+                futures.append(None)
+            elif decision == PROBE:
+                # 냉각 뒤 시험: 재시도 없이 짧은 타임아웃, 게시판은 1페이지만
+                futures.append(ex.submit(_collect_source, label, src, ua, probe_timeout, 0, backoff_sec, 1,
+                                         validators.get(src.url), report, wm))
+            else:
+                futures.append(ex.submit(_collect_source, label, src, ua, timeout_sec, retries, backoff_sec,
+                                         gov_pages, validators.get(src.url), report, wm))
+        results = [([], skipped) if f is None else f.result() for f in futures]
+
+    if health is not None:
+        for (src, label, _), f in zip(plan, futures):
+            if f is None:
+                continue
+            rec = report.source(label)
+            if rec["error"]:
+                health.record_failure(label, rec["error"], rec["wall_sec"])
+            else:
+                health.record_success(label, rec["wall_sec"])
+    return results
+
+# ----------------------------
+# 프로세스 샤드 수집
+# ----------------------------
+def _source_host(src: Source) -> str:
+    return urlsplit(src.opt("page_url") or src.url).netloc.lower()
+
+def shard_plan(plan, workers: int):
+    """plan 인덱스를 호스트 단위로 workers개 묶음에 나눕니다(소스가 많은 호스트부터 가장 작은 묶음에)."""
+    by_host = {}
+    for i, (src, _, _) in enumerate(plan):
+        by_host.setdefault(_source_host(src), []).append(i)
+    shards = [[] for _ in range(max(1, workers))]
+    for idxs in sorted(by_host.values(), key=len, reverse=True):
+        min(shards, key=len).extend(idxs)
+    return [sorted(sh) for sh in shards if sh]
+
+def _shard_worker(job):
+    """샤드 프로세스: 자기 몫의 plan을 수집하고 결과/리포트/상태를 돌려줍니다."""
+    plan, opts, validators, watermarks, health_state, defaults = job
+    DEFAULTS.update(defaults)  # spawn 프로세스는 config를 새로 읽으므로 부모에서 바꾼 설정을 맞춥니다.
+    report = RunReport()
+    health = None if health_state is None else HealthTracker(health_state)
+    DATES.reset_stats()
+    results = _collect_plan(plan, validators=validators, report=report, watermarks=watermarks, health=health, **opts)
+    return (results, report.sources, report._aliases, dict(DATES.counts),
+            None if health is None else health.sources)
+
+def _collect_sharded(plan, workers: int, opts: dict, validators: dict, report: RunReport, watermarks, health):
+    shards = shard_plan(plan, workers)
+    # 전체 동시 요청 상한은 프로세스 수로 나눕니다(호스트는 한 프로세스에만 있으므로 호스트별 상한은 그대로).
+    opts = {**opts, "concurrency": max(1, -(-opts["concurrency"] // len(shards)))}
+    jobs = []
+    for idxs in shards:
+        sub = [plan[i] for i in idxs]
+        labels = [label for _, label, _ in sub]
+        jobs.append((
+            sub, opts,
+            {src.url: validators[src.url] for src, _, _ in sub if src.url in validators},
+            None if watermarks is None else {k: watermarks[k] for k in labels if k in watermarks},
+            None if health is None else {k: health.sources[k] for k in labels if k in health.sources},
+            dict(DEFAULTS),
+        ))
+    # fork는 부모의 세션/스레드 상태를 복사하므로 spawn으로 깨끗한 프로세스를 띄웁니다.
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(jobs), mp_context=ctx) as ex:
+        outs = list(ex.map(_shard_worker, jobs))
+
+    results = [None] * len(plan)
+    for idxs, (res, sources, aliases, date_counts, health_sources) in zip(shards, outs):
+        for i, r in zip(idxs, res):
+            results[i] = r
+        report.merge(sources, aliases)
+        DATES.add_counts(date_counts)
+        if health is not None and health_sources:
+            health.sources.update(health_sources)
+    return results
+
 # ----------------------------
 # 메인
 # ----------------------------
-def main():
-    sh = open_sheet()
+def main(reconcile: bool = False, sh=None, sources=None, workers: int = None) -> RunReport:
+    """reconcile=True 이면 로컬 중복 인덱스를 NEWS 탭 전체로 강제 재구성합니다.
+
+    META는 시작할 때 한 번 읽고(MetaSession), 설정/결과 기록은 끝(또는 오류 시)에 한 번에 씁니다.
+    sh / sources를 넘기면 해당 스프레드시트·소스 목록으로 실행합니다(벤치마크 등).
+    sources가 없으면 소스 레지스트리(config + SOURCES 탭)를 씁니다.
+    workers는 수집 프로세스 수(META shard_workers보다 우선)입니다.
+    """
+    sh = sh or open_sheet()
     ws_news, ws_meta = ensure_tabs(sh)
+    meta = MetaSession(ws_meta)
+    report = RunReport()
+    try:
+        _run(sh, ws_news, meta, reconcile, report, sources, workers)
+    except Exception as e:
+        # META에 에러 기록
+        report.error = repr(e)
+        meta.set("last_error", repr(e))
+        meta.set("last_run_at", datetime.now(timezone.utc).isoformat())
+        _save_report(meta, report)
+        try:
+            meta.commit()
+        except Exception:
+            pass
+        raise
+    _save_report(meta, report)
+    meta.commit()
+    return report
 
+def _save_report(meta, report: RunReport):
+    """실행 리포트를 로컬 JSON으로 쓰고 요약을 META(last_run_report)에 남깁니다."""
+    report.finish()
+    try:
+        report.write()
+    except Exception:
+        pass  # 리포트 파일 실패로 실행 결과를 버리지 않습니다
+    meta.set("last_run_report", json.dumps(report.summary(), ensure_ascii=False, sort_keys=True))
+
+def _settings(meta) -> dict:
+    """META 설정값(없으면 기본값)."""
+    rss_enabled_raw = meta.get("rss_enabled")
+    if meta.get("gov_pages") == "":
+        meta.set("gov_pages", str(DEFAULTS.get("gov_pages", 1)))
+    return {
+        "max_hamming": int(meta.get("max_hamming") or DEFAULTS["max_hamming"]),
+        "fetch_timeout_sec": int(meta.get("fetch_timeout_sec") or DEFAULTS["fetch_timeout_sec"]),
+        "rss_enabled": DEFAULTS["rss_enabled"] if rss_enabled_raw == "" else (rss_enabled_raw.strip().upper() == "TRUE"),
+        "gov_pages": int(meta.get("gov_pages") or DEFAULTS.get("gov_pages", 1)),
+        "ua": DEFAULTS["user_agent"],
+        "retries": int(DEFAULTS.get("http_retries", 2)),
+        "backoff": float(DEFAULTS.get("http_backoff_sec", 1.2)),
+        "archive_keep_days": int(meta.get("archive_keep_days") or DEFAULTS.get("archive_keep_days", 0)),
+        "shard_workers": int(meta.get("shard_workers") or DEFAULTS.get("shard_workers", 1)),
+    }
+
+def _run(sh, ws_news, meta, reconcile: bool, report: RunReport, sources=None, workers: int = None):
     # META 설정값 읽기(없으면 기본값)
-    max_hamming = int(meta_get(ws_meta, "max_hamming") or DEFAULTS["max_hamming"])
-    recent_sim_n = int(meta_get(ws_meta, "recent_sim_n") or DEFAULTS["recent_sim_n"])
-    fetch_timeout_sec = int(meta_get(ws_meta, "fetch_timeout_sec") or DEFAULTS["fetch_timeout_sec"])
-    rss_enabled_raw = meta_get(ws_meta, "rss_enabled")
-    gov_pages_raw = meta_get(ws_meta, "gov_pages")
-    rss_enabled = DEFAULTS["rss_enabled"] if rss_enabled_raw == "" else (rss_enabled_raw.strip().upper() == "TRUE")
-    if gov_pages_raw == "":
-        meta_set(ws_meta, "gov_pages", str(DEFAULTS.get("gov_pages", 1)))
-
-    ua = DEFAULTS["user_agent"]
-    retries = int(DEFAULTS.get("http_retries", 2))
-    backoff = float(DEFAULTS.get("http_backoff_sec", 1.2))
-
-    meta_set(ws_meta, "last_run_at", datetime.now(timezone.utc).isoformat())
-    meta_set(ws_meta, "last_error", "")
-
-    if not rss_enabled:
-        meta_set(ws_meta, "last_inserted_count", "0")
+    cfg = _settings(meta)
+    if workers:
+        cfg["shard_workers"] = int(workers)
+
+    meta.set("last_run_at", datetime.now(timezone.utc).isoformat())
+    meta.set("last_error", "")
+
+    if not cfg["rss_enabled"]:
+        meta.set("last_inserted_count", "0")
+        return
+
+    # 로컬 중복 인덱스(NEWS 전체). 시트(또는 Postgres) 끝과 어긋날 때만 전체 재구성.
+    if sources is None:
+        sources = load_registry(records=SheetSources(sh).records())
+    store = _open_store()
+    index = DedupeIndex(max_hamming=cfg["max_hamming"])
+    try:
+        with report.stage("reconcile"):
+            _reconcile(sh, ws_news, meta, index, store, force=reconcile)
+        before = (index.row_count or 0, index.last_url)
+        new_rows = _run_pipeline(ws_news, meta, index, cfg, report, sources, store=store)
+        if store is None:
+            _maybe_archive(sh, ws_news, meta, index, cfg, report)
+        _publish_snapshot(ws_news, meta, index, store, before, new_rows, report)
+    finally:
+        index.close()
+
+def _open_store():
+    """NEWS_STORAGE가 Postgres 모드면 PostgresStore, 시트 모드면 None."""
+    return None if storage_mode() == "sheets" else PostgresStore()
+
+def _reconcile(sh, ws_news, meta, index, store, force: bool = False):
+    if store is None:
+        index.reconcile(ws_news, force=force)
+        _reconcile_archive(sh, meta, index, force=force)
+    else:
+        index.reconcile_store(store, force=force)
+
+def _make_writer(ws_news, index, store):
+    """시트 모드: NEWS 고정 범위 기록기 / Postgres 모드: COPY 기록기(+ NEWS 미러)."""
+    chunk_rows = int(DEFAULTS.get("write_chunk_rows", 500))
+    max_retries = int(DEFAULTS.get("write_retries", 5))
+    if store is None:
+        # 인덱스가 시트 끝과 맞춰져 있으므로 다음 빈 행 = 헤더(1) + 데이터 행 수 + 1
+        return SheetWriter(ws_news, start_row=(index.row_count or 0) + 2, chunk_rows=chunk_rows, max_retries=max_retries)
+    mirror = None
+    if storage_mode() == "postgres+sheets":
+        # 미러는 인덱스와 행 수가 다를 수 있어 url_canonical 열 길이로 다음 빈 행을 찾습니다.
+        start_row = max(1, len(ws_news.col_values(COL_URL_CANONICAL + 1))) + 1
+        mirror = SheetWriter(ws_news, start_row=start_row, chunk_rows=chunk_rows, max_retries=max_retries)
+    return MirrorWriter(store.writer(), mirror)
+
+def _reconcile_archive(sh, meta, index, force: bool = False):
+    """보관 목록의 행 수와 인덱스의 보관 키가 어긋나면(캐시 유실 등) 보관 탭에서 다시 읽습니다."""
+    catalog = load_catalog(meta)
+    total = sum(v.get("rows", 0) for v in catalog.values())
+    if not force and total == index.archived_rows:
         return
+    index.rebuild_archived(archive_tabs(archive_book(sh), catalog) if catalog else [], total)
 
-    url_set, titlehash_set, recent_sim = load_indexes(ws_news, recent_sim_n)
+def _maybe_archive(sh, ws_news, meta, index, cfg: dict, report: RunReport):
+    """보관 주기가 됐으면 오래된 NEWS 행을 월별 탭으로 옮깁니다(실패해도 이번 수집 결과는 유지)."""
+    if cfg["archive_keep_days"] <= 0 or not archive_due(meta, float(DEFAULTS.get("archive_every_hours", 24))):
+        return
+    with report.stage("archive"):
+        try:
+            archive_news(sh, ws_news, meta, index, cfg["archive_keep_days"])
+            meta.set("last_archive_error", "")
+        except Exception as e:
+            index.rollback()
+            meta.set("last_archive_error", repr(e))
+            # NEWS 삭제 여부가 불확실하므로 다음 실행에서 시트 끝 확인으로 인덱스를 맞춥니다.
+
+def _publish_snapshot(ws_news, meta, index, store, before, new_rows, report: RunReport):
+    """NEWS Parquet 스냅샷 갱신(news_app용, 실패해도 이번 수집 결과는 유지)."""
+    location = snapshot_location()
+    if not location:
+        return
 
+    def full_rows():
+        if store is not None:
+            return store.rows()
+        values = ws_news.get_all_values()
+        return values[1:] if values else []
+
+    with report.stage("snapshot"):
+        try:
+            stats = publish_snapshot(location, before, new_rows, (index.row_count or 0, index.last_url), full_rows)
+            meta.set("last_snapshot", json.dumps(stats, ensure_ascii=False, sort_keys=True))
+            meta.set("last_snapshot_error", "")
+        except Exception as e:
+            meta.set("last_snapshot_error", repr(e))
+
+def _run_pipeline(ws_news, meta, index, cfg: dict, report: RunReport, sources=None, store=None):
+    """수집 → 중복 판정(로컬 인덱스) → NEWS 기록(시트 또는 Postgres). 이번에 기록한 행을 돌려줍니다."""
     inserted = 0
     new_rows = []
+    writer = _make_writer(ws_news, index, store)
 
     # 1) RSS(전문지) + HTML 크롤링(정부)
-    gov_pages = int(meta_get(ws_meta, "gov_pages") or DEFAULTS.get("gov_pages", 1))
-    items = collect_rss(ua=ua, timeout_sec=fetch_timeout_sec, retries=retries, backoff_sec=backoff, gov_pages=gov_pages)
+    collect_stats = {}
+    health = HealthTracker.load()
+    DATES.reset_stats()
+    with report.stage("fetch"):
+        items = collect_rss(
+            ua=cfg["ua"], timeout_sec=cfg["fetch_timeout_sec"], retries=cfg["retries"], backoff_sec=cfg["backoff"],
+            gov_pages=cfg["gov_pages"],
+            concurrency=int(DEFAULTS.get("fetch_concurrency", 8)), per_host=int(DEFAULTS.get("fetch_per_host", 2)),
+            validators=load_json(VALIDATORS_FILE), stats=collect_stats, report=report, sources=sources,
+            watermarks=load_json(WATERMARKS_FILE), health=health, workers=cfg["shard_workers"],
+        )
+    # 소스 상태는 기록 성공 여부와 상관없이 남깁니다(다음 실행의 브레이커 판단용).
+    health.save()
+    meta.set("source_health", json.dumps(health.meta_summary(), ensure_ascii=False, sort_keys=True))
+    # 소스별 parse/tag 시간(수집 스레드에서 잰 값)의 합
+    report.add_stage("parse", sum(s["parse_sec"] for s in report.sources.values()))
+    report.add_stage("tag", sum(s["tag_sec"] for s in report.sources.values()))
+    report.date_parse = DATES.stats()
+
+    # 2) Google News 리다이렉트 → 원문 URL(언론사 피드와 같은 기사를 URL 단계에서 잡도록)
+    with report.stage("resolve"):
+        resolve_stats = _resolve_redirects(items, cfg)
+    meta.set("last_gnews_resolve", json.dumps(resolve_stats, ensure_ascii=False, sort_keys=True))
+
+    try:
+        with report.stage("simhash"):
+            sims = simhash64_batch(it["title"] for it in items)
+        t0 = time.monotonic()
+        for it, sh_str in zip(items, sims):
+            title_hash = sha256_hex(normalize_ws(it["title"]).lower())
+
+            if index.has_url(it["url_canonical"]):
+                report.count(it["source"], "dropped_url")
+                continue
+            if index.has_title(title_hash):
+                report.count(it["source"], "dropped_title")
+                continue
 
+            dup_of = ""
+            if sh_str.isdigit():
+                dup_of = index.near_duplicate(int(sh_str), cfg["max_hamming"])
+            if dup_of:
+                # 근접중복은 버리지 않고 duplicate_of를 채워 기록합니다.
+                report.count(it["source"], "near_dup")
+
+            # ✅ summary 컬럼 없음(9열)
+            row = [
+                it["published_at"],
+                it["source"],
+                it["title"],
+                it["url"],
+                it["url_canonical"],
+                it["tags"],
+                title_hash,
+                sh_str,
+                dup_of,
+            ]
+            index.add(it["url_canonical"], title_hash, sh_str, it["url"])
+            writer.add(row)
+            new_rows.append(row)
+            inserted += 1
+            report.count(it["source"], "inserted")
+
+        writer.close()
+        # 루프 안에서 청크 기록이 섞이므로 기록 시간을 빼서 dedupe 시간을 구합니다.
+        report.add_stage("write", writer.write_sec)
+        report.add_stage("dedupe", time.monotonic() - t0 - writer.write_sec)
+    except Exception:
+        # 시트 기록이 끝나지 않았으면 인덱스도 되돌립니다(일부 청크가 기록됐다면 다음 실행에서 reconcile).
+        index.rollback()
+        raise
+    index.commit()
+    # 기록이 끝난 뒤에 검증값/고수위를 저장해야, 중간 실패 시 다음 실행이 304로 항목을 놓치지 않습니다.
+    save_json(VALIDATORS_FILE, collect_stats.get("validators", {}))
+    save_json(WATERMARKS_FILE, collect_stats.get("watermarks", {}))
+
+    meta.set("last_inserted_count", str(inserted))
+    meta.set("last_not_modified_count", str(collect_stats.get("not_modified", 0)))
+    meta.set("last_write_rows_per_sec", f"{writer.rows_per_sec:.1f}")
+    if isinstance(writer, MirrorWriter):
+        meta.set("last_mirror_error", writer.mirror_error)
+    # 설정된 호스트별 풀 크기("*" = 기본)와 호스트별 요청/새 연결/재사용 수(keep-alive 효과 확인용)
+    meta.set("last_http_pool", json.dumps({"sizes": pool_sizes(), "hosts": pool_stats()}, ensure_ascii=False, sort_keys=True))
+    return new_rows
+
+def _resolve_redirects(items, cfg: dict):
+    """리다이렉트 링크 항목의 url_canonical을 원문 URL로 바꿉니다(url은 그대로)."""
+    # 기사 ID로 풀리지 않는 새 형식만 요청하므로 재시도 없이 짧게 끊습니다(실패는 gnews_retry_hours 뒤 다시).
+    timeout = min(cfg["fetch_timeout_sec"], int(DEFAULTS.get("gnews_fetch_timeout_sec", 5)))
+    resolver = RedirectResolver.load(lambda u: http_get(u, cfg["ua"], timeout, 0, cfg["backoff"]))
+    targets = resolver.resolve_all(it["url"] for it in items)
     for it in items:
-        title_hash = sha256_hex(normalize_ws(it["title"]).lower())
+        target = targets.get(it["url"])
+        if target:
+            it["url_canonical"] = canonicalize_url(target)
+    # 해석 결과는 기록 성공 여부와 상관없이 유효하므로 바로 저장합니다.
+    resolver.save()
+    return resolver.stats
 
-        if it["url_canonical"] in url_set:
-            continue
-        if title_hash in titlehash_set:
-            continue
+# ----------------------------
+# 상주 모드(--serve)
+# ----------------------------
+def _serve_settings(meta: MetaSession, workers: int = None) -> dict:
+    cfg = _settings(meta)
+    if workers:
+        cfg["shard_workers"] = int(workers)
+    return cfg
 
-        sh_str = simhash64(it["title"])
-        dup_of = ""
-        if sh_str.isdigit():
-            dup_of = find_near_duplicate(int(sh_str), recent_sim, max_hamming)
-
-        # ✅ summary 컬럼 없음(9열)
-        row = [
-            it["published_at"],
-            it["source"],
-            it["title"],
-            it["url"],
-            it["url_canonical"],
-            it["tags"],
-            title_hash,
-            sh_str,
-            dup_of,
-        ]
-        new_rows.append(row)
-        inserted += 1
-
-        url_set.add(it["url_canonical"])
-        titlehash_set.add(title_hash)
-        if sh_str.isdigit():
-            recent_sim.append((int(sh_str), it["url"]))
-            if len(recent_sim) > recent_sim_n:
-                recent_sim = recent_sim[-recent_sim_n:]
-
-        time.sleep(0.12)
-
-    if new_rows:
-        ws_news.append_rows(new_rows, value_input_option="RAW")
-
-    meta_set(ws_meta, "last_inserted_count", str(inserted))
+def _serve_sources(sources) -> dict:
+    return {label: src._replace(name=label) for src, label, _ in plan_sources(sources)}
 
-if __name__ == "__main__":
+def serve(sh=None, sources=None, stop: threading.Event = None, max_cycles: int = None, reconcile: bool = False,
+          workers: int = None):
+    """프로세스를 띄워 둔 채 소스마다 적응형 간격(news.scheduler)으로 수집합니다.
+
+    HTTP 커넥션 풀 / 로컬 중복 인덱스 / META 스냅샷 / SOURCES 탭을 메모리에 유지하고,
+    차례가 된 소스만 모아 한 사이클(수집 → 중복 판정 → 기록)로 처리합니다.
+    사이클마다 시트 끝 확인(1회)으로 인덱스를 맞추고, META와 SOURCES 탭은 serve_meta_reload_sec마다 다시 읽습니다.
+    workers는 수집 프로세스 수(META shard_workers보다 우선)입니다.
+    """
+    stop = stop or threading.Event()
+    sh = sh or open_sheet()
+    ws_news, ws_meta = ensure_tabs(sh)
+    meta = MetaSession(ws_meta)
+    cfg = _serve_settings(meta, workers)
+    meta_loaded = time.monotonic()
+    reload_sec = float(DEFAULTS.get("serve_meta_reload_sec", 900))
+
+    sheet_sources = SheetSources(sh) if sources is None else None
+    by_label = _serve_sources(load_registry(records=sheet_sources.records()) if sheet_sources else sources)
+    sched = PollScheduler.load(list(by_label))
+    store = _open_store()
+    index = DedupeIndex(max_hamming=cfg["max_hamming"])
+    _reconcile(sh, ws_news, meta, index, store, force=reconcile)
+
+    cycles = 0
     try:
-        main()
-    except Exception as e:
-        # META에 에러 기록
-        try:
-            sh = open_sheet()
-            _, ws_meta = ensure_tabs(sh)
-            meta_set(ws_meta, "last_error", repr(e))
-            meta_set(ws_meta, "last_run_at", datetime.now(timezone.utc).isoformat())
-        except Exception:
-            pass
-        raise
+        while not stop.is_set() and (max_cycles is None or cycles < max_cycles):
+            if time.monotonic() - meta_loaded >= reload_sec:
+                meta.reload()
+                cfg = _serve_settings(meta, workers)
+                meta_loaded = time.monotonic()
+                if cfg["max_hamming"] != index.max_hamming:
+                    index.close()
+                    index = DedupeIndex(max_hamming=cfg["max_hamming"])
+                if sheet_sources is not None:
+                    fresh = _serve_sources(load_registry(records=sheet_sources.refresh()))
+                    if fresh != by_label:
+                        # 학습한 간격은 상태 파일로 넘겨 이어 갑니다(새 소스는 바로 차례).
+                        sched.save()
+                        by_label = fresh
+                        sched = PollScheduler.load(list(by_label))
+
+            wait = sched.next_due() - time.time()
+            if wait > 0:
+                stop.wait(min(wait, 60))
+                continue
+
+            due = sched.pop_due()
+            report = RunReport()
+            meta.set("last_run_at", datetime.now(timezone.utc).isoformat())
+            meta.set("last_error", "")
+            try:
+                if cfg["rss_enabled"]:
+                    with report.stage("reconcile"):
+                        _reconcile(sh, ws_news, meta, index, store)
+                    before = (index.row_count or 0, index.last_url)
+                    new_rows = _run_pipeline(ws_news, meta, index, cfg, report, [by_label[label] for label in due], store=store)
+                    if store is None:
+                        _maybe_archive(sh, ws_news, meta, index, cfg, report)
+                    _publish_snapshot(ws_news, meta, index, store, before, new_rows, report)
+                else:
+                    meta.set("last_inserted_count", "0")
+            except Exception as e:
+                report.error = repr(e)
+                meta.set("last_error", repr(e))
+
+            for label in due:
+                rec = report.sources.get(label)
+                if report.error or rec is None or rec["error"]:
+                    sched.skip(label)
+                else:
+                    # 고수위를 넘은(=새로 나온) 글 수로 발행 속도를 추정
+                    sched.observe(label, rec["entries"] - rec["dropped_watermark"])
+            sched.save()
+            _save_report(meta, report)
+            meta.set("serve_schedule", json.dumps(
+                {k: round(v.interval_sec) for k, v in sched.sources.items()}, ensure_ascii=False, sort_keys=True))
+            try:
+                meta.commit()
+            except Exception:
+                pass  # 못 쓴 값은 다음 사이클에 함께 기록
+            cycles += 1
+    finally:
+        index.close()
+        close_all()
+    return cycles
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(prog="python -m news.scraper")
+    ap.add_argument("--reconcile", action="store_true", help="로컬 중복 인덱스를 NEWS 탭 전체로 다시 만듭니다")
+    ap.add_argument("--serve", action="store_true", help="상주하며 소스별 적응형 간격으로 계속 수집합니다")
+    ap.add_argument("--workers", type=int, default=None, help="수집 프로세스 수(기본: META/DEFAULTS shard_workers)")
+    args = ap.parse_args()
+    if args.serve:
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
+        serve(stop=stop, reconcile=args.reconcile, workers=args.workers)
+    else:
+        main(reconcile=args.reconcile, workers=args.workers)
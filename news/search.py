@@ -0,0 +1,104 @@
+# hismedi-app/news/search.py
+# -*- coding: utf-8 -*-
+"""news_app 키워드 검색용 역색인.
+
+- 행마다 제목 / 출처 / 태그를 소문자로 합친 문자열(필드 사이 \\x00)을 들고,
+  문자 바이그램 색인(연속된 두 글자 → 행 번호 목록)을 만듭니다.
+- 검색은 기존 필터와 같은 "부분 문자열" 의미입니다(한국어 단어 일부도 찾음).
+  · 2글자 이상: 질의의 바이그램 목록을 짧은 것부터 교집합해 후보를 두고 실제 포함 여부를 확인합니다
+    (2글자면 목록 하나가 곧 답). 비용은 어휘 크기가 아니라 가장 짧은 목록 길이에 비례합니다.
+  · 1글자: 바이그램 어휘에서 그 글자를 포함하는 항목을 훑는 폴백(질의가 짧아 목록을 좁힐 수 없음).
+- 행은 뒤에 덧붙기만 한다고 보고, sync()는 앞부분이 그대로면 새 행만 색인합니다.
+"""
+import threading
+from collections import defaultdict
+from operator import add
+
+FIELDS = ("title", "source", "tags")
+
+
+def _bigrams(s: str):
+    return set(map(add, s, s[1:]))
+
+
+class SearchIndex:
+    def __init__(self, key_col: str = "url_canonical"):
+        self.key_col = key_col
+        self.texts = []
+        self.keys = []
+        self.grams = defaultdict(list)   # 바이그램 -> [행]
+        self._memo = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.texts)
+
+    def reset(self):
+        self.__init__(self.key_col)
+
+    def add(self, fields, keys=None):
+        """fields: 행마다 (title, source, tags) 문자열."""
+        self._memo.clear()
+        keys = keys if keys is not None else [""] * len(fields)
+        grams = self.grams
+        for vals, key in zip(fields, keys):
+            i = len(self.texts)
+            text = "\x00".join(vals).lower()
+            self.texts.append(text)
+            self.keys.append(key)
+            for g in _bigrams(text):
+                grams[g].append(i)
+
+    def sync(self, df) -> "SearchIndex":
+        """DataFrame 행(위치 순서)과 맞춥니다. 앞부분이 같으면 새 행만, 아니면 처음부터."""
+        keys = df[self.key_col].astype(str).tolist() if self.key_col in df.columns else [""] * len(df)
+        with self._lock:
+            n = len(self.keys)
+            if n and (len(keys) < n or keys[n - 1] != self.keys[-1] or keys[0] != self.keys[0]):
+                self.reset()
+                n = 0
+            if len(keys) > n:
+                cols = [
+                    df[c].iloc[n:].fillna("").astype(str).tolist() if c in df.columns else [""] * (len(keys) - n)
+                    for c in FIELDS
+                ]
+                self.add(list(zip(*cols)), keys[n:])
+        return self
+
+    def _by_grams(self, q: str):
+        postings = sorted((self.grams.get(g, ()) for g in _bigrams(q)), key=len)
+        if len(q) == 2:
+            return postings[0]  # 2글자 질의: 목록이 곧 답
+        if not postings[0]:
+            return ()
+        cand = set(postings[0])
+        for rows in postings[1:]:
+            if not cand:
+                break
+            cand.intersection_update(rows)
+        return {i for i in cand if q in self.texts[i]}
+
+    def _by_vocab(self, q: str):
+        """1글자 질의 폴백: 그 글자를 포함하는 바이그램의 행을 합칩니다(행 문자열은 필드 구분자로 늘 3글자 이상)."""
+        hits = set()
+        for g, rows in self.grams.items():
+            if q in g:
+                hits.update(rows)
+        return hits
+
+    def search(self, query: str) -> list:
+        """query를 부분 문자열로 포함하는 행 번호(오름차순)."""
+        q = (query or "").strip().lower()
+        if not q:
+            return list(range(len(self.texts)))
+        with self._lock:
+            hit = self._memo.get(q)
+            if hit is None:
+                if "\x00" in q:
+                    rows = ()  # 필드 구분자는 어느 필드에도 없음
+                else:
+                    rows = self._by_grams(q) if len(q) > 1 else self._by_vocab(q)
+                hit = self._memo[q] = sorted(rows)
+                if len(self._memo) > 256:
+                    self._memo.pop(next(iter(self._memo)))
+            return hit
@@ -0,0 +1,134 @@
+# hismedi-app/news/session.py
+# -*- coding: utf-8 -*-
+"""프로세스 전역 HTTP 세션.
+
+- 호스트별 커넥션 풀 + keep-alive로 TCP/TLS 핸드셰이크를 재사용합니다.
+- 재시도/백오프는 어댑터(urllib3 Retry)가 처리합니다(429/5xx, Retry-After 준수).
+  backoff_hook()으로 재시도 사이 대기 동안 할 일(예: 동시 요청 슬롯 반납)을 스레드별로 걸 수 있습니다.
+- pool_sizes()는 설정된 풀 크기, pool_stats()는 호스트별 요청 수 / 새 연결 수 / 재사용 수입니다
+  (스크래퍼가 둘 다 META last_http_pool에 남깁니다).
+- close_all()은 상주 모드(--serve)가 끝날 때 열린 연결을 닫습니다.
+"""
+import threading
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from news.config import DEFAULTS, HTTP_POOL_SIZES
+
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+_lock = threading.Lock()
+_sessions = {}  # (ua, retries, backoff_sec) -> requests.Session
+_backoff = threading.local()
+
+
+def pool_size_for(host: str) -> int:
+    """호스트별 커넥션 풀 크기(= 호스트별 동시 요청 상한)."""
+    host = (host or "").lower()
+    return int(HTTP_POOL_SIZES.get(host, DEFAULTS.get("fetch_per_host", 2)))
+
+
+def pool_sizes() -> dict:
+    """기본값과 호스트별 재정의를 합친 풀 크기 표."""
+    out = {"*": int(DEFAULTS.get("fetch_per_host", 2))}
+    out.update({h: int(n) for h, n in HTTP_POOL_SIZES.items()})
+    return out
+
+
+@contextmanager
+def backoff_hook(pause):
+    """이 스레드의 재시도 대기를 pause()(컨텍스트 매니저) 안에서 자게 합니다."""
+    prev = getattr(_backoff, "pause", None)
+    _backoff.pause = pause
+    try:
+        yield
+    finally:
+        _backoff.pause = prev
+
+
+class _Retry(Retry):
+    """재시도 사이 대기(백오프 / Retry-After) 동안 backoff_hook의 pause를 적용합니다."""
+
+    def sleep(self, response=None):
+        pause = getattr(_backoff, "pause", None)
+        if pause is None:
+            return super().sleep(response)
+        with pause():
+            super().sleep(response)
+
+
+def _retry(retries: int, backoff_sec: float) -> Retry:
+    return _Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_sec,
+        status_forcelist=RETRY_STATUS,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        # 마지막 시도의 응답을 그대로 돌려받아 raise_for_status()로 판단합니다.
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+
+
+def _new_session(ua: str, retries: int, backoff_sec: float) -> requests.Session:
+    s = requests.Session()
+    s.headers.update({"User-Agent": ua})
+    retry = _retry(retries, backoff_sec)
+    pool_hosts = int(DEFAULTS.get("http_pool_hosts", 32))
+
+    default = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_size_for(""), max_retries=retry)
+    s.mount("http://", default)
+    s.mount("https://", default)
+    # 호스트별 풀 크기 재정의(접두사가 더 긴 어댑터가 우선)
+    for host in HTTP_POOL_SIZES:
+        a = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size_for(host), max_retries=retry)
+        s.mount(f"http://{host}/", a)
+        s.mount(f"https://{host}/", a)
+    return s
+
+
+def get_session(ua: str, retries: int, backoff_sec: float) -> requests.Session:
+    """같은 설정이면 프로세스 안에서 같은 세션(=같은 커넥션 풀)을 돌려줍니다."""
+    key = (ua, int(retries), float(backoff_sec))
+    with _lock:
+        s = _sessions.get(key)
+        if s is None:
+            s = _sessions[key] = _new_session(ua, retries, backoff_sec)
+        return s
+
+
+def pool_stats() -> dict:
+    """호스트별 {requests, connections, reused} 집계.
+
+    requests는 재시도를 포함한 실제 요청 수, connections는 새로 맺은 연결 수입니다.
+    """
+    out = {}
+    with _lock:
+        sessions = list(_sessions.values())
+    for s in sessions:
+        for adapter in {id(a): a for a in s.adapters.values()}.values():
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                st = out.setdefault(pool.host, {"requests": 0, "connections": 0, "reused": 0})
+                st["requests"] += pool.num_requests
+                st["connections"] += pool.num_connections
+    for st in out.values():
+        st["reused"] = max(0, st["requests"] - st["connections"])
+    return out
+
+
+def close_all():
+    """모든 세션을 닫고 비웁니다(다음 get_session은 새 세션)."""
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for s in sessions:
+        s.close()
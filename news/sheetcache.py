@@ -0,0 +1,90 @@
+# hismedi-app/news/sheetcache.py
+# -*- coding: utf-8 -*-
+"""NEWS 탭 증분 로더(news_app용).
+
+- 처음 한 번만 get_all_values로 전체를 읽고, 그 뒤에는 마지막으로 읽은 행 수(n) 뒤의 행만 가져옵니다.
+  한 번의 batch_get으로 ① 헤더(1행) ② 앵커 행(n+1행 = 지난번 마지막 행) ③ n+2행부터 끝까지를 읽습니다.
+- 헤더가 바뀌었거나 앵커 행이 지난번과 다르면(행 삭제 / 보관 이동 / 시트 축소) 전체를 다시 읽습니다.
+  스크래퍼는 NEWS에 행을 덧붙이기만 하므로, 그 밖의 경우 새로 고칠 때 드는 비용은 새 행 수에 비례합니다.
+- 파싱된 프레임(parse로 만든 파생 열 포함)은 로더가 들고 있어 이미 읽은 행은 다시 파싱하지 않습니다.
+- 값은 get_all_values와 같은 문자열 그대로 둡니다(get_all_records처럼 숫자로 바꾸지 않음).
+"""
+import threading
+
+import pandas as pd
+from gspread.utils import rowcol_to_a1
+
+
+def _trim(row) -> list:
+    row = [str(v) for v in (row or [])]
+    while row and row[-1] == "":
+        row.pop()
+    return row
+
+
+def _col_letter(n: int) -> str:
+    return rowcol_to_a1(1, max(1, int(n))).rstrip("0123456789")
+
+
+class DeltaSheetLoader:
+    """open_ws() -> 워크시트, parse(frame) -> 파생 열을 붙인 frame(새 행에만 적용)."""
+
+    def __init__(self, open_ws, parse=None):
+        self.open_ws = open_ws
+        self.parse = parse
+        self.ws = None
+        self.header = []
+        self.anchor = []  # 마지막으로 읽은 행(앞뒤 빈칸 정리)
+        self.n_rows = 0   # 헤더를 뺀 행 수(중간의 빈 행 포함)
+        self.frame = None
+        self.stats = {"full_loads": 0, "delta_loads": 0, "rows_fetched": 0}
+        self._lock = threading.Lock()
+
+    def _frame(self, rows) -> pd.DataFrame:
+        width = len(self.header)
+        df = pd.DataFrame([(list(r) + [""] * width)[:width] for r in rows], columns=self.header, dtype=object)
+        return self.parse(df) if self.parse is not None else df
+
+    def _full(self, ws):
+        values = ws.get_all_values()
+        self.header = _trim(values[0]) if values else []
+        rows = values[1:]
+        self.n_rows = len(rows)
+        self.anchor = _trim(rows[-1]) if rows else list(self.header)
+        self.frame = self._frame(rows)
+        self.stats["full_loads"] += 1
+        self.stats["rows_fetched"] += len(rows)
+
+    def _delta(self, ws) -> bool:
+        """새 행만 덧붙임. 전체를 다시 읽어야 하면 False."""
+        last = _col_letter(max(ws.col_count, len(self.header)))
+        head, anchor, tail = ws.batch_get([
+            f"A1:{last}1",
+            f"A{self.n_rows + 1}:{last}{self.n_rows + 1}",
+            f"A{self.n_rows + 2}:{last}",
+        ])
+        if _trim(head[0] if head else []) != self.header:
+            return False
+        if _trim(anchor[0] if anchor else []) != self.anchor:
+            return False
+        rows = list(tail)
+        self.stats["delta_loads"] += 1
+        if rows:
+            self.frame = pd.concat([self.frame, self._frame(rows)], ignore_index=True)
+            self.n_rows += len(rows)
+            self.anchor = _trim(rows[-1])
+            self.stats["rows_fetched"] += len(rows)
+        return True
+
+    def refresh(self) -> pd.DataFrame:
+        """최신 프레임. 반환값은 공유 상태이므로 고쳐 쓰려면 복사해서 쓰세요."""
+        with self._lock:
+            if self.ws is None:
+                self.ws = self.open_ws()
+            if self.frame is None or not self.header or not self._delta(self.ws):
+                self._full(self.ws)
+            return self.frame
+
+    def reset(self):
+        with self._lock:
+            self.frame = None
@@ -0,0 +1,97 @@
+# hismedi-app/news/simindex.py
+# -*- coding: utf-8 -*-
+"""SimHash 근접중복 검색용 밴드(LSH) 인덱스.
+
+64비트 해시를 bands개 밴드로 나누면, 해밍거리가 k 이하인 두 해시는
+적어도 (bands - k)개 밴드가 완전히 같습니다(비둘기집 원리).
+그래서 (bands - k)개 밴드 조합마다 버킷 테이블을 두고, 조합 마스크가 같은 후보만
+정확한 해밍거리로 확인하면 선형 스캔과 같은 결과를 얻습니다.
+"""
+from itertools import combinations
+from math import comb
+
+# 테이블 수가 이 값을 넘으면 조합 크기를 1로 낮춥니다(메모리 보호).
+MAX_TABLES = 64
+
+
+def _band_masks(bands: int):
+    base, extra = divmod(64, bands)
+    masks, pos = [], 0
+    for i in range(bands):
+        w = base + (1 if i < extra else 0)
+        masks.append(((1 << w) - 1) << pos)
+        pos += w
+    return masks
+
+
+class SimHashIndex:
+    """insert / query 모두 버킷 크기에만 비례하는 근접중복 인덱스.
+
+    - max_hamming: 보장하는 최대 해밍거리(이 값 이하 질의는 선형 스캔과 동일한 결과)
+    - bands: 밴드 수(기본: 테이블 수가 MAX_TABLES 이하이면 max_hamming+2, 아니면 max_hamming+1)
+    """
+
+    def __init__(self, max_hamming: int, bands: int = None):
+        max_hamming = int(max_hamming)
+        if not 0 <= max_hamming < 64:
+            raise ValueError("max_hamming must be in [0, 63]")
+        if bands is None:
+            bands = max_hamming + 2
+            if bands > 64 or comb(bands, 2) > MAX_TABLES:
+                bands = max_hamming + 1
+        if not max_hamming < bands <= 64:
+            raise ValueError("bands must be in (max_hamming, 64]")
+        self.max_hamming = max_hamming
+        self.bands = bands
+
+        band_masks = _band_masks(bands)
+        self._masks = []
+        for combo in combinations(band_masks, bands - max_hamming):
+            m = 0
+            for b in combo:
+                m |= b
+            self._masks.append(m)
+        self._tables = [dict() for _ in self._masks]
+        self._items = []  # 삽입 순서대로 (sim, url)
+
+    @classmethod
+    def from_pairs(cls, pairs, max_hamming: int, bands: int = None):
+        idx = cls(max_hamming, bands=bands)
+        for sim, url in pairs:
+            idx.insert(sim, url)
+        return idx
+
+    def __len__(self):
+        return len(self._items)
+
+    def keys(self, sim: int):
+        """테이블별 버킷 키 [(table_no, key), ...]."""
+        return [(t, sim & m) for t, m in enumerate(self._masks)]
+
+    def insert(self, sim: int, url: str = "") -> int:
+        i = len(self._items)
+        self._items.append((sim, url))
+        for t, m in enumerate(self._masks):
+            self._tables[t].setdefault(sim & m, []).append(i)
+        return i
+
+    def query(self, sim: int, max_hamming: int = None) -> str:
+        """해밍거리 ≤ max_hamming인 항목 중 가장 먼저 넣은 것의 url('' = 없음).
+
+        삽입 순서대로 훑는 선형 스캔의 첫 일치와 같은 결과입니다(tests/test_simindex.py).
+        """
+        k = self.max_hamming if max_hamming is None else int(max_hamming)
+        if k > self.max_hamming:
+            raise ValueError(f"max_hamming {k} exceeds index guarantee {self.max_hamming}")
+        best = None
+        for t, m in enumerate(self._masks):
+            bucket = self._tables[t].get(sim & m)
+            if not bucket:
+                continue
+            for i in bucket:  # 버킷은 삽입 순서(오름차순)
+                if best is not None and i >= best:
+                    break
+                if (self._items[i][0] ^ sim).bit_count() <= k:
+                    best = i
+                    break
+        return "" if best is None else self._items[best][1]
@@ -0,0 +1,145 @@
+# hismedi-app/news/snapshot.py
+# -*- coding: utf-8 -*-
+"""NEWS 열 지향 스냅샷(Parquet).
+
+- 스크래퍼가 실행 끝에 NEWS 전체를 Parquet 파일 하나로 남기고, news_app은 시트 대신 이 파일을 읽습니다.
+- 위치: NEWS_SNAPSHOT 환경변수(없으면 DEFAULTS["news_snapshot"], 그것도 없으면 상태 폴더의 news.parquet).
+  로컬 경로 또는 pyarrow.fs가 아는 URI(gs://, s3:// 등). "off"면 만들지 않습니다.
+- 열: published_at은 timestamp(UTC), source는 dictionary(같은 출처가 반복됨), 나머지는 NEWS와 같은 문자열.
+  published_at 오름차순으로 정렬하고 행 그룹을 잘라 두어, 기간 조건을 주면 통계로 행 그룹을 건너뜁니다.
+- 스키마 메타데이터에 반영한 NEWS의 (행 수, 마지막 url_canonical)을 적어 두고,
+  다음 실행 전 상태와 같으면 새 행만 덧붙이고(append), 다르면 NEWS 전체로 다시 만듭니다(full).
+"""
+import json, os, time
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pyarrow import fs as pafs
+
+from news.config import DEFAULTS
+from news.gsheet import NEWS_HEADERS
+
+SNAPSHOT_FILE = "news.parquet"
+META_KEY = b"news_snapshot"
+
+SCHEMA = pa.schema(
+    [("published_at", pa.timestamp("us", tz="UTC")), ("source", pa.dictionary(pa.int32(), pa.string()))]
+    + [(h, pa.string()) for h in NEWS_HEADERS[2:]]
+)
+
+
+def snapshot_location() -> str:
+    """'' = 끔."""
+    loc = os.getenv("NEWS_SNAPSHOT", "").strip() or str(DEFAULTS.get("news_snapshot", "")).strip()
+    if loc.lower() == "off":
+        return ""
+    # state_dir()는 폴더를 만들므로 읽기 쪽(news_app)에서는 경로만 계산합니다.
+    return loc or os.path.join(os.getenv("NEWS_STATE_DIR", "").strip() or ".news_state", SNAPSHOT_FILE)
+
+
+def _resolve(location: str):
+    if "://" in location:
+        return pafs.FileSystem.from_uri(location)
+    return pafs.LocalFileSystem(), os.path.abspath(location)
+
+
+def exists(location: str) -> bool:
+    try:
+        filesystem, path = _resolve(location)
+        return filesystem.get_file_info(path).type == pafs.FileType.File
+    except Exception:
+        return False
+
+
+def _ts(v: str):
+    v = (v or "").strip()
+    if not v:
+        return None
+    try:
+        dt = datetime.fromisoformat(v.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+
+def to_table(rows) -> pa.Table:
+    """NEWS 행(문자열 9칸) → 스냅샷 테이블(정렬 전)."""
+    width = len(NEWS_HEADERS)
+    cols = list(zip(*[(list(r) + [""] * width)[:width] for r in rows])) or [()] * width
+    arrays = [pa.array([_ts(v) for v in cols[0]], SCHEMA.field(0).type),
+              pa.array(cols[1], pa.string()).dictionary_encode()]
+    arrays += [pa.array(c, pa.string()) for c in cols[2:]]
+    return pa.Table.from_arrays(arrays, schema=SCHEMA)
+
+
+def read_state(location: str):
+    """스냅샷이 반영한 (행 수, 마지막 url_canonical). 없거나 못 읽으면 None."""
+    try:
+        filesystem, path = _resolve(location)
+        meta = pq.read_schema(path, filesystem=filesystem).metadata or {}
+        d = json.loads(meta[META_KEY])
+        return int(d["rows"]), d["last_url"]
+    except Exception:
+        return None
+
+
+def write(location: str, table: pa.Table, rows: int, last_url: str):
+    table = table.sort_by([("published_at", "ascending")])
+    # 같은 출처가 섞인 청크를 이어 붙이면 사전이 여러 개가 되므로 하나로 합칩니다.
+    table = table.unify_dictionaries().combine_chunks()
+    meta = {META_KEY: json.dumps({"rows": rows, "last_url": last_url}).encode()}
+    table = table.replace_schema_metadata(meta)
+    filesystem, path = _resolve(location)
+    kw = dict(compression="zstd", row_group_size=int(DEFAULTS.get("snapshot_row_group_rows", 5000)))
+    if isinstance(filesystem, pafs.LocalFileSystem):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        pq.write_table(table, tmp, **kw)
+        os.replace(tmp, path)
+    else:
+        pq.write_table(table, path, filesystem=filesystem, **kw)
+
+
+def publish(location: str, before, new_rows, after, full_rows) -> dict:
+    """스냅샷 갱신.
+
+    before / after: 이번 실행 전/후 NEWS의 (행 수, 마지막 url_canonical).
+    new_rows: 이번에 NEWS에 덧붙인 행, full_rows(): NEWS 전체 행(다시 만들 때만 호출).
+    """
+    t0 = time.monotonic()
+    mode = "append"
+    state = read_state(location)
+    if state is not None and tuple(state) == tuple(before) and before[0] + len(new_rows) == after[0]:
+        filesystem, path = _resolve(location)
+        if new_rows:
+            old = pq.read_table(path, filesystem=filesystem)
+            table = pa.concat_tables([old.replace_schema_metadata(None), to_table(new_rows)], promote_options="permissive")
+            write(location, table, *after)
+        rows = after[0]
+    else:
+        mode = "full"
+        body = list(full_rows())
+        write(location, to_table(body), len(body), after[1])
+        rows = len(body)
+    return {"mode": mode, "rows": rows, "new_rows": len(new_rows), "sec": round(time.monotonic() - t0, 3)}
+
+
+def read(location: str, columns=None, date_from: datetime = None, date_to: datetime = None):
+    """스냅샷 → pandas.DataFrame. 기간 [date_from, date_to)은 행 그룹 통계로 걸러 읽습니다."""
+    filesystem, path = _resolve(location)
+    filters = []
+    if date_from is not None:
+        filters.append(("published_at", ">=", pa.scalar(date_from, SCHEMA.field(0).type)))
+    if date_to is not None:
+        filters.append(("published_at", "<", pa.scalar(date_to, SCHEMA.field(0).type)))
+    table = pq.read_table(path, filesystem=filesystem, columns=columns, filters=filters or None)
+    return table.to_pandas()
+
+
+def distinct_tags(location: str) -> list:
+    filesystem, path = _resolve(location)
+    tags = pq.read_table(path, filesystem=filesystem, columns=["tags"]).column("tags")
+    parts = pc.list_flatten(pc.split_pattern(pc.unique(tags.combine_chunks()), ","))
+    return sorted(t for t in pc.unique(pc.utf8_trim_whitespace(parts)).to_pylist() if t)
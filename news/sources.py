@@ -0,0 +1,144 @@
+# hismedi-app/news/sources.py
+# -*- coding: utf-8 -*-
+"""소스 레지스트리 + 파서 플러그인.
+
+- 소스 하나 = Source(name, kind, url, options). kind는 파서 플러그인 이름입니다.
+  · "rss"  : RSS 2.0 / Atom 피드(url = 피드 주소)
+  · "board": HTML 게시판 목록(options: page_url("{page}" 자리), link_selector, base, item_name)
+- 파서는 register_parser(kind)로 등록합니다(news.scraper가 rss / board를 등록).
+  호출 모양: fn(source, label, ua, timeout_sec, retries, backoff_sec, gov_pages, validators, report, rec, watermark)
+  반환: (items, status) — news.scraper._collect_source와 같음.
+- 레지스트리는 config(RSS_SOURCES, BOARD_SOURCES)에서 시작하고, 시트에 SOURCES 탭이 있으면
+  그 행(name, kind, url, options(JSON), enabled)을 덧붙입니다. 이름이 같으면 탭 쪽이 이기고,
+  enabled가 FALSE인 행은 같은 이름의 소스를 끕니다.
+- 예전 토큰("HTML:mohw" 같은 url)은 BOARD_SOURCES의 같은 키로 board 소스가 됩니다.
+- SOURCES 탭은 SheetSources로 프로세스마다 한 번 읽습니다(상주 모드는 META를 다시 읽을 때 함께).
+  탭이 없다는 결과는 상태 파일(sources_tab.json)에 남겨 sources_tab_recheck_sec 동안 다시 확인하지 않습니다.
+"""
+import json, time
+from typing import NamedTuple
+
+from news.config import BOARD_SOURCES, DEFAULTS, RSS_SOURCES
+from news.state import load_json, save_json
+
+SOURCES_TAB = "SOURCES"
+SOURCES_STATE_FILE = "sources_tab.json"
+
+PARSERS = {}
+
+
+class Source(NamedTuple):
+    name: str
+    kind: str
+    url: str
+    options: dict = None
+
+    def opt(self, key: str, default=None):
+        return (self.options or {}).get(key, default)
+
+
+def register_parser(kind: str):
+    def deco(fn):
+        PARSERS[kind] = fn
+        return fn
+    return deco
+
+
+def get_parser(kind: str):
+    fn = PARSERS.get(kind)
+    if fn is None:
+        raise ValueError(f"unknown source kind: {kind}")
+    return fn
+
+
+def as_source(entry) -> Source:
+    """Source / (name, url) 튜플 → Source."""
+    if isinstance(entry, Source):
+        return entry
+    name, url = entry
+    spec = BOARD_SOURCES.get(url)
+    if spec is not None:
+        return Source(name, "board", url, dict(spec))
+    return Source(name, "rss", url)
+
+
+def _enabled(v) -> bool:
+    return str(v).strip().upper() not in ("FALSE", "0", "N", "NO", "OFF")
+
+
+def source_from_record(rec: dict):
+    """SOURCES 탭 한 행 → Source (이름/주소가 없으면 None)."""
+    name = str(rec.get("name", "")).strip()
+    url = str(rec.get("url", "")).strip()
+    if not name or not url:
+        return None
+    options = rec.get("options") or {}
+    if isinstance(options, str):
+        options = json.loads(options) if options.strip() else {}
+    kind = str(rec.get("kind", "")).strip().lower() or ("board" if url in BOARD_SOURCES else "rss")
+    if kind == "board" and url in BOARD_SOURCES:
+        options = {**BOARD_SOURCES[url], **options}
+    return Source(name, kind, url, options)
+
+
+def load_sheet_sources(sh, tab: str = SOURCES_TAB):
+    """SOURCES 탭의 행(dict). 탭이 없으면 None."""
+    try:
+        ws = sh.worksheet(tab)
+    except Exception:
+        return None
+    return ws.get_all_records()
+
+
+class SheetSources:
+    """SOURCES 탭 행 캐시. records()는 처음 한 번만 읽고, refresh()로 다시 읽습니다."""
+
+    def __init__(self, sh, tab: str = SOURCES_TAB, recheck_sec: float = None):
+        self.sh = sh
+        self.tab = tab
+        self.recheck_sec = float(DEFAULTS.get("sources_tab_recheck_sec", 3600) if recheck_sec is None else recheck_sec)
+        self._records = None
+
+    def records(self) -> list:
+        if self._records is None:
+            self.refresh()
+        return self._records
+
+    def refresh(self, now: float = None) -> list:
+        now = time.time() if now is None else now
+        state = load_json(SOURCES_STATE_FILE)
+        missing_at = float(state.get(self.tab) or 0)
+        if now - missing_at < self.recheck_sec:
+            self._records = []
+            return self._records
+        recs = load_sheet_sources(self.sh, self.tab)
+        if recs is None:
+            save_json(SOURCES_STATE_FILE, {**state, self.tab: now})
+        elif missing_at:
+            state.pop(self.tab, None)
+            save_json(SOURCES_STATE_FILE, state)
+        self._records = list(recs or [])
+        return self._records
+
+
+def load_registry(sources=None, records=None) -> list:
+    """config(또는 넘긴 sources) + SOURCES 탭 행 → [Source].
+
+    탭 행은 같은 이름의 소스를 그 자리에서 바꾸고(없으면 뒤에 붙임), enabled=FALSE면 그 이름을 뺍니다.
+    """
+    out = [as_source(entry) for entry in (RSS_SOURCES if sources is None else sources)]
+    for rec in records or []:
+        name = str(rec.get("name", "")).strip()
+        if not name:
+            continue
+        pos = next((i for i, s in enumerate(out) if s.name == name), len(out))
+        out = [s for s in out if s.name != name]
+        if not _enabled(rec.get("enabled", "TRUE")):
+            continue
+        try:
+            src = source_from_record(rec)
+        except ValueError:
+            continue  # options JSON 오류인 행은 건너뜀
+        if src is not None:
+            out.insert(pos, src)
+    return out
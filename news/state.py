@@ -0,0 +1,37 @@
+# hismedi-app/news/state.py
+# -*- coding: utf-8 -*-
+"""스크래퍼 로컬 상태 파일.
+
+- 실행 사이에 유지할 작은 상태(피드 ETag 등)를 JSON으로 저장합니다.
+- 위치: NEWS_STATE_DIR 환경변수(없으면 ./.news_state)
+- GitHub Actions에서는 actions/cache로 이 폴더를 실행 간에 이어 씁니다.
+- 파일이 없거나 깨져 있으면 기본값으로 시작합니다(상태는 최적화용일 뿐 정답이 아님).
+"""
+import os, json
+
+
+def state_dir() -> str:
+    d = os.getenv("NEWS_STATE_DIR", "").strip() or ".news_state"
+    os.makedirs(d, exist_ok=True)
+    return d
+
+
+def state_path(name: str) -> str:
+    return os.path.join(state_dir(), name)
+
+
+def load_json(name: str, default=None):
+    try:
+        with open(state_path(name), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {} if default is None else default
+
+
+def save_json(name: str, data):
+    """임시 파일에 쓴 뒤 교체(중간에 죽어도 이전 파일은 온전)."""
+    path = state_path(name)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp, path)
@@ -0,0 +1,276 @@
+# hismedi-app/news/storage.py
+# -*- coding: utf-8 -*-
+"""NEWS 저장소 백엔드(Google Sheets / PostgreSQL).
+
+- NEWS_STORAGE(환경변수, 없으면 DEFAULTS["news_storage"])
+  · "sheets"          : NEWS 탭에만 기록(기존 방식)
+  · "postgres"        : news_items 테이블에만 기록
+  · "postgres+sheets" : news_items에 기록하고 NEWS 탭은 미러로 함께 기록(미러 실패는 수집을 멈추지 않음)
+  META 탭은 어느 모드에서나 시트에 둡니다.
+- news_items는 url_canonical / title_hash에 고유 제약이 있습니다.
+  기록은 COPY로 임시 테이블에 넣은 뒤 INSERT ... SELECT ... ON CONFLICT DO NOTHING 한 번으로 옮깁니다.
+- 읽기는 발행시각 범위(B-tree) / 태그(GIN, text[]) 조건으로 필요한 행만 가져옵니다(query_items).
+- 접속 정보는 DATABASE_URL(app.py와 같은 변환: postgresql+psycopg://, sslmode=require 기본)입니다.
+"""
+import os, time
+from datetime import datetime
+
+from sqlalchemy import create_engine, text
+
+from news.config import DEFAULTS
+from news.gsheet import NEWS_HEADERS
+
+MODES = ("sheets", "postgres", "postgres+sheets")
+
+# COPY 대상 열(순서 = NEWS_HEADERS)
+COLUMNS = ("published_at", "source", "title", "url", "url_canonical", "tags", "title_hash", "simhash", "duplicate_of")
+COPY_TYPES = ("timestamptz", "text", "text", "text", "text", "text[]", "text", "int8", "text", "int4")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS news_items (
+    id            BIGSERIAL PRIMARY KEY,
+    published_at  TIMESTAMPTZ,
+    source        TEXT NOT NULL DEFAULT '',
+    title         TEXT NOT NULL DEFAULT '',
+    url           TEXT NOT NULL DEFAULT '',
+    url_canonical TEXT NOT NULL,
+    tags          TEXT[] NOT NULL DEFAULT '{}',
+    title_hash    TEXT NOT NULL,
+    simhash       BIGINT,
+    duplicate_of  TEXT NOT NULL DEFAULT '',
+    inserted_at   TIMESTAMPTZ NOT NULL DEFAULT now(),
+    CONSTRAINT news_items_url_canonical_key UNIQUE (url_canonical),
+    CONSTRAINT news_items_title_hash_key UNIQUE (title_hash)
+);
+CREATE INDEX IF NOT EXISTS news_items_published_at_idx ON news_items (published_at DESC);
+CREATE INDEX IF NOT EXISTS news_items_tags_idx ON news_items USING GIN (tags);
+"""
+
+
+def storage_mode() -> str:
+    mode = (os.getenv("NEWS_STORAGE", "").strip() or DEFAULTS.get("news_storage", "sheets")).lower()
+    if mode not in MODES:
+        raise RuntimeError(f"Unknown NEWS_STORAGE: {mode}")
+    return mode
+
+
+def database_url() -> str:
+    url = os.getenv("DATABASE_URL", "").strip()
+    if not url:
+        raise RuntimeError("Missing DATABASE_URL")
+    return url
+
+
+def _ensure_psycopg_url(url: str) -> str:
+    u = url
+    if u.startswith("postgresql://"): u = u.replace("postgresql://", "postgresql+psycopg://", 1)
+    if u.startswith("postgres://"):  u = u.replace("postgres://", "postgresql+psycopg://", 1)
+    if "sslmode=" not in u: u += ("&" if ("?" in u) else "?") + "sslmode=require"
+    return u
+
+
+_ENGINES = {}
+
+def get_engine(url: str = None):
+    """프로세스 공용 엔진(URL별 1개). 트랜잭션 풀러(pgbouncer)에서도 돌도록 prepared statement는 끕니다."""
+    url = _ensure_psycopg_url(url or database_url())
+    eng = _ENGINES.get(url)
+    if eng is None:
+        eng = _ENGINES[url] = create_engine(url, connect_args={"prepare_threshold": None}, pool_pre_ping=True)
+    return eng
+
+
+def _i64(x: int) -> int:
+    return x - (1 << 64) if x >= (1 << 63) else x
+
+
+def _u64(x: int) -> int:
+    return x + (1 << 64) if x < 0 else x
+
+
+def _copy_row(row, ord_no: int) -> tuple:
+    """NEWS 행(문자열 9칸) → COPY 값."""
+    r = (list(row) + [""] * len(COLUMNS))[:len(COLUMNS)]
+    published_at, source, title, url, url_c, tags, title_hash, simhash, dup_of = r
+    return (
+        published_at or None, source, title, url, url_c,
+        [t for t in tags.split(",") if t], title_hash,
+        _i64(int(simhash)) if simhash.isdigit() else None, dup_of, ord_no,
+    )
+
+
+def _news_row(r) -> list:
+    """news_items 행 → NEWS 모양(문자열 9칸)."""
+    published_at, source, title, url, url_c, tags, title_hash, simhash, dup_of = r
+    return [
+        published_at.isoformat() if published_at else "", source, title, url, url_c,
+        ",".join(tags or []), title_hash, "" if simhash is None else str(_u64(simhash)), dup_of,
+    ]
+
+
+class PostgresStore:
+    def __init__(self, engine=None):
+        self.engine = engine or get_engine()
+        self.ensure_schema()
+
+    def ensure_schema(self):
+        with self.engine.begin() as con:
+            for stmt in SCHEMA.split(";"):
+                if stmt.strip():
+                    con.execute(text(stmt))
+
+    # ---------- 중복 인덱스 동기화 ----------
+    def tail(self):
+        """(행 수, 마지막으로 들어간 행의 url_canonical)."""
+        with self.engine.begin() as con:
+            n = con.execute(text("SELECT count(*) FROM news_items")).scalar()
+            last = con.execute(text("SELECT url_canonical FROM news_items ORDER BY id DESC LIMIT 1")).scalar()
+        return int(n), last or ""
+
+    def rows(self):
+        """전체 행(NEWS 모양, 들어간 순서)."""
+        with self.engine.begin() as con:
+            cur = con.execute(text(f"SELECT {', '.join(COLUMNS)} FROM news_items ORDER BY id"))
+            return [_news_row(r) for r in cur]
+
+    # ---------- 기록 ----------
+    def copy_insert(self, rows) -> int:
+        """COPY → 임시 테이블 → INSERT ON CONFLICT DO NOTHING. 실제로 들어간 행 수."""
+        if not rows:
+            return 0
+        raw = self.engine.raw_connection()
+        try:
+            conn = raw.driver_connection
+            with conn.cursor() as cur:
+                cur.execute(
+                    "CREATE TEMP TABLE news_items_stage ("
+                    "published_at timestamptz, source text, title text, url text, url_canonical text, "
+                    "tags text[], title_hash text, simhash bigint, duplicate_of text, ord int"
+                    ") ON COMMIT DROP"
+                )
+                with cur.copy(f"COPY news_items_stage ({', '.join(COLUMNS)}, ord) FROM STDIN") as cp:
+                    cp.set_types(list(COPY_TYPES))
+                    for i, row in enumerate(rows):
+                        cp.write_row(_copy_row(row, i))
+                # 같은 배치 안의 중복도 DO NOTHING이 앞선 행만 남깁니다(ord 순서로 id 부여).
+                cur.execute(
+                    f"INSERT INTO news_items ({', '.join(COLUMNS)}) "
+                    f"SELECT {', '.join(COLUMNS)} FROM news_items_stage ORDER BY ord "
+                    "ON CONFLICT DO NOTHING"
+                )
+                inserted = cur.rowcount
+            conn.commit()
+            return inserted
+        except Exception:
+            raw.rollback()
+            raise
+        finally:
+            raw.close()
+
+    def writer(self, chunk_rows: int = None):
+        return PostgresWriter(self, chunk_rows or int(DEFAULTS.get("pg_copy_rows", 5000)))
+
+    # ---------- 읽기 ----------
+    def query_items(self, date_from: datetime = None, date_to: datetime = None, tag: str = None,
+                    limit: int = None) -> list:
+        """발행시각 [date_from, date_to) / 태그 조건의 행(dict, NEWS_HEADERS 키), 최신순."""
+        where, params = [], {}
+        if date_from is not None:
+            where.append("published_at >= :date_from")
+            params["date_from"] = date_from
+        if date_to is not None:
+            where.append("published_at < :date_to")
+            params["date_to"] = date_to
+        if tag:
+            where.append("tags @> ARRAY[CAST(:tag AS text)]")
+            params["tag"] = tag
+        sql = f"SELECT {', '.join(COLUMNS)} FROM news_items"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY published_at DESC NULLS LAST"
+        if limit:
+            sql += " LIMIT :limit"
+            params["limit"] = int(limit)
+        with self.engine.begin() as con:
+            return [dict(zip(NEWS_HEADERS, _news_row(r))) for r in con.execute(text(sql), params)]
+
+    def distinct_tags(self) -> list:
+        with self.engine.begin() as con:
+            return [r[0] for r in con.execute(text("SELECT DISTINCT unnest(tags) AS t FROM news_items ORDER BY t"))]
+
+
+class PostgresWriter:
+    """SheetWriter와 같은 모양(add / flush / close / rows_per_sec)의 Postgres 기록기."""
+
+    def __init__(self, store: PostgresStore, chunk_rows: int = 5000):
+        self.store = store
+        self.chunk_rows = max(1, int(chunk_rows))
+        self._buf = []
+        self.rows_written = 0  # 실제로 들어간 행(충돌로 빠진 행 제외)
+        self.conflicts = 0
+        self.chunks = 0
+        self.write_sec = 0.0
+
+    def add(self, row):
+        self._buf.append(row)
+        if len(self._buf) >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        if not self._buf:
+            return
+        rows, self._buf = self._buf, []
+        t0 = time.monotonic()
+        n = self.store.copy_insert(rows)
+        self.write_sec += time.monotonic() - t0
+        self.rows_written += n
+        self.conflicts += len(rows) - n
+        self.chunks += 1
+
+    def close(self):
+        self.flush()
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows_written / self.write_sec if self.write_sec > 0 else 0.0
+
+
+class MirrorWriter:
+    """주 기록기 + 미러 기록기. 미러 실패는 mirror_error에 남기고 주 기록은 계속합니다."""
+
+    def __init__(self, primary, mirror):
+        self.primary = primary
+        self.mirror = mirror
+        self.mirror_error = ""
+
+    def _mirror(self, fn, *args):
+        if self.mirror is None or self.mirror_error:
+            return
+        try:
+            getattr(self.mirror, fn)(*args)
+        except Exception as e:
+            self.mirror_error = repr(e)
+
+    def add(self, row):
+        self.primary.add(row)
+        self._mirror("add", row)
+
+    def flush(self):
+        self.primary.flush()
+        self._mirror("flush")
+
+    def close(self):
+        self.primary.close()
+        self._mirror("close")
+
+    @property
+    def rows_written(self) -> int:
+        return self.primary.rows_written
+
+    @property
+    def write_sec(self) -> float:
+        return self.primary.write_sec + (self.mirror.write_sec if self.mirror is not None else 0.0)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.primary.rows_per_sec
@@ -0,0 +1,141 @@
+# hismedi-app/news/telemetry.py
+# -*- coding: utf-8 -*-
+"""스크래퍼 실행 리포트(소스별 지연/바이트/항목/탈락 사유, 단계별 시간).
+
+- 소스별 카운터는 수집 스레드에서 각자 자기 소스만 갱신합니다.
+- 실행이 끝나면 JSON으로 로컬 파일(run_report.json + 누적 run_reports.jsonl)에 쓰고,
+  summary()를 META 한 칸(last_run_report)에 남깁니다.
+"""
+import json, os, threading, time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from news.state import state_path, save_json
+
+REPORT_FILE = "run_report.json"
+HISTORY_FILE = "run_reports.jsonl"
+HISTORY_KEEP = 1000  # 누적 파일에 남길 최근 실행 수
+
+# 소스별 카운터(0으로 시작)
+COUNTERS = (
+    "bytes", "entries", "dropped_invalid", "dropped_watermark", "dropped_tag", "dropped_url", "dropped_title", "near_dup", "inserted",
+)
+
+
+class RunReport:
+    def __init__(self):
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self._t0 = time.monotonic()
+        self.sources = {}  # label -> dict
+        self.stages = {}   # name -> 누적 초
+        self._aliases = {}  # 항목 source 이름 -> 리포트 label(HTML 크롤러처럼 이름이 다른 경우)
+        self._lock = threading.Lock()
+        self.date_parse = {}  # 날짜 파싱 경로별 적중 수(news.dates)
+        self.total_sec = None
+        self.error = ""
+
+    # ---------- 소스 ----------
+    def source(self, label: str) -> dict:
+        with self._lock:
+            rec = self.sources.get(label)
+            if rec is None:
+                rec = self.sources[label] = {
+                    "url": "", "labels": [label], "http_status": None, "error": "", "breaker": "", "parser": "",
+                    "not_modified": False, "wall_sec": 0.0, "parse_sec": 0.0, "tag_sec": 0.0,
+                    **{k: 0 for k in COUNTERS},
+                }
+            return rec
+
+    def alias(self, item_source: str, label: str):
+        if item_source and item_source != label:
+            with self._lock:
+                self._aliases[item_source] = label
+
+    def merge(self, sources: dict, aliases: dict = None):
+        """다른 프로세스(샤드)의 소스 기록을 합칩니다(샤드끼리 소스가 겹치지 않음)."""
+        with self._lock:
+            self.sources.update(sources)
+            self._aliases.update(aliases or {})
+
+    def count(self, item_source: str, field: str, n: int = 1):
+        label = self._aliases.get(item_source, item_source)
+        self.source(label)[field] += n
+
+    def record_response(self, label: str, r):
+        # 게시판 소스는 여러 페이지를 병렬로 받아 같은 기록을 동시에 고칩니다.
+        rec = self.source(label)
+        n = len(r.content or b"")
+        with self._lock:
+            rec["http_status"] = r.status_code
+            rec["bytes"] += n
+
+    # ---------- 단계 ----------
+    @contextmanager
+    def stage(self, name: str):
+        t0 = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add_stage(name, time.monotonic() - t0)
+
+    def add_stage(self, name: str, sec: float):
+        with self._lock:
+            self.stages[name] = self.stages.get(name, 0.0) + sec
+
+    def finish(self):
+        self.total_sec = time.monotonic() - self._t0
+        return self
+
+    # ---------- 출력 ----------
+    def to_dict(self) -> dict:
+        total = self.total_sec if self.total_sec is not None else time.monotonic() - self._t0
+        totals = {k: sum(s[k] for s in self.sources.values()) for k in COUNTERS}
+        return {
+            "started_at": self.started_at,
+            "total_sec": round(total, 3),
+            "error": self.error,
+            "stages": {k: round(v, 3) for k, v in self.stages.items()},
+            "totals": totals,
+            "date_parse": self.date_parse,
+            "sources": {
+                k: {**v, "wall_sec": round(v["wall_sec"], 3), "parse_sec": round(v["parse_sec"], 3),
+                    "tag_sec": round(v["tag_sec"], 3)}
+                for k, v in self.sources.items()
+            },
+        }
+
+    def summary(self) -> dict:
+        """META 한 칸에 넣을 요약(실패/느린 소스 위주)."""
+        d = self.to_dict()
+        srcs = d["sources"]
+        slowest = sorted(srcs.items(), key=lambda kv: kv[1]["wall_sec"], reverse=True)[:3]
+        return {
+            "at": d["started_at"],
+            "sec": d["total_sec"],
+            "error": d["error"],
+            "stages": d["stages"],
+            "sources": len(srcs),
+            "failed": sorted(k for k, v in srcs.items() if v["error"]),
+            "parked": sorted(k for k, v in srcs.items() if v["breaker"] == "open"),
+            "not_modified": sum(1 for v in srcs.values() if v["not_modified"]),
+            "bytes": d["totals"]["bytes"],
+            "entries": d["totals"]["entries"],
+            "inserted": d["totals"]["inserted"],
+            "date_fast_rate": d["date_parse"].get("fast_rate"),
+            "slowest": [[k, v["wall_sec"]] for k, v in slowest],
+        }
+
+    def write(self, name: str = REPORT_FILE) -> str:
+        d = self.to_dict()
+        save_json(name, d)
+        # 누적 기록(최근 HISTORY_KEEP개만 유지)
+        path = state_path(HISTORY_FILE)
+        lines = []
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()[-(HISTORY_KEEP - 1):]
+        lines.append(json.dumps(d, ensure_ascii=False, sort_keys=True))
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(path + ".tmp", path)
+        return state_path(name)
@@ -1,16 +1,27 @@
 import json
 import os
 import re
-from datetime import date, timedelta
+from datetime import date, datetime, time, timedelta, timezone
 
 import pandas as pd
 import streamlit as st
 import gspread
 from google.oauth2.service_account import Credentials
 
+from news import snapshot
+from news.gsheet import NEWS_HEADERS
+from news.render import COMPACT_ROWS, PAGE_SIZES, page_count, page_slice, table_html
+from news.search import SearchIndex
+from news.sheetcache import DeltaSheetLoader
+from news.storage import PostgresStore, get_engine
+
 
 APP_TITLE = "뉴스 모니터"
 DEFAULT_SHEET_ID = os.getenv("GSHEET_ID", "").strip()
+KST = timezone(timedelta(hours=9))
+PUB_COLS = ["published_at", "publishedAt", "pubDate", "date", "발행"]
+# 화면에 쓰는 열만 스냅샷에서 읽습니다.
+SNAPSHOT_COLUMNS = ["published_at", "source", "title", "url", "url_canonical", "tags"]
 
 
 def _normalize_private_key(info: dict) -> dict:
@@ -44,12 +55,74 @@ def get_gspread_client():
     return gspread.authorize(creds)
 
 
+@st.cache_resource
+def get_news_loader(sheet_id: str) -> DeltaSheetLoader:
+    """프로세스 공용 증분 로더(시트별 1개). 이미 읽고 파싱한 행은 다시 받지 않습니다."""
+    return DeltaSheetLoader(
+        lambda: get_gspread_client().open_by_key(sheet_id).get_worksheet(0),
+        parse=_with_kst,
+    )
+
+
 @st.cache_data(ttl=120)
 def load_news(sheet_id: str) -> pd.DataFrame:
-    gc = get_gspread_client()
-    sh = gc.open_by_key(sheet_id)
-    ws = sh.get_worksheet(0)
-    return pd.DataFrame(ws.get_all_records())
+    return get_news_loader(sheet_id).refresh()
+
+
+def _snapshot_location() -> str:
+    """읽을 수 있는 Parquet 스냅샷 위치('' = 없음 → 시트)."""
+    loc = str(st.secrets.get("NEWS_SNAPSHOT", "")).strip()
+    if loc.lower() == "off":
+        return ""
+    loc = loc or snapshot.snapshot_location()
+    return loc if loc and snapshot.exists(loc) else ""
+
+
+@st.cache_data(ttl=120)
+def load_news_snapshot(location: str, date_from: date, date_to: date) -> pd.DataFrame:
+    """Parquet 스냅샷에서 필요한 열 / 기간(행 그룹 통계로 건너뜀)만 읽습니다."""
+    start = datetime.combine(date_from, time.min, tzinfo=KST)
+    end = datetime.combine(date_to + timedelta(days=1), time.min, tzinfo=KST)
+    df = snapshot.read(location, SNAPSHOT_COLUMNS, start, end)
+    df["source"] = df["source"].astype(object)  # dictionary → 문자열(아래 fillna("")가 그대로 돌도록)
+    return df
+
+
+@st.cache_data(ttl=120)
+def load_snapshot_tags(location: str) -> list:
+    return snapshot.distinct_tags(location)
+
+
+@st.cache_resource(max_entries=8)
+def get_search_index(data_key: str) -> SearchIndex:
+    """데이터 출처별 키워드 검색 색인(프로세스 공용). sync()가 새로 들어온 행만 색인합니다."""
+    return SearchIndex()
+
+
+def _news_storage() -> str:
+    return (str(st.secrets.get("NEWS_STORAGE", "")) or os.getenv("NEWS_STORAGE", "")).strip().lower()
+
+
+@st.cache_resource
+def get_news_store() -> PostgresStore:
+    url = st.secrets.get("DATABASE_URL") or os.getenv("DATABASE_URL")
+    if not url:
+        raise RuntimeError("Missing DATABASE_URL")
+    return PostgresStore(get_engine(str(url).strip()))
+
+
+@st.cache_data(ttl=120)
+def load_news_db(date_from: date, date_to: date, tag: str) -> pd.DataFrame:
+    """Postgres(news_items)에서 기간/태그 조건에 맞는 행만 읽습니다(인덱스 조회)."""
+    start = datetime.combine(date_from, time.min, tzinfo=KST)
+    end = datetime.combine(date_to + timedelta(days=1), time.min, tzinfo=KST)
+    rows = get_news_store().query_items(start, end, None if tag in ("", "전체") else tag)
+    return pd.DataFrame(rows, columns=NEWS_HEADERS)
+
+
+@st.cache_data(ttl=120)
+def load_news_tags() -> list:
+    return get_news_store().distinct_tags()
 
 
 def _to_kst(series: pd.Series) -> pd.Series:
@@ -63,6 +136,15 @@ def _to_kst(series: pd.Series) -> pd.Series:
     return dt.dt.tz_convert("Asia/Seoul").dt.tz_localize(None)
 
 
+def _with_kst(df: pd.DataFrame) -> pd.DataFrame:
+    """컬럼명 정리 + '발행'(KST) 열. 증분 로더가 새 행에만 적용합니다."""
+    df.columns = [str(c).strip() for c in df.columns]
+    pub_col = next((c for c in PUB_COLS if c in df.columns), None)
+    if pub_col:
+        df["발행"] = _to_kst(df[pub_col])
+    return df
+
+
 st.set_page_config(page_title=APP_TITLE, layout="wide")
 
 st.markdown(
@@ -75,6 +157,7 @@ st.markdown(
       table.news th, table.news td { padding:10px 12px; border-bottom:1px solid rgba(49,51,63,.08); text-align:left; white-space:nowrap; }
       table.news th { position:sticky; top:0; background:#fafafa; z-index:1; }
       table.news tr:hover td { background:rgba(49,51,63,.03); }
+      table.news.compact th, table.news.compact td { padding:6px 10px; font-size:13px; }
       a.newslink { text-decoration:none; }
       a.newslink:hover { text-decoration:underline; }
     </style>
@@ -83,8 +166,15 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
+use_db = _news_storage().startswith("postgres")
 sheet_id = st.secrets.get("GSHEET_ID", "").strip() or DEFAULT_SHEET_ID
-if not sheet_id:
+snapshot_loc = "" if use_db else _snapshot_location()
+if snapshot_loc:
+    try:
+        snapshot_tags = load_snapshot_tags(snapshot_loc)
+    except Exception:
+        snapshot_loc = ""  # 스냅샷을 못 읽으면 시트로
+if not use_db and not snapshot_loc and not sheet_id:
     st.error("GSHEET_ID가 설정되지 않았습니다.")
     st.stop()
 
@@ -93,24 +183,31 @@ with st.container():
     st.markdown('<div class="top-box">', unsafe_allow_html=True)
 
     # (요청 순서) 시작일 · 종료일 · 태그 · 검색(키워드) · 동기화
-    df = load_news(sheet_id)
-    if df.empty:
-        st.warning("데이터가 없습니다.")
-        st.stop()
-
-    # 태그 옵션 준비(있을 때만)
-    tag_col = "tags" if "tags" in df.columns else None
-    tag_options = []
-    if tag_col:
-        _tags = (
-            df[tag_col]
-            .fillna("")
-            .astype(str)
-            .str.split(",")
-            .explode()
-            .str.strip()
-        )
-        tag_options = sorted([t for t in _tags.unique().tolist() if t])
+    if use_db:
+        tag_col = "tags"
+        tag_options = load_news_tags()
+    elif snapshot_loc:
+        tag_col = "tags"
+        tag_options = snapshot_tags
+    else:
+        df = load_news(sheet_id)
+        if df.empty:
+            st.warning("데이터가 없습니다.")
+            st.stop()
+
+        # 태그 옵션 준비(있을 때만)
+        tag_col = "tags" if "tags" in df.columns else None
+        tag_options = []
+        if tag_col:
+            _tags = (
+                df[tag_col]
+                .fillna("")
+                .astype(str)
+                .str.split(",")
+                .explode()
+                .str.strip()
+            )
+            tag_options = sorted([t for t in _tags.unique().tolist() if t])
 
     c1, c2, c3, c4, c5 = st.columns([1.1, 1.1, 1.2, 2.2, 0.9], vertical_alignment="bottom")
     with c1:
@@ -129,24 +226,47 @@ with st.container():
     with c5:
         if st.button("🔄 동기화", use_container_width=True):
             load_news.clear()
+            load_news_snapshot.clear()
+            load_snapshot_tags.clear()
+            load_news_db.clear()
+            load_news_tags.clear()
             st.rerun()
 
     st.markdown("</div>", unsafe_allow_html=True)
 
 
-df = load_news(sheet_id)
+data_key = f"sheet:{sheet_id}"
+if use_db:
+    df = load_news_db(date_from, date_to, selected_tag)
+    data_key = f"db:{date_from}:{date_to}:{selected_tag}"
+elif snapshot_loc:
+    try:
+        df = load_news_snapshot(snapshot_loc, date_from, date_to)
+        data_key = f"snapshot:{snapshot_loc}:{date_from}:{date_to}"
+    except Exception:
+        if not sheet_id:
+            raise
+        df = load_news(sheet_id)
+else:
+    df = load_news(sheet_id)
 if df.empty:
     st.warning("데이터가 없습니다.")
     st.stop()
 
 df.columns = [str(c).strip() for c in df.columns]
 
-pub_col = next((c for c in ["published_at", "publishedAt", "pubDate", "date", "발행"] if c in df.columns), None)
+# 키워드 검색(선택 시): 제목/출처/태그에서 부분일치. 불러온 행 전체의 역색인으로 찾은 뒤 나머지 필터를 적용합니다.
+kw = (keyword or "").strip().lower()
+if kw:
+    df = df.iloc[get_search_index(data_key).sync(df).search(kw)]
+
+pub_col = next((c for c in PUB_COLS if c in df.columns), None)
 if not pub_col:
     st.error("발행일 컬럼을 찾지 못했습니다.")
     st.stop()
 
-df["발행"] = _to_kst(df[pub_col])
+if "발행" not in df.columns:  # 시트 로더는 이미 파싱해 둠
+    df["발행"] = _to_kst(df[pub_col])
 df = df[pd.notna(df["발행"])]
 
 # 날짜 필터
@@ -156,22 +276,6 @@ df = df[(df["발행"].dt.date >= date_from) & (df["발행"].dt.date <= date_to)]
 if tag_col and selected_tag and selected_tag != "전체":
     df = df[df[tag_col].fillna("").astype(str).str.contains(re.escape(selected_tag))]
 
-# 키워드 검색(선택 시): 제목/출처/태그에서 부분일치
-kw = (keyword or "").strip().lower()
-if kw:
-    title_c = "title" if "title" in df.columns else None
-    source_c = "source" if "source" in df.columns else None
-
-    mask = pd.Series(False, index=df.index)
-    if title_c:
-        mask = mask | df[title_c].fillna("").astype(str).str.lower().str.contains(kw)
-    if source_c:
-        mask = mask | df[source_c].fillna("").astype(str).str.lower().str.contains(kw)
-    if tag_col:
-        mask = mask | df[tag_col].fillna("").astype(str).str.lower().str.contains(kw)
-
-    df = df[mask]
-
 df = df.sort_values("발행", ascending=False)
 
 title_col = "title" if "title" in df.columns else None
@@ -180,27 +284,25 @@ if not title_col or not url_col:
     st.error("필수 컬럼(title, url/url_canonical)을 찾지 못했습니다.")
     st.stop()
 
-rows = []
-for _, r in df.iterrows():
-    pub_str = r["발행"].strftime("%Y-%m-%d %H:%M")
-    src = str(r.get("source", "")).strip()
-    title = str(r.get(title_col, "")).strip()
-    url = str(r.get(url_col, "")).strip()
-    rows.append(
-        "<tr>"
-        f"<td>{pub_str}</td>"
-        f"<td>{src}</td>"
-        f"<td><a class='newslink' href='{url}' target='_blank' rel='noopener noreferrer'>{title}</a></td>"
-        "</tr>"
-    )
-
-html = (
-    "<div style='max-height:760px; overflow:auto; border:1px solid rgba(49,51,63,.14); border-radius:14px;'>"
-    "<table class='news'>"
-    "<thead><tr><th>발행</th><th>출처</th><th>제목</th></tr></thead>"
-    "<tbody>"
-    + "".join(rows)
-    + "</tbody></table></div>"
-)
-
-st.markdown(html, unsafe_allow_html=True)
+# ---------------- 표(페이지 단위) ----------------
+# 현재 페이지의 행만 HTML로 만들어 보냅니다(간단히 보기 = 스크롤 없이 한 화면 분량).
+p1, p2, p3, p4 = st.columns([1.1, 1.1, 1.1, 3.3], vertical_alignment="bottom")
+with p1:
+    compact = st.toggle("간단히 보기", value=False, key="compact")
+with p2:
+    page_size = COMPACT_ROWS if compact else st.selectbox("페이지당", PAGE_SIZES, index=1, key="page_size")
+pages = page_count(len(df), page_size)
+
+# 조건이 바뀌면 첫 페이지로, 페이지 수가 줄었으면 마지막 페이지로
+view_sig = (date_from, date_to, selected_tag, kw, compact, page_size)
+if st.session_state.get("view_sig") != view_sig:
+    st.session_state["view_sig"] = view_sig
+    st.session_state["page"] = 1
+st.session_state["page"] = min(int(st.session_state.get("page", 1)), pages)
+with p3:
+    page = st.number_input("페이지", min_value=1, max_value=pages, step=1, key="page")
+with p4:
+    st.caption(f"총 {len(df):,}건 · {page}/{pages} 페이지")
+
+page_df, page = page_slice(df, page, page_size)
+st.markdown(table_html(page_df, title_col, url_col, compact=compact), unsafe_allow_html=True)
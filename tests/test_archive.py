@@ -0,0 +1,45 @@
+# hismedi-app/tests/test_archive.py
+# -*- coding: utf-8 -*-
+"""보관 목록의 기간(from/to)이 문자열 순서가 아니라 시각 순서로 정해지는지 확인합니다."""
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from bench.fake_sheets import FakeSpreadsheet
+from news.archive import CATALOG_KEY, archive_news
+from news.gsheet import NEWS_HEADERS, MetaSession
+from news.indexstore import DedupeIndex
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    monkeypatch.setenv("NEWS_STATE_DIR", str(tmp_path))
+    sh = FakeSpreadsheet()
+    news = sh.add_worksheet("NEWS")
+    news.append_rows([NEWS_HEADERS])
+    sh.add_worksheet("META").append_rows([["key", "value"]])
+    index = DedupeIndex(path=str(tmp_path / "dedupe.sqlite3"))
+    yield sh, news, MetaSession(sh.worksheet("META")), index
+    index.close()
+
+
+def row(published_at: str, n: int) -> list:
+    return [published_at, "src", f"title {n}", f"http://x/{n}", f"http://x/{n}", "t", f"th{n}", str(n), ""]
+
+
+def test_catalog_range_uses_time_order(setup):
+    sh, news, meta, index = setup
+    # 모두 2024-02(UTC). 문자열로는 01-31이 가장 이르지만 시각으로는 +09:00 행이 가장 이릅니다.
+    news.append_rows([
+        row("2024-01-31T23:30:00-05:00", 1),   # 2024-02-01 04:30 UTC
+        row("2024-02-01T09:00:00+09:00", 2),   # 2024-02-01 00:00 UTC
+        row("2024-02-01T02:00:00Z", 3),        # 2024-02-01 02:00 UTC
+    ])
+    meta.set(CATALOG_KEY, json.dumps({"NEWS_2024-02": {"rows": 0, "from": "2024-02-01T06:00:00+09:00",
+                                                         "to": "2024-02-01T06:00:00+09:00"}}))
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert archive_news(sh, news, meta, index, keep_days=30, now=now, book=sh) == 3
+    entry = json.loads(meta.get(CATALOG_KEY))["NEWS_2024-02"]
+    assert entry["from"] == "2024-01-31T21:00:00+00:00"   # 예전 목록의 from(+09:00)이 가장 이름
+    assert entry["to"] == "2024-02-01T04:30:00+00:00"
@@ -0,0 +1,65 @@
+# hismedi-app/tests/test_board_crawl.py
+# -*- coding: utf-8 -*-
+"""게시판 고수위: 1페이지 위에 고정된 예전 공지가 있어도 이미 본 URL이 나올 때까지 다음 페이지로 내려가는지 확인합니다."""
+from types import SimpleNamespace
+
+import pytest
+
+from news import scraper
+
+BASE = "https://gov.example/"
+PAGE = BASE + "list?page={page}"
+
+
+def row(uid: str, date: str) -> str:
+    return f"<tr><td>1</td><td><a href='/view?id={uid}'>의료 인력 지원 {uid}</a></td><td>{date}</td></tr>"
+
+
+def page(*rows) -> str:
+    return f"<html><table><tbody>{''.join(rows)}</tbody></table></html>"
+
+
+PAGES = {
+    1: page(row("pinned", "2019.01.02"), row("n1", "2025.10.06"), row("n2", "2025.10.05")),
+    2: page(row("n3", "2025.10.04"), row("n4", "2025.10.03")),
+    3: page(row("n5", "2025.10.02"), row("seen", "2025.10.01")),
+    4: page(row("older", "2025.09.30")),
+}
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    got = []
+
+    def fake_fetch_pages(urls, *a, **kw):
+        got.extend(urls)
+        return [SimpleNamespace(text=PAGES[int(u.rsplit("=", 1)[1])]) for u in urls]
+
+    monkeypatch.setattr(scraper, "_fetch_pages", fake_fetch_pages)
+    monkeypatch.setattr(scraper, "_LIMITER", scraper.FetchLimiter(4, 1))
+    return got
+
+
+def crawl(watermark, counts):
+    spec = {"page_url": PAGE, "link_selector": "td a[href]", "base": BASE}
+    items = scraper.crawl_board(spec, "ua", 5, 0, 0, pages=4, watermark=watermark, name="gov", counts=counts)
+    return [it["title"].rsplit(" ", 1)[1] for it in items]
+
+
+def test_pinned_old_row_does_not_stop_paging(fetched):
+    wm = scraper.Watermark({"urls": [scraper.canonicalize_url(BASE + "view?id=seen")],
+                            "published_at": "2025-10-01T00:00:00+09:00"})
+    counts = scraper._board_counts()
+    assert crawl(wm, counts) == ["n1", "n2", "n3", "n4", "n5"]
+    assert fetched == [PAGE.format(page=p) for p in (1, 2, 3)]
+    assert counts["entries"] == 7
+    assert counts["dropped_watermark"] == 2  # 고정 공지 + 이미 본 글
+
+
+def test_pinned_row_seen_before_is_still_skipped(fetched):
+    # 첫 실행에서 고정 공지를 see()했더라도 날짜가 오래됐으면 멈추지 않습니다.
+    wm = scraper.Watermark({"urls": [scraper.canonicalize_url(BASE + "view?id=" + u) for u in ("pinned", "seen")],
+                            "published_at": "2025-10-01T00:00:00+09:00"})
+    counts = scraper._board_counts()
+    assert crawl(wm, counts) == ["n1", "n2", "n3", "n4", "n5"]
+    assert len(fetched) == 3
@@ -0,0 +1,69 @@
+# hismedi-app/tests/test_dates.py
+# -*- coding: utf-8 -*-
+"""DateNormalizer가 이전 dateutil 경로와 글자 단위로 같은 값을 내는지 확인합니다."""
+import warnings
+
+import pytest
+
+from bench.bench_dates import make_dates, parse_dateutil
+from news.dates import DateNormalizer
+
+CASES = [
+    # RFC 822
+    "Mon, 06 Oct 2025 09:30:00 +0900",
+    "Mon, 06 Oct 2025 09:30:00 -0530",
+    "Mon, 06 Oct 2025 09:30:00 GMT",
+    "06 Oct 2025 09:30 UT",
+    "Mon, 6 Oct 2025 9:30:00 -0000",
+    "Mon, 06 Oct 2025 09:30:00 Z",
+    "Mon, 06 Oct 99 09:30:00 +0000",      # 2자리 연도
+    "Mon, 06 Oct 2025 24:00:00 +0900",    # 범위 밖 시각
+    "Mon, 32 Oct 2025 09:30:00 +0900",    # 범위 밖 날짜
+    # 지역 약어(dateutil은 무시하고 UTC, 원래 값은 폴백으로)
+    "Mon, 06 Oct 2025 09:30:00 EST",
+    "Mon, 06 Oct 2025 09:30:00 KST",
+    "Mon, 06 Oct 2025 09:30:00 PDT",
+    # ISO 8601
+    "2025-10-06T09:30:00+09:00",
+    "2025-10-06T09:30:00-05:30",
+    "2025-10-06T09:30:00Z",
+    "2025-10-06 09:30:00.123+00:00",
+    "2025-10-06T09:30",
+    "2025-10-06",
+    "2025-13-06T09:30:00Z",
+    # tz 없음(naive)
+    "2025-10-06T09:30:00",
+    "October 6, 2025 9:30 AM",
+    "2025.10.06 09:30",
+    # 잘못된 값
+    "not a date",
+    "Mon, 06 Foo 2025 09:30:00 +0900",
+    "   ",
+]
+
+
+@pytest.fixture(autouse=True)
+def _quiet():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # dateutil의 알 수 없는 지역 약어 경고
+        yield
+
+
+@pytest.mark.parametrize("raw", CASES)
+def test_matches_dateutil(raw):
+    norm = DateNormalizer()
+    assert norm.normalize(raw) == parse_dateutil(raw.strip())
+    assert norm.normalize(raw) == parse_dateutil(raw.strip())  # 메모 경로
+
+
+def test_keeps_original_offset():
+    assert DateNormalizer().normalize("Mon, 06 Oct 2025 09:30:00 +0900") == "2025-10-06T09:30:00+09:00"
+    assert DateNormalizer().normalize("2025-10-06T09:30:00Z") == "2025-10-06T09:30:00+00:00"
+
+
+def test_generated_dates_match():
+    dates = make_dates(5000, seed=11)
+    norm = DateNormalizer()
+    assert [norm.normalize(d) for d in dates] == [parse_dateutil(d) for d in dates]
+    stats = norm.stats()
+    assert stats["rfc822"] and stats["iso"] and stats["dateutil"]
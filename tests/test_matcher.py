@@ -0,0 +1,60 @@
+# hismedi-app/tests/test_matcher.py
+# -*- coding: utf-8 -*-
+"""pick_tags(Aho-Corasick)가 이전 부분문자열 스캔과 같은 태그를 내는지 확인합니다."""
+import pytest
+
+from bench.bench_tags import make_titles, pick_tags_scan
+from news.config import KEYWORDS, NEGATIVE_HINTS
+from news.matcher import KeywordMatcher
+from news.scraper import pick_tags
+
+
+def scan_with(keywords: dict, negative_hints):
+    """임의의 키워드 표에 대한 이전 구현."""
+    def scan(text):
+        t = text or ""
+        if any(h in t for h in negative_hints):
+            return []
+        return [tag for tag, kws in keywords.items() if any(k in t for k in kws)]
+    return scan
+
+
+def test_fixture_titles_identical():
+    titles = make_titles(5000)
+    assert [pick_tags(t) for t in titles] == [pick_tags_scan(t) for t in titles]
+
+
+@pytest.mark.parametrize("title", [
+    "",
+    None,
+    "   ",
+    "의료",                         # 키워드 하나만
+    "의료기사 인력난",               # 긴 키워드 안의 짧은 키워드(의료 ⊂ 의료기사, 인력 ⊂ 인력난)
+    "최저임금 인상",                 # 다른 태그의 키워드가 겹침(임금 ⊂ 최저임금)
+    "인건비 지원 확대",               # 공백이 들어간 키워드
+    "고용지원금 고용 지원",
+    "병원 연예 뉴스",                 # 제외 힌트(태그 키워드와 함께)
+    "연예",
+    "스포츠병원",                     # 붙어 있는 제외 힌트 + 키워드
+    "보건의료노동인력",               # 경계 없이 이어진 여러 태그
+    "간호사간호사간호사",
+    "관계없는 제목",
+])
+def test_edge_cases_identical(title):
+    assert pick_tags(title) == pick_tags_scan(title)
+
+
+def test_overlapping_keywords_custom_table():
+    keywords = {"a": ["abc", "bcd"], "b": ["c"], "c": ["abcd"], "d": ["zz"]}
+    negative = ["xab"]
+    matcher = KeywordMatcher(keywords, negative)
+    scan = scan_with(keywords, negative)
+    for text in ["abcd", "xabcd", "bc", "aabcdd", "zzz", "abzz", "xa", "", "cxab", "abcxab"]:
+        assert matcher.tags(text) == scan(text), text
+
+
+def test_negative_hint_anywhere_empties_tags():
+    for hint in NEGATIVE_HINTS:
+        for tag, kws in KEYWORDS.items():
+            assert pick_tags(f"{kws[0]} {hint}") == []
+            assert pick_tags(f"{hint}{kws[-1]}") == []
@@ -0,0 +1,50 @@
+# hismedi-app/tests/test_redirects.py
+# -*- coding: utf-8 -*-
+"""RedirectResolver: 리다이렉트 / data-n-au만 받아들이고, 여러 기사가 같은 원문 URL로 묶이지 않는지 확인합니다."""
+from types import SimpleNamespace
+
+from news.redirects import RedirectResolver
+
+GNEWS = "https://news.google.com/rss/articles/CBMi{}?oc=5"
+NOW = 1_700_000_000
+CONSENT = "<html><a href='https://policies.google.com/privacy'>p</a><a href=\"https://press.example/\">home</a></html>"
+
+
+def response(url, text="", redirected=False):
+    return SimpleNamespace(url=url, text=text, history=[object()] if redirected else [])
+
+
+def resolver(pages: dict, cache=None):
+    return RedirectResolver(lambda u: pages[u], cache=cache, concurrency=2, retry_hours=1)
+
+
+def test_anchor_links_are_not_used():
+    url = GNEWS.format("AAA")
+    r = resolver({url: response(url, CONSENT)})
+    assert r.resolve_all([url], now=NOW) == {}
+    assert r.failed == {url: NOW}
+
+
+def test_redirect_and_data_n_au_are_used():
+    a, b = GNEWS.format("AAA"), GNEWS.format("BBB")
+    r = resolver({
+        a: response("https://press.example/a", redirected=True),
+        b: response(b, '<c-wiz data-n-au="https://press.example/b"></c-wiz>' + CONSENT),
+    })
+    assert r.resolve_all([a, b], now=NOW) == {a: "https://press.example/a", b: "https://press.example/b"}
+
+
+def test_shared_target_keeps_google_url():
+    a, b, c = GNEWS.format("AAA"), GNEWS.format("BBB"), GNEWS.format("CCC")
+    same = response("https://press.example/", redirected=True)
+    r = resolver({a: same, b: same, c: same}, cache={"resolved": {a: "https://press.example/"}})
+    # a는 캐시에서, b/c는 같은 원문 URL이므로 거절
+    assert r.resolve_all([a, b, c], now=NOW) == {a: "https://press.example/"}
+    assert r.stats["rejected"] == 2
+    assert set(r.failed) == {b, c}
+
+
+def test_shared_targets_dropped_from_cache():
+    a, b, c = GNEWS.format("AAA"), GNEWS.format("BBB"), GNEWS.format("CCC")
+    r = resolver({}, cache={"resolved": {a: "https://x.example/", b: "https://x.example/", c: "https://y.example/"}})
+    assert r.resolved == {c: "https://y.example/"}
@@ -0,0 +1,26 @@
+# hismedi-app/tests/test_search.py
+# -*- coding: utf-8 -*-
+"""SearchIndex가 이전 str.contains 필터와 같은 행을 찾는지 확인합니다."""
+import pytest
+
+from bench.bench_search import QUERIES, make_frame, scan
+from news.search import SearchIndex
+
+
+@pytest.fixture(scope="module")
+def frame():
+    return make_frame(3000)
+
+
+@pytest.mark.parametrize("q", QUERIES + ["전공의", "Hospital", "\x00", "1호", "호 ", "", "  "])
+def test_matches_scan(frame, q):
+    index = SearchIndex().sync(frame)
+    expect = scan(frame, q.strip().lower()) if q.strip() else list(range(len(frame)))
+    assert index.search(q) == expect
+
+
+def test_repeated_bigram_query_is_verified():
+    index = SearchIndex()
+    index.add([("아아", "", ""), ("아아아", "", "")])
+    assert index.search("아아아") == [1]
+    assert index.search("아아") == [0, 1]
@@ -0,0 +1,34 @@
+# hismedi-app/tests/test_simhash.py
+# -*- coding: utf-8 -*-
+"""simhash64_batch가 simhash64와 비트 단위로 같은 값을 내는지 확인합니다."""
+from bench.bench_tags import make_titles
+from news.scraper import simhash64, simhash64_batch, tokenize
+
+
+def test_fixture_titles_identical():
+    titles = make_titles(3000)
+    assert simhash64_batch(titles) == [simhash64(t) for t in titles]
+
+
+def test_edge_cases_identical():
+    cap = " ".join(f"토큰{i}" for i in range(200))
+    titles = [
+        "",
+        None,
+        "a b c !!",                        # 토큰 없음(2자 미만 / 기호만)
+        "의료",                            # 토큰 하나
+        "의료 인력",                        # 토큰 둘: 비트마다 동점(합 0)이 흔함
+        "의료 의료 의료 인력",                # 같은 토큰 반복
+        "의료 " * 500,                     # 같은 토큰만 상한 넘게
+        cap,                              # 정확히 상한(200개)
+        cap + " 넘친토큰 하나더",             # 상한 초과분은 버려짐
+        "Hospital 병원 2025 AI-의료",
+    ]
+    assert len(tokenize(cap)) == 200 and tokenize(cap + " 넘친토큰") == tokenize(cap)
+    assert simhash64_batch(titles) == [simhash64(t) for t in titles]
+
+
+def test_batch_order_and_empty_input():
+    titles = make_titles(50)
+    assert simhash64_batch(reversed(titles)) == [simhash64(t) for t in reversed(titles)]
+    assert simhash64_batch([]) == []
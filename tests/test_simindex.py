@@ -0,0 +1,48 @@
+# hismedi-app/tests/test_simindex.py
+# -*- coding: utf-8 -*-
+"""SimHashIndex(밴드 인덱스)가 선형 스캔과 같은 근접중복 결과를 내는지 확인합니다."""
+import random
+
+import pytest
+
+from news.simindex import SimHashIndex
+
+
+def linear_first(items, sim: int, max_hamming: int) -> str:
+    """이전 find_near_duplicate: 삽입 순서대로 훑어 첫 일치의 url."""
+    for s, url in items:
+        if (s ^ sim).bit_count() <= max_hamming:
+            return url
+    return ""
+
+
+def _flip(sim: int, bits, rnd: random.Random) -> int:
+    for b in rnd.sample(range(64), bits):
+        sim ^= 1 << b
+    return sim
+
+
+@pytest.mark.parametrize("max_hamming", [0, 3, 6, 8])
+def test_query_matches_linear_scan(max_hamming):
+    rnd = random.Random(max_hamming)
+    base = [rnd.getrandbits(64) for _ in range(300)]
+    items = []
+    index = SimHashIndex(max_hamming)
+    for i, sim in enumerate(base):
+        # 앞선 해시와 가까운 변형을 섞어 같은 질의에 여러 후보가 걸리게 합니다.
+        if i and rnd.random() < 0.4:
+            sim = _flip(rnd.choice(base[:i]), rnd.randint(0, max_hamming + 2), rnd)
+        url = f"https://example.com/{i}"
+        items.append((sim, url))
+        index.insert(sim, url)
+
+    queries = [_flip(rnd.choice(base), rnd.randint(0, max_hamming + 3), rnd) for _ in range(500)]
+    queries += [rnd.getrandbits(64) for _ in range(100)]
+    for q in queries:
+        for k in range(max_hamming + 1):
+            assert index.query(q, k) == linear_first(items, q, k)
+
+
+def test_query_rejects_radius_above_guarantee():
+    with pytest.raises(ValueError):
+        SimHashIndex(3).query(0, 4)
@@ -0,0 +1,40 @@
+# hismedi-app/tests/test_sources.py
+# -*- coding: utf-8 -*-
+"""SheetSources: SOURCES 탭을 프로세스마다 한 번만 읽고, 탭이 없다는 결과를 기억하는지 확인합니다."""
+import pytest
+
+from bench.fake_sheets import FakeSpreadsheet
+from news.sources import SOURCES_STATE_FILE, SheetSources, load_registry
+from news.state import load_json
+
+NOW = 1_700_000_000
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("NEWS_STATE_DIR", str(tmp_path))
+
+
+def test_records_read_once():
+    sh = FakeSpreadsheet()
+    sh.add_worksheet("SOURCES").append_rows([["name", "kind", "url", "options", "enabled"],
+                                              ["extra", "rss", "https://feed.example/rss", "", "TRUE"]])
+    src = SheetSources(sh)
+    assert [r["name"] for r in src.records()] == ["extra"]
+    src.records()
+    assert sh.calls["worksheet"] == 1 and sh.calls["get_all_records"] == 1
+    assert load_registry(sources=[], records=src.records())[0].url == "https://feed.example/rss"
+
+
+def test_missing_tab_is_remembered():
+    sh = FakeSpreadsheet()
+    assert SheetSources(sh, recheck_sec=600).refresh(now=NOW) == []
+    assert load_json(SOURCES_STATE_FILE) == {"SOURCES": NOW}
+    # 다른 프로세스(새 인스턴스)도 recheck_sec 동안은 탭을 찾지 않습니다.
+    assert SheetSources(sh, recheck_sec=600).refresh(now=NOW + 599) == []
+    assert sh.calls["worksheet"] == 1
+
+    sh.add_worksheet("SOURCES").append_rows([["name", "kind", "url"], ["extra", "rss", "https://feed.example/rss"]])
+    assert len(SheetSources(sh, recheck_sec=600).refresh(now=NOW + 600)) == 1
+    assert sh.calls["worksheet"] == 2
+    assert load_json(SOURCES_STATE_FILE) == {}